@@ -1,20 +1,16 @@
 import type { Metadata } from 'next'
 import Link from 'next/link'
 import Script from 'next/script'
-import { 
-  Calculator, 
-  Users, 
-  Target, 
-  Heart, 
-  TrendingUp, 
-  Shield, 
+import {
+  Calculator,
+  TrendingUp,
+  Shield,
   Clock,
   MessageCircle,
   ArrowRight,
   CheckCircle,
   Lightbulb,
   DollarSign,
-  FileText,
   BarChart,
   AlertCircle,
   BookOpen
@@ -0,0 +1,10 @@
+import { NextResponse } from 'next/server'
+import { responseCache } from '@/lib/responseCache'
+
+// Counters change on every chat message, so never serve this from the build
+export const dynamic = 'force-dynamic'
+
+// GET endpoint for this server instance's response cache counters and hit rate
+export async function GET() {
+  return NextResponse.json(responseCache.stats())
+}
@@ -2,8 +2,25 @@ import { NextRequest, NextResponse } from 'next/server'
 import { auth, currentUser } from '@clerk/nextjs/server'
 // import { supabaseAdmin } from '@/lib/supabase'
 
-// Grok API call function
-async function callGrokAPI(message: string, history: any[], model: string, attachments?: any[]): Promise<{ response: string, modelUsed: string }> {
+// Reads an OpenAI-style streamed chat completion, passing each content delta to onToken; returns the whole text
+async function readCompletionStream(body: ReadableStream<Uint8Array>, onToken: (text: string) => void): Promise<string> {
+  let text = ''
+  await readEvents(body, (event, data) => {
+    if (data === '[DONE]') return
+    const delta = JSON.parse(data).choices?.[0]?.delta?.content
+    if (delta) {
+      text += delta
+      onToken(delta)
+    }
+  })
+  if (!text) {
+    throw new Error('Invalid response format from Grok API')
+  }
+  return text
+}
+
+// Grok API call function; with onToken the completion is streamed and each piece passed on as it arrives
+async function callGrokAPI(message: string, history: any[], model: string, attachments?: any[], onToken?: (text: string) => void): Promise<{ response: string, modelUsed: string }> {
   try {
     const grokApiKey = process.env.GROK_API_KEY
     const grokApiUrl = process.env.GROK_API_URL
@@ -83,7 +100,7 @@ AREAS OF EXPERTISE:
         messages: messages,
         max_tokens: 1500,
         temperature: 0.7,
-        stream: false
+        stream: !!onToken
       })
     })
 
@@ -93,6 +110,13 @@ AREAS OF EXPERTISE:
       throw new Error(`Grok API request failed: ${response.status}`)
     }
 
+    if (onToken && response.body) {
+      return {
+        response: await readCompletionStream(response.body, onToken),
+        modelUsed: model
+      }
+    }
+
     const data = await response.json()
     
     if (!data.choices || !data.choices[0] || !data.choices[0].message) {
@@ -140,8 +164,18 @@ Service Status: Using fallback response due to temporary AI service disruption.`
   }
 }
 
-import { getDb, ipUsage, NewIpUsage, users, NewUser } from '@/lib/db'
-import { eq } from 'drizzle-orm'
+import { getDb, ipUsage, NewIpUsage, users } from '@/lib/db'
+import { eq, sql } from 'drizzle-orm'
+import { renderIntent, routeIntent } from '@/lib/intentRouter'
+import { Passage, searchPassages } from '@/lib/passageIndex'
+import { encodeEvent, readEvents } from '@/lib/sse'
+import { loadTestEmail, loadTestUserId } from '@/lib/loadTest'
+import { CacheOutcome, responseCache } from '@/lib/responseCache'
+
+// The user a load-test request names (see lib/loadTest.ts), otherwise the signed-in Clerk user
+function requestUserId(request: NextRequest): string | null {
+  return loadTestUserId(request) || auth().userId
+}
 
 // Get client IP address (fallback for unauthenticated users)
 function getClientIP(request: NextRequest): string {
@@ -192,109 +226,91 @@ function getClientIP(request: NextRequest): string {
 // Temporary in-memory fallback for IP tracking
 const ipUsageMap = new Map<string, { count: number, resetTime: Date }>()
 
-// Check and update usage for a user ID
-async function checkAndUpdateUsage(userId: string, limit: number = 5): Promise<{ allowed: boolean, remaining: number, resetTime: Date }> {
-  const now = new Date()
+// Usage is counted per calendar month in UTC, whatever the database session's time zone, so the
+// reset lands at the resetTime monthStart() reports. usage_period is the month query_count belongs
+// to and only these statements write it, so other routes updating the row cannot postpone the
+// reset; a row from an earlier month, or never counted, starts over at 1. Kept in step with
+// benchmarks/bench_usage.py.
+const PERIOD = `date_trunc('month', now() AT TIME ZONE 'UTC')::date`
+const NEW_MONTH = `(users.usage_period IS NULL OR users.usage_period < ${PERIOD})`
+const COUNTED = `CASE WHEN ${NEW_MONTH} THEN 1 ELSE users.query_count + 1 END`
+const HAS_ROOM = `(users.query_count < users.query_limit OR ${NEW_MONTH})`
+
+interface UsageRow {
+  allowed: boolean
+  query_count: number
+  query_limit: number
+  tier: string
+}
+
+function monthStart(date: Date, months: number = 0): Date {
+  return new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + months, 1))
+}
+
+// Check and update usage for a user ID. The check, the monthly reset and the increment are one
+// statement, so it is a single round trip, and Postgres re-checks the limit on the locked row, so
+// concurrent tabs can neither lose an increment nor go over the limit. A user's first message also
+// needs their email from Clerk (unless `email` is given), then inserts the row (or counts on the one a
+// concurrent request made).
+async function checkAndUpdateUsage(userId: string, limit: number = 5, email?: string): Promise<{ allowed: boolean, remaining: number, resetTime: Date, tier: string }> {
+  const resetTime = monthStart(new Date(), 1)
   console.log(`checkAndUpdateUsage called for userId: ${userId}, limit: ${limit}`)
-  
+
   try {
-    console.log(`checkAndUpdateUsage: Getting database connection`)
     const db = getDb()
-    
-    // Check if user exists in database
-    console.log(`checkAndUpdateUsage: Querying for user with clerkId: ${userId}`)
-    const existingUser = await db.query.users.findFirst({
-      where: eq(users.clerkId, userId),
-    })
-    
-    console.log('Existing user found:', existingUser ? {
-      userId: existingUser.clerkId,
-      count: existingUser.queryCount,
-      limit: existingUser.queryLimit,
-      createdAt: existingUser.createdAt,
-      tier: existingUser.tier,
-      email: existingUser.email
-    } : 'none')
-    
-    if (!existingUser) {
+    const counted = await db.execute(sql`
+      WITH counted AS (
+        UPDATE users SET query_count = ${sql.raw(COUNTED)}, usage_period = ${sql.raw(PERIOD)}, updated_at = LOCALTIMESTAMP
+        WHERE users.clerk_id = ${userId} AND ${sql.raw(HAS_ROOM)}
+        RETURNING query_count, query_limit, tier
+      )
+      SELECT true AS allowed, query_count, query_limit, tier FROM counted
+      UNION ALL
+      SELECT false, query_count, query_limit, tier FROM users
+      WHERE clerk_id = ${userId} AND NOT EXISTS (SELECT 1 FROM counted)
+    `)
+    let row = counted.rows[0] as UsageRow | undefined
+
+    if (!row) {
       console.log('User not found in database, creating new user')
-      
+
       // Get the current user from Clerk to get email
-      const clerkUser = await currentUser()
-      const userEmail = clerkUser?.emailAddresses?.[0]?.emailAddress || 'user@example.com'
-      
-      // Create new user with default free tier settings
-      const newUser: NewUser = {
-        clerkId: userId,
-        email: userEmail,
-        tier: 'free',
-        queryCount: 0,
-        queryLimit: 5,
-        subscriptionStatus: 'active',
-      }
-      
-      try {
-        await db.insert(users).values(newUser)
-        console.log('Successfully created new user:', { clerkId: userId, email: userEmail })
-        
-        // Now increment the count for the current message
-        await db.update(users)
-          .set({ queryCount: 1, updatedAt: now })
-          .where(eq(users.clerkId, userId))
-        
-        return { allowed: true, remaining: 4, resetTime: now }
-      } catch (error) {
-        console.error('Error creating new user:', error)
-        return { allowed: false, remaining: 0, resetTime: now }
+      const clerkUser = email ? null : await currentUser()
+      const userEmail = email || clerkUser?.emailAddresses?.[0]?.emailAddress || 'user@example.com'
+
+      // New users start on the free tier with this message counted
+      const created = await db.execute(sql`
+        INSERT INTO users (clerk_id, email, tier, query_count, query_limit, usage_period, subscription_status)
+        VALUES (${userId}, ${userEmail}, 'free', 1, 5, ${sql.raw(PERIOD)}, 'active')
+        ON CONFLICT (clerk_id) DO UPDATE SET query_count = ${sql.raw(COUNTED)}, usage_period = ${sql.raw(PERIOD)},
+          updated_at = LOCALTIMESTAMP
+        WHERE ${sql.raw(HAS_ROOM)}
+        RETURNING true AS allowed, query_count, query_limit, tier
+      `)
+      row = created.rows[0] as UsageRow | undefined
+      if (!row) {
+        // A concurrent request created the user and used up the limit
+        return { allowed: false, remaining: 0, resetTime, tier: 'free' }
       }
     }
-    
-    // Check if user has exceeded limit
-    if (existingUser.queryCount >= existingUser.queryLimit) {
-      return { allowed: false, remaining: 0, resetTime: existingUser.createdAt }
-    }
-    
-    // Special case: If user was created today and has queryCount >= 5, 
-    // they might have been affected by the bug. Reset their count.
-    const today = new Date().toDateString()
-    const userCreatedToday = existingUser.createdAt.toDateString() === today
-    if (userCreatedToday && existingUser.queryCount >= 5) {
-      console.log('Resetting query count for user created today with bug:', userId)
-      await db.update(users)
-        .set({ queryCount: 0, updatedAt: now })
-        .where(eq(users.clerkId, userId))
-      // Continue with the normal flow to increment count
-    }
-    
-    // Get current count (might have been reset above)
-    let currentCount = existingUser.queryCount
-    if (userCreatedToday && existingUser.queryCount >= 5) {
-      currentCount = 0 // Use reset count
-    }
-    
-    // Increment usage count
-    const newCount = currentCount + 1
-    await db.update(users)
-      .set({ 
-        queryCount: newCount,
-        updatedAt: now
-      })
-      .where(eq(users.clerkId, userId))
-    
-    return { 
-      allowed: true, 
-      remaining: existingUser.queryLimit - newCount, 
-      resetTime: existingUser.createdAt 
+
+    console.log('Usage counted:', { userId, allowed: row.allowed, count: row.query_count, limit: row.query_limit, tier: row.tier })
+    return {
+      allowed: row.allowed,
+      remaining: row.allowed ? Math.max(0, row.query_limit - row.query_count) : 0,
+      resetTime,
+      tier: row.tier
     }
   } catch (error) {
     console.error('Database error in checkAndUpdateUsage:', error)
-    return { allowed: false, remaining: 0, resetTime: now }
+    return { allowed: false, remaining: 0, resetTime, tier: 'free' }
   }
 }
 
 // Get usage info for a user ID
 async function getUsageInfo(userId: string, limit: number = 5): Promise<{ count: number, remaining: number, resetTime: Date }> {
   const now = new Date()
+  const resetTime = monthStart(now, 1)
   
   try {
     const db = getDb()
@@ -303,13 +319,16 @@ async function getUsageInfo(userId: string, limit: number = 5): Promise<{ count:
     })
     
     if (!existingUser) {
-      return { count: 0, remaining: 5, resetTime: now }
+      return { count: 0, remaining: 5, resetTime }
     }
     
+    // Counted in an earlier month, or never: the next message starts over
+    const period = existingUser.usagePeriod
+    const count = !period || period < monthStart(now) ? 0 : existingUser.queryCount
     return { 
-      count: existingUser.queryCount, 
-      remaining: Math.max(0, existingUser.queryLimit - existingUser.queryCount), 
-      resetTime: existingUser.createdAt 
+      count, 
+      remaining: Math.max(0, existingUser.queryLimit - count), 
+      resetTime 
     }
   } catch (error) {
     console.error('Database error in getUsageInfo:', error)
@@ -459,8 +478,27 @@ AREAS OF EXPERTISE:
 4. Always balance professional expertise with accessibility.
 5. Remember: your users are business owners, not accountants - help them succeed!`
 
+// Grok's answer, or the cached answer to the same or a near-identical question from the same tier and
+// model. Only opening questions are cached: follow-ups depend on the conversation and attachments on
+// their content. Fallback answers from a failed call are never stored.
+async function cachedGrokAPI(message: string, history: any[], model: string, attachments?: any[], userTier: string = 'free', onToken?: (text: string) => void): Promise<{ response: string, modelUsed: string, cache?: CacheOutcome }> {
+  if (history.length > 0 || (attachments && attachments.length > 0)) {
+    return await callGrokAPI(message, history, model, attachments, onToken)
+  }
+  const partition = `${userTier}:${model}`
+  const cached = responseCache.get(message, partition)
+  if (cached) {
+    return { ...cached.value, cache: cached.outcome }
+  }
+  const result = await callGrokAPI(message, history, model, attachments, onToken)
+  if (result.modelUsed !== 'fallback-ai') {
+    responseCache.set(message, partition, result)
+  }
+  return { ...result, cache: 'miss' }
+}
+
 // Call actual Grok API for premium tiers, mock responses for free tier
-async function getAIResponse(message: string, history: any[], model: string = 'standard-ai', attachments?: any[], userTier: string = 'free'): Promise<{ response: string, modelUsed: string }> {
+async function getAIResponse(message: string, history: any[], model: string = 'standard-ai', attachments?: any[], userTier: string = 'free', onToken?: (text: string) => void): Promise<{ response: string, modelUsed: string, cache?: CacheOutcome }> {
   // First, validate the topic
   const topicValidation = isTopicValid(message)
   
@@ -562,13 +600,13 @@ Would you like to upgrade your subscription?`,
   // Call Grok API for all tiers (including free)
   if ((model === 'advanced-ai' && (userTier === 'basic' || userTier === 'elite')) || 
       (model === 'premium-ai' && userTier === 'elite')) {
-    return await callGrokAPI(message, history, model, attachments)
+    return await cachedGrokAPI(message, history, model, attachments, userTier, onToken)
   }
   
   // Free tier: Use Grok API with standard model for faster responses
   if (userTier === 'free' && model === 'standard-ai') {
     try {
-      return await callGrokAPI(message, history, 'standard-ai', attachments)
+      return await cachedGrokAPI(message, history, 'standard-ai', attachments, userTier, onToken)
     } catch (error) {
       console.log('Grok API failed for free user, falling back to mock response:', error)
       // Fall through to mock response
@@ -579,99 +617,40 @@ Would you like to upgrade your subscription?`,
   return await getFreeResponse(message, history, attachments)
 }
 
+// Weakest bm25 score still worth answering from; below it the canned answers are a better fit
+const MIN_PASSAGE_SCORE = 5
+const PASSAGE_EXCERPT_CHARS = 400
+
+function passageResponse(passages: Passage[]): string {
+  const siteUrl = process.env.NEXT_PUBLIC_SITE_URL || 'https://myaibookkeeper.com'
+  const sections = passages.map((passage) => {
+    let excerpt = passage.body
+    if (excerpt.length > PASSAGE_EXCERPT_CHARS) {
+      const cut = excerpt.lastIndexOf(' ', PASSAGE_EXCERPT_CHARS)
+      excerpt = excerpt.slice(0, cut > 0 ? cut : PASSAGE_EXCERPT_CHARS) + '...'
+    }
+    return `${passage.heading}\n${excerpt}\nRead more: ${siteUrl}/blog/${passage.slug}`
+  })
+
+  return `Here's what our guides say about that:
+
+${sections.join('\n\n')}
+
+Want advice for your exact situation? Ask a follow-up question with a few details about your business!`
+}
+
 // Mock AI response function for free tier users
 async function getFreeResponse(message: string, history: any[], attachments?: any[]): Promise<{ response: string, modelUsed: string }> {
   // Simulate API delay (reduced for better UX)
   await new Promise(resolve => setTimeout(resolve, 300 + Math.random() * 500))
   
   // Analyze the user's message and attachments to provide relevant bookkeeping guidance
-  const lowerMessage = message.toLowerCase()
   const hasAttachments = attachments && attachments.length > 0
   
+  // Canned answer for the message, from the compiled intent catalog (see lib/intentRouter.ts)
+  const intent = routeIntent(message)
   let response = ''
-  
-  // Handle greetings
-  if (/^(hi|hello|hey|good morning|good afternoon|good evening)[\s!.,?]*$/i.test(message.trim())) {
-    response = `Hello! Welcome to My AI Bookkeeper
 
-I'm your friendly AI bookkeeping assistant! Think of me as your personal finance expert who speaks in plain English, not confusing accounting jargon.
-
-I can help you with:
-• Tracking your money - Know where every dollar goes (expense tracking)
-• Keeping more of what you earn - Find tax breaks you might be missing
-• Understanding your numbers - Make sense of reports and financial data
-• Cash flow - Make sure you have money when bills are due
-• Paperwork made simple - Organize receipts and invoices
-• Software help - QuickBooks, Xero, or whatever you use
-• Business setup - LLC, S-Corp, or stay simple? I'll explain the difference
-• Paying employees - Do it right and stay compliant
-
-How can I help your business today?
-
-I'm here to:
-• Answer questions in simple terms (no confusing accountant-speak!)
-• Look at your receipts or documents and explain what they mean
-• Help you save money on taxes
-• Show you the best practices that actually work for small businesses
-
-What's your biggest money question right now?`
-  }
-  
-  // Handle service questions
-  else if (lowerMessage.includes('what can you help') || lowerMessage.includes('what do you do')) {
-    response = `I'm Your Expert Bookkeeping Assistant
-
-I specialize exclusively in accounting, bookkeeping, and financial management for small businesses. Here's how I can help:
-
-My Areas of Expertise:
-
-Bookkeeping & Accounting
-• Expense categorization
-• Double-entry bookkeeping
-• Chart of accounts setup
-• Journal entries
-• Bank reconciliation
-
-Tax Assistance
-• Identifying deductions
-• Quarterly tax planning
-• 1099 vs W-2 guidance
-• Business vs personal expenses
-• Tax document preparation
-
-Financial Analysis
-• Understanding P&L statements
-• Balance sheet analysis
-• Cash flow forecasting
-• Financial ratios
-• Profit margin calculations
-
-Business Finance
-• LLC vs S-Corp decisions
-• Business structure advice
-• Contractor vs employee classification
-• Business banking setup
-• Credit and loan guidance
-
-Software Support
-• QuickBooks assistance
-• Excel/spreadsheet formulas
-• Xero, FreshBooks, Wave help
-• Integration guidance
-• Report generation
-
-Compliance & Documentation
-• Record keeping requirements
-• Audit preparation
-• Financial documentation
-• Retention policies
-• Regulatory compliance
-
-Note: I focus solely on financial topics. For non-financial questions, please consult appropriate specialists.
-
-What specific bookkeeping or financial question can I help you with?`
-  }
-  
   // Handle document/image analysis
   if (hasAttachments) {
     const imageCount = attachments.filter(att => att.type.startsWith('image/')).length
@@ -701,243 +680,18 @@ Please let me know what specific information you'd like me to extract or analyze
 • "Is this document properly formatted for tax purposes?"
 • "What category should I put this expense in?"`
   }
-  
-  // Basic bookkeeping topics
-  else if (lowerMessage.includes('expense') || lowerMessage.includes('cost') || lowerMessage.includes('spend')) {
-    response = `Let's Make Expense Tracking Simple!
-
-Think of tracking expenses like keeping a detailed diary of where your business money goes. Here's how to do it without the headache:
-
-1. The Golden Rule: Keep Business and Personal Separate
-Just like you wouldn't mix your personal grocery receipts with business ones, always keep these completely separate. It'll save you huge headaches come tax time!
-
-2. Create Simple Categories (Don't Overthink It!)
-Start with these basic buckets:
-- Office Stuff - Supplies, rent, utilities
-- Getting Around - Gas, parking, travel costs  
-- Business Meals - Client dinners, team lunches (50% tax deductible!)
-- Tech & Tools - Software, equipment, apps
-- Learning & Growing - Training, books, conferences
-- Insurance & Protection - Business insurance, legal fees
-
-3. The "Shoebox Method" vs. Going Digital
-- Old School: Keep all receipts in a shoebox (but please organize monthly!)
-- Smart Way: Use your phone to snap photos or apps like QuickBooks/Expensify
-- Either works - just pick one and stick with it!
-
-4. The Tax Question Everyone Asks
-Simple rule: If you bought it FOR your business, it's probably deductible. If you bought it for personal use, it's not. When in doubt, ask yourself: "Did I buy this to make money in my business?"
-
-Real Talk: Most small business owners overthink this. Start simple, stay consistent, and upgrade your system as you grow.
-
-What specific expense question do you have? I can explain it in plain English - no accounting degree required!`
-  }
-  
-  // Tax-related questions
-  else if (lowerMessage.includes('tax') || lowerMessage.includes('deduct') || lowerMessage.includes('irs')) {
-    response = `Let's Talk Taxes - In Plain English!
-
-Taxes don't have to be scary! Think of deductions as "business expenses that save you money." Here are the big ones:
-
-1. Your Home Office (If You Work From Home)
-Simple question: Do you have a room or area used ONLY for business? If yes, you can deduct it!
-• Easy way: $5 per square foot (up to 300 sq ft = $1,500 max)
-• Detailed way: Figure out what percentage of your home is for business, then deduct that percentage of your home costs
-• Real talk: Most people use the easy way - it's simpler and usually just as good!
-
-2. Your Car for Business
-Every mile you drive for business can save you money on taxes!
-• 2024 rate: 65.5¢ per business mile (this rate goes up most years)
-• What counts: Driving to meet clients, going to the bank for business, picking up supplies
-• What doesn't count: Your regular commute to a main office
-• Keep track: Use a simple mileage app or even a notebook in your car
-
-3. The Stuff You Buy for Business
-• Under $2,500: Just deduct the full amount this year (called "de minimis safe harbor" - fancy term for "small stuff rule")
-• Over $2,500: You might need to spread it out over several years (called "depreciation" - like paying for it bit by bit on your taxes)
-• Examples: Computers, software, desks, cameras, tools
-
-4. Getting Help From Pros
-• Your accountant's fees (yes, paying someone to do your taxes is tax-deductible!)
-• Lawyer fees for business stuff
-• Business coaches or consultants
-• Professional memberships that help your business
-
-5. Telling People About Your Business
-• Website costs
-• Business cards and flyers  
-• Facebook/Google ads
-• Networking event costs
-
-6. Business Travel & Meals
-• Travel: 100% deductible if it's truly for business
-• Meals: 50% deductible (the IRS figures you'd eat anyway, so they only give you half)
-• Client entertainment: Also 50% deductible
-
-The Golden Rules:
-1. Keep receipts - Your phone camera works great for this!
-2. Business only - Don't try to deduct personal stuff (the IRS will notice)
-3. When in doubt, ask - Better safe than sorry
-4. Different business types have different rules - LLC vs Corporation vs Sole Proprietor all work a bit differently
-
-Pro Tip: Take a photo of any business receipt and I can help you figure out if it's deductible and how to categorize it!
-
-What specific tax question is keeping you up at night? Let's make it simple!`
-  }
-  
-  // Cash flow questions
-  else if (lowerMessage.includes('cash flow') || lowerMessage.includes('money') || lowerMessage.includes('revenue')) {
-    response = `Let's Fix Your Money Flow - Think of It Like Water!
-
-Cash flow is just a fancy way of saying "making sure you have money when you need it." Think of your business like a bathtub:
-• Water flowing IN = money from customers
-• Water flowing OUT = money for bills and expenses
-• You want more coming in than going out!
-
-The Three "Buckets" of Money Movement:
-1. Day-to-Day Stuff (Operating) - Paying for supplies, rent, your salary
-2. Big Purchases (Investing) - Buying equipment, a new computer, office space
-3. Getting Money to Start/Grow (Financing) - Loans, investor money, money you put in yourself
-
-How to Get Money Coming In FASTER:
-
-1. Send Bills Right Away
-Don't wait! The day you finish work for a client, send that invoice. Every day you wait is money sitting on the table.
-
-2. Make It Easy for People to Pay You
-• Accept credit cards (yes, even if there's a fee - you'll get paid faster)
-• Try Venmo, PayPal, Zelle for small amounts
-• Offer a small discount for paying early (like "2% off if paid in 10 days")
-
-3. Follow Up on Late Payments
-Don't feel bad about this! You did the work, you deserve to get paid. A friendly "Hey, just checking on this invoice" email works wonders.
-
-How to Keep Money In Your Pocket LONGER:
-
-1. Ask Suppliers for Better Payment Terms
-Instead of paying immediately, ask if you can pay in 30 days. Free money for a month!
-
-2. Use Credit Cards Smartly
-Pay business expenses on a credit card, then pay it off when the bill comes. That's 30 days of keeping your cash in the bank earning interest.
 
-3. Don't Pay Bills Early
-If it's due on the 15th, pay it on the 15th (not the 1st). Keep that money working for you until you actually need to spend it.
-
-Warning Signs Your Cash Flow Needs Help:
-• You're paying bills late (not by choice)
-• Your credit cards are maxed out
-• You're stressed about having enough money next month
-• Your bank balance keeps going down
-
-Simple Tools to Track This:
-• Spreadsheet: Just track what's coming in and going out each month
-• Apps: QuickBooks, Xero, or even a simple banking app
-• The Eyeball Test: Check your bank balance weekly - is it going up or down?
-
-Emergency Fund Rule:
-Try to save up 3-6 months of business expenses. Think of it as your "sleep better at night" fund.
-
-Real Talk: Most small business owners wing this and stress about money constantly. Even a simple spreadsheet tracking your monthly ins and outs will put you ahead of 80% of businesses.
-
-Show me your numbers - upload a bank statement or tell me about your situation, and I'll help you create a simple plan that actually works!`
+  // Greetings and questions about the assistant itself
+  else if (!intent.fallback) {
+    response = renderIntent(intent, { message })
   }
-  
-  // General bookkeeping setup
-  else if (lowerMessage.includes('setup') || lowerMessage.includes('start') || lowerMessage.includes('begin')) {
-    response = `Starting Your Business Bookkeeping - No MBA Required!
-
-Let's get your money tracking set up right from the start. Think of this like organizing your personal finances, but with a few extra steps for tax purposes.
-
-Step 1: Pick Your Business Type (This Affects Your Taxes)
-Confused by the options? Here's the simple breakdown:
-
-• Just You, Simple Business (Sole Proprietorship): Easiest to start, but if someone sues you, they can come after your personal stuff
-• You Want Protection (LLC): Costs a bit more to set up, but keeps your business and personal assets separate. Most small businesses choose this
-• You're Thinking Big (Corporation): More paperwork, but potential tax benefits. Usually for businesses planning to have employees or investors
-• You Have a Partner (Partnership): Like sole proprietorship but with shared ownership and headaches
-
-Step 2: Get Your Official Paperwork
-• EIN Number: Think of this like a Social Security number for your business (get it free from IRS.gov - don't pay a service!)
-• Business License: Whatever your city/state requires
-• Business Bank Account: CRUCIAL - never mix business and personal money
-• Business Credit Card: Optional but makes tracking expenses super easy
-
-Step 3: Pick How You Count Money
-• Cash Method: Count money when it actually moves (you get paid = income, you pay a bill = expense). Simpler for most small businesses
-• Accrual Method: Count money when you earn it or owe it, even if no cash moved yet. More accurate but complicated. Required if you make over $25M (if that's you, hire an accountant!)
-
-Step 4: Choose Your Tools (Start Simple!)
-
-FREE and Good Enough:
-• Google Sheets or Excel: Honestly, a simple spreadsheet works for many small businesses
-• Wave: Free accounting software that's actually pretty good
-• Your Bank's Tools: Many business accounts have basic tracking
-
-PAID But Worth It:
-• QuickBooks Online: $30-80/month - most popular, connects to everything
-• Xero: $13-70/month - clean, simple, great for service businesses  
-• FreshBooks: $15-55/month - awesome for freelancers and consultants
-
-My Advice: Start with a spreadsheet or Wave. You can always upgrade later!
-
-Step 5: Set Up Your Money Categories
-Think of these like folders for your money:
 
-• What You Own (Assets): Bank accounts, equipment, money people owe you
-• What You Owe (Liabilities): Credit cards, loans, bills you haven't paid yet
-• Your Ownership (Equity): Money you put into the business, profits you kept
-• Money Coming In (Revenue): Sales, service fees, any income
-• Money Going Out (Expenses): Everything you spend for the business
-
-Step 6: Create Simple Habits
-• Weekly: Snap photos of receipts, update your tracking
-• Monthly: Reconcile your bank account (make sure your records match the bank)
-• Quarterly: Review how you're doing, prepare for tax payments
-• Yearly: Get ready for tax time (or hire someone to do it)
-
-Step 7: Know When to Get Help
-• CPA for Taxes: Usually worth it unless your business is super simple
-• Bookkeeper: If you'd rather focus on your business than counting pennies
-• Financial Advisor: When you're making good money and want to plan for the future
-
-Start Here TODAY: Open a business bank account and start taking photos of all business receipts. That's 80% of good bookkeeping right there!
-
-What type of business are you starting? Tell me and I'll give you specific advice for your situation!`
-  }
-  
-  // Default response for other questions
+  // Best matching blog passages; the fallback intents only answer what no article covers
   else {
-    response = `Bookkeeping Assistant Response:
-
-I understand you're asking about: "${message}"
-
-Here's some general bookkeeping guidance:
-
-Key Principles:
-1. Separate Business & Personal: Always keep business and personal finances separate
-2. Keep Good Records: Save receipts, invoices, and bank statements
-3. Be Consistent: Use the same system and categories regularly
-4. Review Regularly: Check your books monthly or quarterly
-5. Plan Ahead: Create budgets and cash flow projections
-
-Common Bookkeeping Tasks:
-- Recording income and expenses
-- Reconciling bank statements
-- Creating financial reports
-- Managing accounts receivable/payable
-- Preparing for tax time
-
-Tools You Might Need:
-- Accounting software (QuickBooks, Xero, etc.)
-- Receipt scanner app
-- Business bank account
-- Filing system (digital or physical)
-
-Pro Tip: You can upload photos of receipts, invoices, or documents, and I'll help you analyze and categorize them!
-
-Could you provide more specific details about your question? I can give you more targeted advice for your situation!`
+    const passages = (await searchPassages(message)).filter((passage) => passage.score >= MIN_PASSAGE_SCORE)
+    response = passages.length > 0 ? passageResponse(passages) : renderIntent(intent, { message })
   }
-  
+
   return {
     response,
     modelUsed: 'standard-ai'
@@ -947,7 +701,7 @@ Could you provide more specific details about your question? I can give you more
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json()
-    const { message, history, attachments, aiModel } = body
+    const { message, history, attachments, aiModel, stream } = body
 
     if (!message || typeof message !== 'string') {
       return NextResponse.json(
@@ -965,10 +719,10 @@ export async function POST(request: NextRequest) {
     }
 
     // Get authentication info
-    const { userId } = auth()
+    const userId = requestUserId(request)
     console.log('Chat API called - userId:', userId ? 'authenticated' : 'not authenticated')
     
-    let usageCheck: { allowed: boolean, remaining: number, resetTime: Date }
+    let usageCheck: { allowed: boolean, remaining: number, resetTime: Date, tier: string }
     let clientIP = 'unknown'
     
     // Check if user is authenticated
@@ -990,7 +744,7 @@ export async function POST(request: NextRequest) {
     // For authenticated users, check usage limit
     console.log('Chat API: Checking usage for authenticated user:', userId)
     try {
-      usageCheck = await checkAndUpdateUsage(userId, 5)
+      usageCheck = await checkAndUpdateUsage(userId, 5, loadTestEmail(request))
       console.log('Chat API: Usage check result:', { allowed: usageCheck.allowed, remaining: usageCheck.remaining })
     } catch (error) {
       console.error('Chat API: Error during usage check:', error)
@@ -1065,22 +819,8 @@ export async function POST(request: NextRequest) {
       modelToUse = 'advanced-ai'
     }
 
-    // Get user's actual subscription tier from database
-    let userTier = 'free' // Default to free tier
-    
-    if (userId) {
-      try {
-        const db = getDb()
-        const existingUser = await db.select().from(users).where(eq(users.clerkId, userId)).limit(1)
-        if (existingUser.length > 0) {
-          userTier = existingUser[0].tier
-          console.log(`User ${userId} has tier: ${userTier}`)
-        }
-      } catch (error) {
-        console.error('Error getting user tier:', error)
-        // Keep default free tier on error
-      }
-    }
+    // The user's actual subscription tier, read along with their usage
+    const userTier = usageCheck.tier
     
     // Validate model access based on user's actual subscription tier
     if (aiModel === 'elite' && userTier !== 'elite') {
@@ -1093,23 +833,60 @@ export async function POST(request: NextRequest) {
       modelToUse = 'standard-ai'
     }
 
+    const usage = {
+      remaining: usageCheck.remaining,
+      count: 5 - usageCheck.remaining,
+      limit: 5,
+      resetTime: usageCheck.resetTime.toISOString()
+    }
+
+    // Streaming mode: the reply goes out as server-sent events, a 'delta' per piece of text and a final
+    // 'done' with the complete response and usage. Usage was already committed above, once per message.
+    if (stream === true) {
+      const encoder = new TextEncoder()
+      const events = new ReadableStream<Uint8Array>({
+        async start(controller) {
+          const send = (event: string, data: unknown) => controller.enqueue(encoder.encode(encodeEvent(event, data)))
+          let streamed = false
+          try {
+            const { response, modelUsed, cache } = await getAIResponse(message, limitedHistory, modelToUse, attachments, userTier, (text) => {
+              streamed = true
+              send('delta', { content: text })
+            })
+            // Canned, cached and fallback answers arrive whole
+            if (!streamed) {
+              send('delta', { content: response })
+            }
+            console.log(`Chat interaction (streamed): User=authenticated, Model=${modelUsed}, Message length=${message.length}, Response length=${response.length}, Attachments=${attachments?.length || 0}, Remaining queries=${usageCheck.remaining}, Cache=${cache || 'none'}`)
+            send('done', { response, modelUsed, timestamp: new Date().toISOString(), usage })
+          } catch (error) {
+            console.error('Chat API streaming error:', error)
+            send('error', { error: 'Internal server error', details: error instanceof Error ? error.message : 'Unknown error' })
+          }
+          controller.close()
+        }
+      })
+      return new Response(events, {
+        headers: {
+          'Content-Type': 'text/event-stream; charset=utf-8',
+          'Cache-Control': 'no-cache, no-transform',
+          'X-Accel-Buffering': 'no'
+        }
+      })
+    }
+
     // Get AI response
-    const { response, modelUsed } = await getAIResponse(message, limitedHistory, modelToUse, attachments, userTier)
+    const { response, modelUsed, cache } = await getAIResponse(message, limitedHistory, modelToUse, attachments, userTier)
 
     // Log the interaction for analytics (no personal data stored)
-    console.log(`Chat interaction: User=${userId ? 'authenticated' : 'anonymous'}, Model=${modelUsed}, Message length=${message.length}, Response length=${response.length}, Attachments=${attachments?.length || 0}, Remaining queries=${usageCheck.remaining}`)
+    console.log(`Chat interaction: User=${userId ? 'authenticated' : 'anonymous'}, Model=${modelUsed}, Message length=${message.length}, Response length=${response.length}, Attachments=${attachments?.length || 0}, Remaining queries=${usageCheck.remaining}, Cache=${cache || 'none'}`)
 
     return NextResponse.json({
       response,
       modelUsed,
       timestamp: new Date().toISOString(),
-      usage: {
-        remaining: usageCheck.remaining,
-        count: 5 - usageCheck.remaining,
-        limit: 5,
-        resetTime: usageCheck.resetTime.toISOString()
-      }
-    })
+      usage
+    }, cache ? { headers: { 'X-Response-Cache': cache } } : undefined)
 
   } catch (error) {
     console.error('Chat API error:', error)
@@ -1125,7 +902,7 @@ export async function POST(request: NextRequest) {
 // GET endpoint to check usage for a user
 export async function GET(request: NextRequest) {
   try {
-    const { userId } = auth()
+    const userId = requestUserId(request)
     
     if (!userId) {
       return NextResponse.json({
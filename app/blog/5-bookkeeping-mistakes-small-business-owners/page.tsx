@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, AlertCircle, XCircle, CheckCircle, DollarSign, FileText, Calculator, TrendingUp, Bot, Shield } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, AlertCircle, XCircle, CheckCircle, TrendingUp, Bot, Shield } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: '5 Bookkeeping Mistakes Small Business Owners Make (and How AI Can Fix Them)',
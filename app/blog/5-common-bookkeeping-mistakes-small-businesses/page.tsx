@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, AlertTriangle, XCircle, DollarSign, FileText, Calculator, Shield } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, XCircle, FileText } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: '5 Common Bookkeeping Mistakes Small Businesses Make (And How to Avoid Them)',
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, DollarSign, Brain, Zap, Shield, Calculator, FileText, AlertCircle } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, Brain, Zap, Shield, Calculator } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'How AI Bookkeeping Saves Freelancers from Financial Headaches',
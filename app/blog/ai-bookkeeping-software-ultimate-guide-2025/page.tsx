@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Bot, DollarSign, TrendingUp, Zap, Shield, Users, Brain, FileText, Calculator, Award, ArrowRight } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, Bot, DollarSign, TrendingUp, Shield, Brain, FileText, Award } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'AI Bookkeeping Software: The Ultimate Guide for Small Business Owners in 2025',
@@ -1,376 +1,22 @@
 import { Metadata } from 'next'
-import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Layers, DollarSign, TrendingUp, BarChart3, AlertCircle, Target } from 'lucide-react'
-
-export const metadata: Metadata = {
-  title: 'Amortization: Understanding Its Role in Your Income Statement',
-  description: 'Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning.',
-  keywords: ['amortization explained', 'intangible asset amortization', 'loan amortization', 'amortization schedule', 'amortization vs depreciation'],
-  openGraph: {
-    title: 'Amortization: Understanding Its Role in Your Income Statement',
-    description: 'Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning.',
-    type: 'article',
-    url: 'https://myaibookkeeper.com/blog/amortization-understanding-role-income-statement',
-  }
+import { Layers as ArticleIcon } from 'lucide-react'
+import FinancialConceptArticle, { FinancialConceptArticleData } from '@/components/blog/FinancialConceptArticle'
+import { articleMetadata } from '@/components/blog/metadata'
+
+const article: FinancialConceptArticleData = {
+  title: "Amortization: Understanding Its Role in Your Income Statement",
+  description: "Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning.",
+  keywords: ["amortization explained", "intangible asset amortization", "loan amortization", "amortization schedule", "amortization vs depreciation"],
+  url: "https://myaibookkeeper.com/blog/amortization-understanding-role-income-statement",
+  color: "indigo",
+  readTime: "7",
+  intro: "Amortization spreads intangible asset costs and loan payments over time",
+  sections: ["Amortization Types", "Calculation Methods", "Tax Benefits", "Strategic Planning"],
+  related: [{"slug": "depreciation-demystified-impact-financial-statements", "title": "Depreciation Demystified: How It Impacts Your Financial Statements"}, {"slug": "fixed-assets-optimize-long-term-investments", "title": "Fixed Assets: How to Optimize Long-Term Investments for Growth"}, {"slug": "net-income-ultimate-measure-profitability", "title": "Net Income: Why It's the Ultimate Measure of Profitability"}, {"slug": "equity-explained-company-financial-health", "title": "Equity Explained: What It Means for Your Company's Financial Health"}],
 }
 
-export default function Amortizationunderstandingroleincomestatement() {
-  return (
-    <article className="min-h-screen bg-gradient-to-b from-neutral-50 to-white">
-      <div className="bg-gradient-to-br from-indigo-50 via-white to-indigo-50 border-b border-neutral-200">
-        <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-          <Link 
-            href="/blog" 
-            className="inline-flex items-center text-indigo-600 hover:text-indigo-700 mb-6 transition-colors"
-          >
-            <ArrowLeft className="w-4 h-4 mr-2" />
-            Back to Blog
-          </Link>
-          
-          <div className="space-y-4">
-            <div className="flex items-center space-x-4 text-sm text-neutral-600">
-              <span className="px-3 py-1 bg-indigo-100 text-indigo-700 rounded-full font-medium">
-                Financial Fundamentals
-              </span>
-              <div className="flex items-center space-x-1">
-                <Calendar className="w-4 h-4" />
-                <time dateTime="2024-12-29">December 29, 2024</time>
-              </div>
-              <div className="flex items-center space-x-1">
-                <Clock className="w-4 h-4" />
-                <span>7 min read</span>
-              </div>
-            </div>
-            
-            <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 leading-tight">
-              Amortization: Understanding Its Role in Your Income Statement
-            </h1>
-            
-            <p className="text-xl text-neutral-600">
-              Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning.
-            </p>
-          </div>
-        </div>
-      </div>
-
-      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <div className="prose prose-lg max-w-none">
-          <p className="lead text-xl text-neutral-700 mb-8">
-            Amortization spreads intangible asset costs and loan payments over time. Understanding and optimizing this critical financial metric can transform your business's financial health and competitive position. This comprehensive guide explores the fundamental concepts, practical strategies, and real-world applications that will help you master this essential aspect of financial management. Whether you're a startup founder, small business owner, or financial manager, the insights and techniques presented here will equip you with the knowledge needed to make informed decisions and drive sustainable growth.
-          </p>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Amortization Types
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            The foundation of effective financial management begins with a clear understanding of core concepts and their practical applications. In today's dynamic business environment, the ability to analyze, interpret, and act on financial data separates successful businesses from those that struggle. This section explores the fundamental principles that underpin sound financial decision-making and provides a framework for implementing best practices in your organization.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Financial metrics serve as the compass guiding business decisions, providing objective measures of performance and highlighting areas for improvement. By establishing clear benchmarks and regularly monitoring key indicators, businesses can identify trends early, capitalize on opportunities, and address challenges before they become critical issues. The key is selecting the right metrics for your specific business model and industry context.
-          </p>
-
-          <div className="bg-gradient-to-r from-indigo-50 to-indigo-50 rounded-2xl p-8 my-8 not-prose">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <Layers className="w-6 h-6 mr-3 text-indigo-600" />
-              Key Performance Indicators
-            </h3>
-            <div className="bg-white/80 rounded-xl p-6">
-              <div className="grid md:grid-cols-2 gap-6">
-                <div>
-                  <h4 className="font-semibold text-neutral-900 mb-3">Financial Metrics</h4>
-                  <ul className="space-y-2 text-sm text-neutral-700">
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Revenue growth rate and trends</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Profit margins and efficiency ratios</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Cash flow and liquidity measures</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Return on investment metrics</span>
-                    </li>
-                  </ul>
-                </div>
-                <div>
-                  <h4 className="font-semibold text-neutral-900 mb-3">Operational Indicators</h4>
-                  <ul className="space-y-2 text-sm text-neutral-700">
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Efficiency and productivity rates</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Quality and customer satisfaction</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Market share and competitive position</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Innovation and growth metrics</span>
-                    </li>
-                  </ul>
-                </div>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Calculation Methods
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Implementing effective financial strategies requires a systematic approach that aligns with your business objectives and market realities. Success depends on understanding not just what to do, but when and how to do it. This section explores proven methodologies and practical techniques that can be adapted to your specific circumstances, providing a roadmap for sustainable financial improvement.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The most successful businesses recognize that financial management is not a one-time exercise but an ongoing process of refinement and optimization. By establishing robust systems and processes, regularly reviewing performance, and maintaining flexibility to adapt to changing conditions, organizations can build resilient financial foundations that support long-term growth and stability.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Strategic Implementation Framework</h3>
-            
-            <div className="space-y-4">
-              <div className="border-l-4 border-indigo-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Assessment and Analysis</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Begin with a comprehensive evaluation of current financial position, identifying strengths, weaknesses, opportunities, and threats. Use historical data to establish baselines and industry benchmarks to set realistic targets for improvement.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-indigo-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Planning and Goal Setting</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Develop clear, measurable objectives aligned with overall business strategy. Create detailed action plans with specific timelines, responsibilities, and resource requirements. Ensure goals are ambitious yet achievable.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-indigo-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Implementation and Monitoring</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Execute strategies systematically while maintaining flexibility to adjust as needed. Establish regular review cycles to track progress, identify deviations, and make course corrections promptly.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-indigo-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Optimization and Scaling</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Continuously refine processes based on results and feedback. Document successful practices and scale them across the organization. Foster a culture of continuous improvement and financial awareness.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Tax Benefits
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Every business faces unique challenges in financial management, from cash flow constraints to competitive pressures. Understanding common pitfalls and developing strategies to overcome them is essential for long-term success. This section addresses frequent obstacles and provides practical solutions based on real-world experience and best practices.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The key to overcoming financial challenges lies in proactive management and systematic problem-solving. By anticipating potential issues, maintaining adequate reserves, and developing contingency plans, businesses can navigate difficulties while maintaining operational stability. Regular stress testing and scenario planning help identify vulnerabilities before they become critical.
-          </p>
-
-          <div className="bg-gradient-to-r from-yellow-50 to-amber-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <AlertCircle className="w-6 h-6 mr-3 text-yellow-600" />
-              Common Challenges and Solutions
-            </h3>
-            
-            <div className="grid md:grid-cols-2 gap-4">
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Cash Flow Management</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Irregular revenue patterns</li>
-                  <li>• Extended payment cycles</li>
-                  <li>• Seasonal fluctuations</li>
-                  <li>• Unexpected expenses</li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Growth Challenges</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Scaling operations efficiently</li>
-                  <li>• Managing increased complexity</li>
-                  <li>• Maintaining quality standards</li>
-                  <li>• Funding expansion needs</li>
-                </ul>
-              </div>
-            </div>
-          </div>
+export const metadata: Metadata = articleMetadata(article)
 
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Strategic Planning
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Translating financial knowledge into actionable strategies requires careful planning and disciplined execution. This section provides a comprehensive framework for implementing financial best practices in your organization, ensuring that theoretical understanding translates into practical results. The focus is on creating sustainable systems that deliver consistent improvements over time.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Successful implementation depends on alignment across all levels of the organization. From executive leadership to front-line employees, everyone must understand their role in achieving financial objectives. Clear communication, appropriate training, and consistent reinforcement of financial priorities create a culture where sound financial management becomes embedded in daily operations.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Implementation Best Practices</h3>
-            
-            <div className="grid md:grid-cols-2 gap-6">
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">System Development</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Establish clear processes and procedures</span>
-                  </li>
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Implement robust tracking mechanisms</span>
-                  </li>
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Create accountability structures</span>
-                  </li>
-                </ul>
-              </div>
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">Performance Management</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Set measurable objectives and KPIs</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Regular monitoring and reporting</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-indigo-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Continuous improvement initiatives</span>
-                  </li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Advanced Strategies and Optimization
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            As businesses mature and financial management capabilities develop, opportunities emerge for more sophisticated optimization strategies. Advanced techniques can deliver significant improvements in financial performance, but require careful implementation and ongoing management. This section explores cutting-edge approaches that leading organizations use to maximize financial efficiency and competitive advantage.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Technology plays an increasingly important role in financial optimization, from automated data collection and analysis to predictive modeling and artificial intelligence. By leveraging modern tools and platforms, businesses can gain deeper insights, make faster decisions, and achieve levels of financial control previously impossible. The key is selecting technologies that align with your specific needs and capabilities.
-          </p>
-
-          <div className="bg-gradient-to-r from-purple-50 to-pink-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6">Technology and Innovation</h3>
-            
-            <div className="space-y-4">
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Automation and AI</h4>
-                <p className="text-sm text-neutral-700">
-                  Implement intelligent automation to streamline routine financial processes, reduce errors, and free up resources for strategic activities. Use AI-powered analytics to identify patterns, predict trends, and optimize decision-making across all financial functions.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Real-time Analytics</h4>
-                <p className="text-sm text-neutral-700">
-                  Deploy dashboards and reporting tools that provide instant visibility into financial performance. Enable data-driven decision-making at all organizational levels with accessible, actionable insights updated in real-time.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Predictive Modeling</h4>
-                <p className="text-sm text-neutral-700">
-                  Utilize advanced analytics to forecast future financial scenarios, identify risks early, and optimize resource allocation. Build models that account for multiple variables and provide probabilistic outcomes for better planning.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Industry Benchmarks and Best Practices
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Understanding how your financial performance compares to industry standards provides valuable context for improvement efforts. Benchmarking against peers and best-in-class organizations helps identify gaps, set realistic targets, and prioritize improvement initiatives. This section examines key industry metrics and explores proven practices from leading organizations.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            While benchmarks provide useful reference points, it's important to consider your unique circumstances when setting targets. Factors such as business model, market position, growth stage, and strategic objectives all influence what constitutes optimal financial performance for your organization. Use benchmarks as guides, not absolute standards, and focus on continuous improvement relative to your own baseline.
-          </p>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Building Financial Resilience
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Financial resilience—the ability to withstand and recover from economic shocks—has become increasingly important in today's volatile business environment. Building resilience requires more than just maintaining cash reserves; it involves creating flexible systems, diversifying risk, and developing the organizational capability to adapt quickly to changing conditions.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The most resilient organizations combine strong financial fundamentals with operational agility and strategic foresight. They maintain disciplined financial management during good times, building the resources and capabilities needed to navigate challenges. Regular scenario planning, stress testing, and contingency preparation ensure readiness for various potential futures.
-          </p>
-
-          <div className="bg-gradient-to-r from-indigo-50 to-cyan-50 rounded-2xl p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Key Takeaways
-            </h2>
-            <ul className="space-y-3 text-neutral-700">
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-indigo-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Strong financial management provides the foundation for sustainable business growth and competitive advantage</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-indigo-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Regular monitoring and analysis of key metrics enables proactive decision-making and early problem detection</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-indigo-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Systematic implementation of best practices delivers consistent improvements in financial performance</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-indigo-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Technology and automation increasingly enable sophisticated financial optimization strategies</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-indigo-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Building financial resilience requires disciplined management combined with flexibility and foresight</span>
-              </li>
-            </ul>
-          </div>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Transform Your Financial Management with AI-Powered Solutions
-            </h2>
-            <p className="text-neutral-700 mb-6">
-              Take your financial management to the next level with intelligent automation and real-time insights. AI-powered bookkeeping and financial analysis tools provide the visibility, control, and optimization capabilities needed to excel in today's competitive environment. Start building a stronger financial foundation for sustainable growth and success.
-            </p>
-            <Link
-              href="/"
-              className="inline-flex items-center px-6 py-3 bg-gradient-to-r from-indigo-600 to-indigo-600 hover:from-indigo-700 hover:to-indigo-700 text-white font-medium rounded-full transition-all duration-200 shadow-lg hover:shadow-xl"
-            >
-              Optimize Your Financial Performance Today
-              <ArrowLeft className="w-4 h-4 ml-2 rotate-180" />
-            </Link>
-          </div>
-        </div>
-      </div>
-    </article>
-  )
-}
\ No newline at end of file
+export default function Amortizationunderstandingroleincomestatement() {
+  return <FinancialConceptArticle {...article} icon={ArticleIcon} />
+}
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Building, DollarSign, TrendingUp, Package, Briefcase, PiggyBank, BarChart3 } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, Building, BarChart3 } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'Assets 101: Understanding the Building Blocks of Your Balance Sheet',
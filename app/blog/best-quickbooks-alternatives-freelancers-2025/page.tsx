@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Star, DollarSign, Zap, Shield, Users, Bot, TrendingUp, Award } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, Star, Zap, Shield, Users, Bot, TrendingUp, Award } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'The Best QuickBooks Alternatives for Freelancers in 2025 (Including AI Tools)',
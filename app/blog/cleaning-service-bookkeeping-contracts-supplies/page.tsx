@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Sparkles, DollarSign, TrendingUp, Home, Users, Package, FileText } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'Cleaning Service Bookkeeping: Contracts, Supplies, and Client Management',
@@ -1,474 +1,19 @@
 import { Metadata } from 'next'
-import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, DollarSign, BarChart3, Target, AlertCircle, Shield, FileText, Users, Package, Calculator } from 'lucide-react'
-
-export const metadata: Metadata = {
-  title: 'Why Cloud-Based Bookkeeping Software Is a Game-Changer for Small Businesses',
-  description: 'Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs.',
-  keywords: ['cloud bookkeeping software', 'QuickBooks online', 'Xero accounting', 'real-time financial tracking', 'bookkeeping automation'],
-  openGraph: {
-    title: 'Why Cloud-Based Bookkeeping Software Is a Game-Changer for Small Businesses',
-    description: 'Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs.',
-    type: 'article',
-    url: 'https://myaibookkeeper.com/blog/why-cloud-based-bookkeeping-software-is-a-game-changer-for-small-businesses',
-  }
+import ComprehensiveArticle, { ComprehensiveArticleData } from '@/components/blog/ComprehensiveArticle'
+import { articleMetadata } from '@/components/blog/metadata'
+
+const article: ComprehensiveArticleData = {
+  title: "Why Cloud-Based Bookkeeping Software Is a Game-Changer for Small Businesses",
+  description: "Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs.",
+  keywords: ["cloud bookkeeping software", "QuickBooks online", "Xero accounting", "real-time financial tracking", "bookkeeping automation"],
+  url: "https://myaibookkeeper.com/blog/why-cloud-based-bookkeeping-software-is-a-game-changer-for-small-businesses",
+  category: "Software Reviews",
+  intro: "In today's digital landscape, the right software can transform how small businesses manage their finances. Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs. This comprehensive guide explores the features, benefits, and implementation strategies that make modern bookkeeping software essential for business success.",
+  related: [{"slug": "bookkeeping-on-budget-free-low-cost-tools", "title": "Bookkeeping on a Budget: Free and Low-Cost Tools for Small Business Owners"}, {"slug": "when-to-hire-bookkeeper-small-business", "title": "When to Hire a Bookkeeper for Your Small Business: Signs It's Time to Outsource"}, {"slug": "small-business-guide-tracking-cash-flow", "title": "The Small Business Owner's Guide to Tracking Cash Flow with Bookkeeping"}, {"slug": "set-up-simple-bookkeeping-system-one-weekend", "title": "How to Set Up a Simple Bookkeeping System for Your Small Business in One Weekend"}],
 }
 
-export default function BlogPost() {
-  return (
-    <article className="min-h-screen bg-gradient-to-b from-neutral-50 to-white">
-      <div className="bg-gradient-to-br from-blue-50 via-white to-indigo-50 border-b border-neutral-200">
-        <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-          <Link 
-            href="/blog" 
-            className="inline-flex items-center text-blue-600 hover:text-blue-700 mb-6 transition-colors"
-          >
-            <ArrowLeft className="w-4 h-4 mr-2" />
-            Back to Blog
-          </Link>
-          
-          <div className="space-y-4">
-            <div className="flex items-center space-x-4 text-sm text-neutral-600">
-              <span className="px-3 py-1 bg-blue-100 text-blue-700 rounded-full font-medium">
-                Software Reviews
-              </span>
-              <div className="flex items-center space-x-1">
-                <Calendar className="w-4 h-4" />
-                <time dateTime="2024-12-29">December 29, 2024</time>
-              </div>
-              <div className="flex items-center space-x-1">
-                <Clock className="w-4 h-4" />
-                <span>9 min read</span>
-              </div>
-            </div>
-            
-            <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 leading-tight">
-              Why Cloud-Based Bookkeeping Software Is a Game-Changer for Small Businesses
-            </h1>
-            
-            <p className="text-xl text-neutral-600">
-              Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs.
-            </p>
-          </div>
-        </div>
-      </div>
-
-      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <div className="prose prose-lg max-w-none">
-          <p className="lead text-xl text-neutral-700 mb-8">
-            In today's digital landscape, the right software can transform how small businesses manage their finances. Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs. This comprehensive guide explores the features, benefits, and implementation strategies that make modern bookkeeping software essential for business success. Whether you're a startup founder, established business owner, or financial manager, the insights 
-            and strategies presented here will equip you with practical knowledge to make informed decisions and drive 
-            sustainable growth. From fundamental concepts to advanced techniques, this guide covers everything you need 
-            to master this critical aspect of business management.
-          </p>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Understanding the Fundamentals
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Before diving into advanced strategies, it's crucial to establish a solid foundation of understanding. 
-            The concepts we'll explore form the backbone of effective business management, providing the framework 
-            for making strategic decisions that drive growth and profitability. Many businesses struggle not because 
-            they lack resources, but because they fail to properly understand and apply these fundamental principles.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The journey toward business excellence begins with recognizing that every aspect of your operation is 
-            interconnected. Financial decisions impact operational capabilities, customer satisfaction drives revenue, 
-            and efficient processes determine profitability. By understanding these relationships and implementing 
-            systematic approaches to measurement and improvement, you create a sustainable competitive advantage that 
-            compounds over time.
-          </p>
-
-          <div className="bg-gradient-to-r from-blue-50 to-indigo-50 rounded-2xl p-8 my-8 not-prose">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <BarChart3 className="w-6 h-6 mr-3 text-blue-600" />
-              Key Performance Indicators
-            </h3>
-            <div className="grid md:grid-cols-2 gap-6">
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-3">Primary Metrics</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Revenue growth and trends</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Profit margins and efficiency</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Cash flow and liquidity</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Return on investment</span>
-                  </li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-3">Supporting Indicators</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Customer satisfaction scores</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Operational efficiency rates</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Market share growth</span>
-                  </li>
-                  <li className="flex items-start">
-                    <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Innovation metrics</span>
-                  </li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Implementation Strategies
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Successful implementation requires more than theoretical knowledge—it demands practical application tailored 
-            to your specific business context. The strategies we'll explore have been proven across various industries 
-            and business sizes, but their effectiveness depends on proper customization and consistent execution. The 
-            key is to start with foundational elements and gradually build sophistication as your capabilities mature.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Begin by assessing your current state honestly. Where are you today, and where do you want to be? This gap 
-            analysis forms the basis of your implementation roadmap. Prioritize initiatives based on potential impact 
-            and resource requirements, focusing first on quick wins that build momentum and demonstrate value. As you 
-            achieve initial successes, reinvest the gains into more ambitious improvements, creating a virtuous cycle 
-            of continuous enhancement.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Step-by-Step Implementation Guide</h3>
-            
-            <div className="space-y-4">
-              <div className="border-l-4 border-blue-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Phase 1: Assessment and Planning</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Conduct a thorough evaluation of your current processes, identify gaps and opportunities, and develop 
-                  a comprehensive implementation plan with clear objectives and timelines. This foundational phase sets 
-                  the stage for all subsequent improvements.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-blue-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Phase 2: System Setup</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Establish the necessary infrastructure, tools, and processes required for effective implementation. 
-                  This includes selecting appropriate software, defining workflows, and creating documentation that 
-                  ensures consistency and scalability.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-blue-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Phase 3: Training and Adoption</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Ensure all stakeholders understand their roles and responsibilities in the new system. Provide 
-                  comprehensive training, create reference materials, and establish support mechanisms to facilitate 
-                  smooth adoption across the organization.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-blue-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Phase 4: Monitoring and Optimization</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Continuously track performance against established benchmarks, identify areas for improvement, and 
-                  refine processes based on real-world results. This ongoing optimization ensures sustained value 
-                  creation and adaptation to changing conditions.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Common Challenges and Solutions
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Every business transformation encounters obstacles, but understanding common challenges and their solutions 
-            can help you navigate them successfully. The most frequent issues stem from resistance to change, resource 
-            constraints, and complexity management. By anticipating these challenges and preparing appropriate responses, 
-            you can maintain momentum and achieve your objectives despite inevitable setbacks.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Resistance to change often emerges from fear of the unknown or comfort with existing processes. Address this 
-            by clearly communicating benefits, involving stakeholders in planning, and celebrating early wins. Resource 
-            constraints require creative solutions—prioritize high-impact initiatives, leverage technology for efficiency, 
-            and consider phased implementations that spread costs over time. Complexity can be managed through systematic 
-            approaches, clear documentation, and regular simplification efforts.
-          </p>
-
-          <div className="bg-gradient-to-r from-red-50 to-orange-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <AlertCircle className="w-6 h-6 mr-3 text-red-600" />
-              Overcoming Common Obstacles
-            </h3>
-            
-            <div className="grid md:grid-cols-2 gap-4">
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Technical Challenges</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• System integration issues</li>
-                  <li>• Data quality problems</li>
-                  <li>• Technology limitations</li>
-                  <li>• Security concerns</li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Organizational Challenges</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Change resistance</li>
-                  <li>• Skill gaps</li>
-                  <li>• Resource constraints</li>
-                  <li>• Communication barriers</li>
-                </ul>
-              </div>
-            </div>
-          </div>
+export const metadata: Metadata = articleMetadata(article)
 
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Advanced Optimization Techniques
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Once foundational elements are in place, advanced optimization techniques can deliver exponential improvements 
-            in performance. These sophisticated approaches leverage data analytics, automation, and strategic thinking to 
-            unlock value that traditional methods might miss. The key is knowing when your organization is ready for these 
-            advanced techniques and how to implement them without disrupting core operations.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Data-driven decision making forms the cornerstone of advanced optimization. By collecting, analyzing, and acting 
-            on comprehensive data sets, you can identify patterns, predict trends, and optimize outcomes with unprecedented 
-            precision. Automation eliminates manual inefficiencies while ensuring consistency and scalability. Strategic 
-            partnerships and integrations extend your capabilities without proportional increases in overhead, creating 
-            leverage that accelerates growth.
-          </p>
-
-          <div className="bg-gradient-to-r from-green-50 to-emerald-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6">Optimization Framework</h3>
-            
-            <div className="space-y-4">
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Continuous Improvement Cycle</h4>
-                <p className="text-sm text-neutral-700">
-                  Implement a systematic approach to ongoing enhancement through regular assessment, targeted improvements, 
-                  and measured results. This creates a culture of excellence where optimization becomes embedded in daily 
-                  operations rather than periodic initiatives.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Technology Integration</h4>
-                <p className="text-sm text-neutral-700">
-                  Leverage modern tools and platforms to automate routine tasks, enhance decision-making capabilities, 
-                  and scale operations efficiently. The right technology stack can multiply your team's effectiveness 
-                  while reducing errors and operational costs.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Performance Measurement</h4>
-                <p className="text-sm text-neutral-700">
-                  Establish comprehensive metrics that provide real-time visibility into performance across all critical 
-                  dimensions. Regular monitoring and analysis ensure you stay on track and can quickly identify and address 
-                  any deviations from optimal performance.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Industry Best Practices
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Learning from industry leaders and proven practices accelerates your journey toward excellence. While every 
-            business is unique, certain principles and approaches have demonstrated consistent success across various 
-            contexts. By adapting these best practices to your specific situation, you can avoid common pitfalls and 
-            achieve results more quickly and efficiently.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Best practices evolve continuously as markets change and new technologies emerge. Staying current requires 
-            active engagement with industry communities, continuous learning, and willingness to experiment with new 
-            approaches. The most successful businesses don't just adopt best practices—they contribute to their evolution 
-            by innovating and sharing their experiences with others.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Proven Success Strategies</h3>
-            
-            <div className="grid md:grid-cols-2 gap-6">
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">Operational Excellence</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Standardize core processes</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Implement quality controls</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Optimize resource allocation</span>
-                  </li>
-                </ul>
-              </div>
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">Strategic Planning</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Set clear objectives</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Align resources with goals</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-blue-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Monitor progress regularly</span>
-                  </li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Future-Proofing Your Business
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            The business landscape evolves rapidly, and strategies that work today may become obsolete tomorrow. 
-            Future-proofing requires building flexibility into your systems, maintaining awareness of emerging trends, 
-            and developing capabilities that transcend specific technologies or market conditions. The goal is creating 
-            an adaptable organization that can thrive regardless of what changes come.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Invest in foundational capabilities that remain valuable across different scenarios. Strong financial management, 
-            efficient operations, excellent customer relationships, and continuous learning culture provide resilience 
-            against disruption. Build networks and partnerships that extend your capabilities and provide early warning 
-            of industry shifts. Most importantly, maintain the agility to pivot quickly when circumstances demand change.
-          </p>
-
-          <div className="bg-gradient-to-r from-purple-50 to-pink-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6">Building Resilience</h3>
-            
-            <div className="grid md:grid-cols-3 gap-4">
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Financial Strength</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Maintain cash reserves</li>
-                  <li>• Diversify revenue streams</li>
-                  <li>• Control costs effectively</li>
-                  <li>• Build credit access</li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Operational Agility</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Flexible processes</li>
-                  <li>• Scalable systems</li>
-                  <li>• Cross-trained teams</li>
-                  <li>• Quick decision-making</li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Strategic Positioning</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Market awareness</li>
-                  <li>• Innovation capability</li>
-                  <li>• Strong partnerships</li>
-                  <li>• Brand resilience</li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Measuring Success and ROI
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Ultimately, the value of any business initiative must be measured in tangible results. Establishing clear 
-            metrics for success and regularly evaluating return on investment ensures resources are allocated effectively 
-            and initiatives deliver promised value. This disciplined approach to measurement creates accountability and 
-            provides the data needed for continuous improvement.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Define success metrics before implementation begins, ensuring alignment between measurements and strategic 
-            objectives. Include both leading indicators that predict future performance and lagging indicators that 
-            confirm results. Regular reporting and analysis keep stakeholders informed and engaged while providing 
-            early warning of issues requiring attention. Remember that not everything valuable is easily measured—
-            balance quantitative metrics with qualitative assessments of factors like culture, morale, and brand strength.
-          </p>
-
-          <div className="bg-gradient-to-r from-blue-50 to-cyan-50 rounded-2xl p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Key Takeaways
-            </h2>
-            <ul className="space-y-3 text-neutral-700">
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-blue-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Understanding fundamentals provides the foundation for sustainable business success</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-blue-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Systematic implementation ensures consistent results and scalable growth</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-blue-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Continuous optimization and adaptation maintain competitive advantage</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-blue-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Technology and automation multiply effectiveness while reducing costs</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-blue-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Regular measurement and analysis ensure initiatives deliver promised value</span>
-              </li>
-            </ul>
-          </div>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Transform Your Business with AI-Powered Solutions
-            </h2>
-            <p className="text-neutral-700 mb-6">
-              Ready to implement these strategies and optimize your business performance? AI-powered bookkeeping and 
-              financial management tools provide the automation, insights, and control you need to succeed. Transform 
-              complex financial management into strategic advantage with intelligent solutions designed for modern business.
-            </p>
-            <Link
-              href="/"
-              className="inline-flex items-center px-6 py-3 bg-gradient-to-r from-blue-600 to-indigo-600 hover:from-blue-700 hover:to-indigo-700 text-white font-medium rounded-full transition-all duration-200 shadow-lg hover:shadow-xl"
-            >
-              Start Your Transformation Today
-              <ArrowLeft className="w-4 h-4 ml-2 rotate-180" />
-            </Link>
-          </div>
-        </div>
-      </div>
-    </article>
-  )
-}
\ No newline at end of file
+export default function BlogPost() {
+  return <ComprehensiveArticle {...article} />
+}
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, DollarSign, FileText, Bot, Calculator, Zap } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, FileText, Bot, Calculator } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'DIY Bookkeeping for Small Business Owners: How AI Can Save You 10 Hours a Month',
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Truck, DollarSign, TrendingUp, MapPin, FileText, Fuel, Utensils } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, Truck, DollarSign, TrendingUp, MapPin, FileText, Fuel, Utensils } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'Food Truck Operator Bookkeeping: Location Permits and Mobile Inventory Management',
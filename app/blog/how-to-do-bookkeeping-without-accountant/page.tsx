@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, BookOpen, FileText, Calculator, DollarSign, TrendingUp, AlertCircle, Bot, Zap } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, FileText, Calculator, DollarSign, TrendingUp, AlertCircle, Bot, Zap } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'How to Do Your Own Bookkeeping Without an Accountant (Step-by-Step Guide)',
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, AlertCircle, DollarSign, TrendingDown, Shield, BarChart3, CreditCard } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, AlertCircle, Shield, BarChart3, CreditCard } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: "Managing Liabilities: How to Keep Your Business's Debts in Check",
@@ -0,0 +1,31 @@
+import { Metadata } from 'next'
+import { notFound } from 'next/navigation'
+import BlogIndexPage from '@/components/BlogIndexPage'
+import { blogIndexMeta } from '@/lib/blogIndex'
+
+interface BlogIndexRouteProps {
+  params: { page: string }
+}
+
+// Page 1 lives at /blog; every other shard is prerendered and unknown pages 404
+export const dynamicParams = false
+
+export function generateStaticParams() {
+  return Array.from({ length: Math.max(blogIndexMeta.totalPages - 1, 0) }, (_, i) => ({ page: String(i + 2) }))
+}
+
+export function generateMetadata({ params }: BlogIndexRouteProps): Metadata {
+  return {
+    title: `Blog - Page ${params.page} | My AI Bookkeeper`,
+    description: 'Expert guides on DIY bookkeeping, AI accounting tools, and financial management tips for small business owners, freelancers, and solopreneurs.',
+    alternates: { canonical: `https://myaibookkeeper.com/blog/page/${params.page}` },
+  }
+}
+
+export default function BlogIndexPageRoute({ params }: BlogIndexRouteProps) {
+  const page = Number(params.page)
+  if (!Number.isInteger(page) || page < 2 || page > blogIndexMeta.totalPages) {
+    notFound()
+  }
+  return <BlogIndexPage page={page} />
+}
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, DollarSign, TrendingUp, Users, Package, Scissors, Heart, AlertCircle, Calculator } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, DollarSign, TrendingUp, Users, Package, Scissors, Heart } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'Pet Grooming Business Bookkeeping: Complete Guide for Managing Supplies & Appointments',
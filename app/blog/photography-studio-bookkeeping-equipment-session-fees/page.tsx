@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, Camera, DollarSign, TrendingUp, Package, FileText, Calculator, Briefcase } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, Camera, DollarSign, TrendingUp, Package, FileText, Briefcase } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'Photography Studio Bookkeeping: Managing Equipment Rentals and Session Fees',
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, XCircle, DollarSign, TrendingDown, Zap, Users, Brain, Calculator, Award, ArrowRight, AlertCircle } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, XCircle, Brain, Award } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'QuickBooks Alternatives: 7 Affordable AI Bookkeeping Tools for Startups',
@@ -1,6 +1,6 @@
 import { Metadata } from 'next'
 import Link from 'next/link'
-import { ArrowLeft, Clock, Calendar, CheckCircle, FileText, DollarSign, AlertTriangle, Download, Shield, Calculator, Brain, TrendingUp, ArrowRight } from 'lucide-react'
+import { ArrowLeft, Clock, Calendar, CheckCircle, FileText, Shield, Calculator, Brain, TrendingUp } from 'lucide-react'
 
 export const metadata: Metadata = {
   title: 'How to Do Small Business Taxes with DIY AI Bookkeeping',
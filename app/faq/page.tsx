@@ -3,21 +3,15 @@
 import { useState } from 'react'
 import Link from 'next/link'
 import Script from 'next/script'
-import { 
+import {
   HelpCircle,
   ChevronDown,
   ChevronRight,
-  MessageCircle,
-  Mail,
   BookOpen,
   Search,
-  Users,
-  Clock,
   CheckCircle,
   AlertCircle,
-  Lightbulb,
-  Send,
-  Phone
+  Lightbulb
 } from 'lucide-react'
 
 // Structured data for SEO
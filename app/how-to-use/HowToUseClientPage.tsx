@@ -2,7 +2,7 @@
 
 import Link from 'next/link'
 import Script from 'next/script'
-import { 
+import {
   BookOpen,
   MessageCircle,
   Upload,
@@ -11,9 +11,7 @@ import {
   FileText,
   TrendingUp,
   Receipt,
-  CreditCard,
   Building2,
-  Users,
   CheckCircle,
   ArrowRight,
   Lightbulb,
@@ -1,7 +1,7 @@
 'use client'
 
 import { useState, useEffect } from 'react'
-import { Menu, Calculator, BookOpen, DollarSign, MessageCircle, Copy, CheckCircle, XCircle } from 'lucide-react'
+import { Calculator, BookOpen, DollarSign, CheckCircle, XCircle } from 'lucide-react'
 import { useUser, SignInButton, UserButton } from '@clerk/nextjs'
 import Header from '@/components/Header'
 import ChatInterface from '@/components/ChatInterface'
@@ -15,6 +15,7 @@ import { useConversations } from '@/hooks/useConversations'
 import { useUser as useAppUser } from '@/hooks/useUser'
 import { useAppStore } from '@/lib/store'
 import { getClientFingerprint } from '@/lib/client-fingerprint'
+import { readEvents } from '@/lib/sse'
 import { Message, FileAttachment } from '@/types/chat'
 
 export default function Home() {
@@ -35,6 +36,8 @@ export default function Home() {
   useAppUser()
 
   const [isLoading, setIsLoading] = useState(false)
+  // The message being answered and the reply so far, shown while the reply streams in
+  const [streamingMessages, setStreamingMessages] = useState<Message[]>([])
   // Sidebar state removed - no conversations sidebar needed
   const [subscriptionModalOpen, setSubscriptionModalOpen] = useState(false)
   const [selectedAIModel, setSelectedAIModel] = useState('everyday')
@@ -144,6 +147,7 @@ export default function Home() {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Accept': 'text/event-stream',
           'X-Client-Fingerprint': getClientFingerprint(),
         },
         body: JSON.stringify({
@@ -154,6 +158,7 @@ export default function Home() {
           })) || [],
           attachments,
           aiModel: selectedAIModel,
+          stream: true,
         }),
       })
 
@@ -186,9 +191,6 @@ export default function Home() {
         throw new Error(errorData.error || errorData.details?.message || `API error ${response.status}`)
       }
 
-      const data = await response.json()
-      console.log('API success response data:', data)
-
       // Add user message
       const userMessage: Message = {
         id: Date.now().toString(),
@@ -198,6 +200,34 @@ export default function Home() {
         attachments,
       }
 
+      let data: any = null
+      if (response.body && (response.headers.get('content-type') || '').includes('text/event-stream')) {
+        // Render the reply as it streams in; the final 'done' event carries the same fields as the JSON reply
+        let streamed = ''
+        await readEvents(response.body, (event, payload) => {
+          const parsed = JSON.parse(payload)
+          if (event === 'delta') {
+            streamed += parsed.content
+            setStreamingMessages([userMessage, {
+              id: (Date.now() + 1).toString(),
+              role: 'assistant',
+              content: streamed,
+              timestamp: new Date(),
+            }])
+          } else if (event === 'done') {
+            data = parsed
+          } else if (event === 'error') {
+            throw new Error(parsed.details || parsed.error)
+          }
+        })
+        if (!data) {
+          throw new Error('The response stream ended early')
+        }
+      } else {
+        data = await response.json()
+      }
+      console.log('API success response data:', data)
+
       // Add AI response
       const aiMessage: Message = {
         id: (Date.now() + 1).toString(),
@@ -216,6 +246,7 @@ export default function Home() {
       // Add messages to conversation
       await addMessageToConversation(conversationId, userMessage)
       await addMessageToConversation(conversationId, aiMessage)
+      setStreamingMessages([])
 
       console.log('Messages added successfully')
 
@@ -243,6 +274,7 @@ export default function Home() {
       console.error('Error details:', error instanceof Error ? error.message : error)
       alert(`Failed to send message. Error: ${error instanceof Error ? error.message : 'Unknown error'}. Please try again.`)
     } finally {
+      setStreamingMessages([])
       setIsLoading(false)
     }
   }
@@ -371,6 +403,7 @@ export default function Home() {
                 <div className="p-4 pb-2">
                   <ChatInterface
                     messages={currentConversation.messages}
+                    streamingMessages={streamingMessages}
                     onSendMessage={handleSendMessage}
                     isLoading={isLoading}
                     selectedAIModel={selectedAIModel}
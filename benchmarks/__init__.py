@@ -0,0 +1 @@
+"""Benchmarks for the blog content pipeline. Run from the repo root with `python -m benchmarks.<name>`."""
@@ -0,0 +1,56 @@
+"""Write throughput of each output backend.
+
+Pages are rendered once up front; only the backend writes are timed. "disk
+warm" rewrites the same pages over themselves, which the disk backend skips.
+
+    python -m benchmarks.bench_backends --pages 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from blog_pipeline import financial
+from blog_pipeline.backends import ArchiveBackend, DiskBackend, MemoryBackend
+from blog_pipeline.build import page_name
+
+from .synthetic import financial_records
+
+
+def run(backend, pages):
+    start = time.perf_counter()
+    with backend:
+        for name, content in pages:
+            backend.prepare(name)
+            backend.write(name, content)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    args = parser.parse_args()
+
+    pages = [(page_name(record["slug"]), financial.render_page(record))
+             for record in financial_records(args.pages)]
+    megabytes = sum(len(content.encode("utf-8")) for _, content in pages) / 1e6
+
+    print(f"{'backend':>12}  {'pages/sec':>10}  {'MB/s':>7}  {'output MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("memory", lambda: MemoryBackend(), None),
+            ("disk cold", lambda: DiskBackend(os.path.join(tmp, "blog")), None),
+            ("disk warm", lambda: DiskBackend(os.path.join(tmp, "blog")), None),
+        ]
+        for extension in ("tar", "tar.gz", "zip"):
+            path = os.path.join(tmp, f"pages.{extension}")
+            cases.append((extension, lambda path=path: ArchiveBackend(path), path))
+        for label, make, archive_path in cases:
+            elapsed = run(make(), pages)
+            size = f"{os.path.getsize(archive_path) / 1e6:>9.1f}" if archive_path else f"{'':>9}"
+            print(f"{label:>12}  {len(pages) / elapsed:>10.0f}  {megabytes / elapsed:>7.1f}  {size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Peak RSS of a full financial build() versus catalog size.
+
+Each size runs in a fresh interpreter and builds into a temporary directory
+through the real pipeline: related-articles pass, render, validation, staged
+writes and the manifest. Once streaming records from a JSONL catalog, and
+once loading the whole catalog into a list first (what the old in-module
+literals amounted to). The growth that remains when streaming is the
+related pass's per-topic term counts and the manifest.
+
+    python -m benchmarks.bench_catalog_memory --sizes 30 1000 10000 100000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from .synthetic import financial_records, write_jsonl
+
+CHILD = """
+import resource, sys
+from blog_pipeline import financial
+from blog_pipeline.catalog import iter_catalog
+catalog = sys.argv[1]
+if sys.argv[2] == "list":
+    catalog = list(iter_catalog(catalog))
+report = financial.build(catalog, out_dir=sys.argv[3], log=lambda *args: None)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(report.rebuilt))
+"""
+
+
+def peak_rss_mb(catalog_path, mode, out_dir):
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory(dir=out_dir) as pages:
+        out = subprocess.run([sys.executable, "-c", CHILD, catalog_path, mode, pages], cwd=repo_root,
+                             capture_output=True, text=True, check=True).stdout
+    return int(out.split()[0]) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[30, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'topics':>9}  {'streaming MB':>12}  {'list MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"catalog-{size}.jsonl")
+            write_jsonl(financial_records(size), path)
+            print(f"{size:>9}  {peak_rss_mb(path, 'stream', tmp):>12.1f}  {peak_rss_mb(path, 'list', tmp):>8.1f}")
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
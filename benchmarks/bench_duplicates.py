@@ -0,0 +1,76 @@
+"""Near-duplicate detection: MinHash/LSH versus exact pairwise Jaccard.
+
+The corpus is every app/blog page copied --copies times, with the copy
+number appended to each page's text so no two pages are identical. Pages
+of one generator share their component text, so with two or more copies
+the expected clusters are one per generator plus one per hand-written page
+(25 for the current tree). The exact column compares every pair of shingle
+sets, counting the near-duplicate pairs LSH should find, and is skipped
+above --pairwise-limit pages. Buckets over --max-bucket pages are skipped
+and reported, so large runs find fewer pairs than exist.
+
+    python -m benchmarks.bench_duplicates --copies 1 10 100
+"""
+
+import argparse
+import os
+import time
+
+from blog_pipeline.build import BLOG_DIR
+from blog_pipeline.components import COMPONENTS_DIR
+from blog_pipeline.duplicates import (MAX_BUCKET, THRESHOLD, ComponentText, find_clusters, near_duplicate_pairs,
+                                      page_text, shingles, signature)
+
+
+def pairwise(sets, threshold=THRESHOLD):
+    names = list(sets)
+    pairs = 0
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            if len(sets[a] & sets[b]) / len(sets[a] | sets[b]) >= threshold:
+                pairs += 1
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--pairwise-limit", type=int, default=1000)
+    parser.add_argument("--max-bucket", type=int, default=MAX_BUCKET)
+    args = parser.parse_args()
+
+    components = ComponentText(COMPONENTS_DIR)
+    texts = {}
+    for slug in sorted(os.listdir(BLOG_DIR)):
+        path = os.path.join(BLOG_DIR, slug, "page.tsx")
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                texts[slug] = page_text(f.read(), components)
+
+    print(f"{'pages':>6}  {'shingle s':>9}  {'minhash s':>9}  {'lsh s':>6}  {'clusters':>8}  {'lsh pairs':>9}  "
+          f"{'exact pairs':>11}  {'pairwise s':>10}")
+    for copies in args.copies:
+        start = time.perf_counter()
+        sets = {f"{slug}-{copy}": shingles(f"{text} copy {copy}") for copy in range(copies) for slug, text in texts.items()}
+        shingle_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        signatures = {name: signature(shingle_set) for name, shingle_set in sets.items()}
+        minhash_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        clusters = find_clusters(signatures, max_bucket=args.max_bucket)
+        lsh_time = time.perf_counter() - start
+        found = len(near_duplicate_pairs(signatures, max_bucket=args.max_bucket, log=lambda message: None))
+
+        exact = elapsed = "skipped"
+        if len(sets) <= args.pairwise_limit:
+            start = time.perf_counter()
+            exact = pairwise(sets)
+            elapsed = f"{time.perf_counter() - start:.2f}"
+        print(f"{len(sets):>6}  {shingle_time:>9.2f}  {minhash_time:>9.2f}  {lsh_time:>6.2f}  {len(clusters):>8}  "
+              f"{found:>9}  {exact:>11}  {elapsed:>10}")
+
+
+if __name__ == "__main__":
+    main()
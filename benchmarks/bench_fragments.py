@@ -0,0 +1,48 @@
+"""Per-page render time with and without the shared-fragment cache.
+
+"uncached" swaps in a FragmentCache with no slots, so every page renders
+its category fragment itself; "cached" is the default cache, cleared
+before the run so the first page of each category is a miss. Only the
+comprehensive generator keeps a fragment cache.
+
+    python -m benchmarks.bench_fragments --pages 10000
+"""
+
+import argparse
+import time
+
+from blog_pipeline import comprehensive
+from blog_pipeline.fragments import FragmentCache
+
+from .synthetic import comprehensive_records
+
+
+def per_page_us(module, records):
+    start = time.perf_counter()
+    for record in records:
+        module.render_page(record)
+    return (time.perf_counter() - start) / len(records) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10000)
+    args = parser.parse_args()
+
+    cases = [
+        ("comprehensive", comprehensive, list(comprehensive_records(args.pages))),
+    ]
+    print(f"{'generator':<14} {'uncached us/page':>16} {'cached us/page':>14} {'hit rate':>8} {'misses':>6}")
+    for name, module, records in cases:
+        module.render_page(records[0])
+        cache = module.FRAGMENTS
+        module.FRAGMENTS = FragmentCache(maxsize=0)
+        uncached = per_page_us(module, records)
+        module.FRAGMENTS = cache
+        cache.clear()
+        cached = per_page_us(module, records)
+        print(f"{name:<14} {uncached:>16.1f} {cached:>14.1f} {cache.hit_rate():>8.1%} {cache.misses:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Per-message intent routing: compiled Aho-Corasick table versus an includes() chain.
+
+The real catalog is padded with synthetic intents, three made-up keywords
+each, placed ahead of the real ones so a message reaches its answer only
+after the chain has tested them all. Messages are the passage benchmark's
+questions. "chain" is the old getFreeResponse shape: test each intent's
+keywords in priority order and stop at the first hit. Both sides run in
+Python here; the route runs the same walk in lib/intentRouter.ts.
+
+    python -m benchmarks.bench_intents --intents 10 100 1000 10000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from blog_pipeline.intents import compile_intents, exact_key, load_intents, route
+from blog_pipeline.profiling import percentile
+
+from .bench_passages import QUERIES
+
+
+def synthetic_intents(count, seed=0):
+    rng = random.Random(seed)
+    intents = []
+    for i in range(count):
+        keywords = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10))) for _ in range(3)]
+        intents.append({"name": f"synthetic-{i}", "priority": i, "keywords": keywords, "response": f"answer {i}"})
+    return intents
+
+
+def chain_route(intents, message):
+    lower = message.lower()
+    key = exact_key(message)
+    for index, intent in enumerate(intents):
+        if key in intent.get("exact", ()) or any(keyword in lower for keyword in intent.get("keywords", ())):
+            return index
+    return len(intents) - 1
+
+
+def latencies_us(router, messages, repeat):
+    samples = []
+    for _ in range(repeat):
+        for message in messages:
+            start = time.perf_counter()
+            router(message)
+            samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intents", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the message set")
+    args = parser.parse_args()
+
+    real = load_intents()
+    print(f"{'intents':>7}  {'states':>6}  {'compile ms':>10}  {'table p50 us':>12}  {'p95':>6}  "
+          f"{'chain p50 us':>12}  {'p95':>8}")
+    for count in args.intents:
+        intents = [dict(intent, priority=intent["priority"] + count) for intent in real]
+        intents = sorted(synthetic_intents(count) + intents, key=lambda intent: intent["priority"])
+        start = time.perf_counter()
+        table = compile_intents(intents)
+        compile_ms = (time.perf_counter() - start) * 1000
+        assert all(route(table, query) == chain_route(intents, query) for query in QUERIES), "table and chain disagree"
+        compiled = latencies_us(lambda message: route(table, message), QUERIES, args.repeat)
+        chained = latencies_us(lambda message: chain_route(intents, message), QUERIES, args.repeat)
+        print(f"{count + len(real):>7}  {len(table['goto']):>6}  {compile_ms:>10.1f}  "
+              f"{percentile(compiled, 0.5):>12.1f}  {percentile(compiled, 0.95):>6.1f}  "
+              f"{percentile(chained, 0.5):>12.1f}  {percentile(chained, 0.95):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
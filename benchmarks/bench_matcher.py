@@ -0,0 +1,67 @@
+"""Slug -> content_map key lookup: linear substring scan versus SlugMatcher.
+
+    python -m benchmarks.bench_matcher --keys 10 1000 100000
+"""
+
+import argparse
+import random
+import time
+
+from blog_pipeline.catalog import FINANCIAL_CATALOG, iter_catalog
+from blog_pipeline.matcher import SlugMatcher
+
+WORDS = [
+    "cash", "flow", "equity", "revenue", "expense", "asset", "liability", "margin", "profit", "income",
+    "tax", "payroll", "invoice", "ledger", "budget", "debt", "capital", "inventory", "dividend", "accrual",
+]
+
+
+def synthetic_keys(count, rng):
+    keys = set()
+    while len(keys) < count:
+        keys.add(f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{rng.randrange(count * 10)}")
+    return list(keys)
+
+
+def linear_match(keys, slug):
+    for key in keys:
+        if key in slug:
+            return key
+    return None
+
+
+def per_lookup_us(lookup, slugs, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for slug in slugs:
+            lookup(slug)
+    return (time.perf_counter() - start) / (repeat * len(slugs)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    real_slugs = [record["slug"] for record in iter_catalog(FINANCIAL_CATALOG)]
+    print(f"{'keys':>7}  {'build ms':>9}  {'linear us':>10}  {'matcher us':>10}")
+    for count in args.keys:
+        keys = synthetic_keys(count, rng)
+        # Half the slugs contain a key, half only miss.
+        slugs = [f"{rng.choice(real_slugs)}-{rng.choice(keys)}" for _ in range(16)] + rng.sample(real_slugs, 16)
+
+        start = time.perf_counter()
+        matcher = SlugMatcher(keys)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        repeat = max(1, args.lookups // len(slugs))
+        linear_repeat = max(1, repeat * 1000 // count)
+        linear = per_lookup_us(lambda slug: linear_match(keys, slug), slugs, linear_repeat)
+        compiled = per_lookup_us(matcher.match, slugs, repeat)
+        print(f"{count:>7}  {build_ms:>9.1f}  {linear:>10.1f}  {compiled:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Pages/sec of render_all with 1..N worker processes.
+
+    python -m benchmarks.bench_parallel --pages 20000 --max-workers 8
+"""
+
+import argparse
+import time
+
+from blog_pipeline import financial
+from blog_pipeline.parallel import DEFAULT_CHUNK_SIZE, default_workers, render_all
+
+from .synthetic import financial_records
+
+
+def run(pages, workers, chunk_size):
+    start = time.perf_counter()
+    rendered = sum(1 for _ in render_all(financial.render_page, financial_records(pages),
+                                         workers=workers, chunk_size=chunk_size))
+    return rendered / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--max-workers", type=int, default=default_workers())
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'workers':>7}  {'pages/sec':>10}  {'speedup':>7}")
+    for workers in range(1, args.max_workers + 1):
+        rate = run(args.pages, workers, args.chunk_size)
+        baseline = baseline or rate
+        print(f"{workers:>7}  {rate:>10.0f}  {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
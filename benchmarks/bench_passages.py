@@ -0,0 +1,84 @@
+"""Chat passage index: build cost and query latency over the whole corpus.
+
+The corpus is every app/blog page copied --copies times under new slugs.
+"warm" re-runs the update with nothing changed; "1% edit" rewrites one page
+in a hundred. Queries are timed through PassageIndex.search, the bm25()
+query the free tier's ranking mirrors.
+
+    python -m benchmarks.bench_passages --copies 1 10 100
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from blog_pipeline.backends import DiskBackend
+from blog_pipeline.build import BLOG_DIR
+from blog_pipeline.passages import PassageIndex
+from blog_pipeline.profiling import percentile
+
+QUERIES = [
+    "how do I track business expenses", "can I deduct my home office", "quarterly estimated taxes",
+    "cash flow problems", "llc or s corp", "late invoice payments", "depreciation of equipment",
+    "quickbooks alternatives for freelancers", "bank reconciliation", "payroll for my first employee",
+    "inventory costing for a bakery", "accounts receivable turnover", "profit margin", "budget",
+    "separate personal and business accounts", "receipts for the irs",
+]
+
+
+def copy_corpus(blog_dir, out_dir, copies):
+    slugs = sorted(name for name in os.listdir(blog_dir) if os.path.isfile(os.path.join(blog_dir, name, "page.tsx")))
+    for copy in range(copies):
+        for slug in slugs:
+            target = os.path.join(out_dir, f"{slug}-{copy}")
+            os.mkdir(target)
+            shutil.copyfile(os.path.join(blog_dir, slug, "page.tsx"), os.path.join(target, "page.tsx"))
+    return len(slugs) * copies
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the query set")
+    args = parser.parse_args()
+
+    print(f"{'pages':>6}  {'passages':>8}  {'cold s':>6}  {'warm s':>6}  {'1% edit s':>9}  {'db MB':>5}  "
+          f"{'p50 ms':>6}  {'p95 ms':>6}  {'max ms':>6}")
+    for copies in args.copies:
+        with tempfile.TemporaryDirectory() as tmp:
+            blog_dir = os.path.join(tmp, "blog")
+            os.mkdir(blog_dir)
+            pages = copy_corpus(BLOG_DIR, blog_dir, copies)
+            blog = DiskBackend(blog_dir)
+            db_path = os.path.join(tmp, "passages.sqlite")
+            with PassageIndex(db_path) as index:
+                cold = timed(lambda: index.update(blog))
+                warm = timed(lambda: index.update(blog))
+                for slug in sorted(os.listdir(blog_dir))[::100]:
+                    with open(os.path.join(blog_dir, slug, "page.tsx"), "a", encoding="utf-8") as f:
+                        f.write("\n")
+                edit = timed(lambda: index.update(blog))
+                passages = index.db.execute("SELECT count(*) FROM passages").fetchone()[0]
+
+                latencies = []
+                for _ in range(args.repeat):
+                    for query in QUERIES:
+                        start = time.perf_counter()
+                        index.search(query)
+                        latencies.append((time.perf_counter() - start) * 1000)
+            latencies.sort()
+            print(f"{pages:>6}  {passages:>8}  {cold:>6.2f}  {warm:>6.2f}  {edit:>9.2f}  "
+                  f"{os.path.getsize(db_path) / 1e6:>5.1f}  {percentile(latencies, 0.5):>6.2f}  "
+                  f"{percentile(latencies, 0.95):>6.2f}  {latencies[-1]:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
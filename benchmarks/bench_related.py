@@ -0,0 +1,46 @@
+"""Related-articles neighbour search: full build and incremental update.
+
+Synthetic catalogs repeat the real topics, so most terms sit in far more
+than MAX_POSTINGS topics; that is the capped, worst-case path. "1% edit"
+changes one topic in a hundred and reuses the cache from the full build.
+
+    python -m benchmarks.bench_related --topics 1000 10000 50000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from blog_pipeline import financial
+from blog_pipeline.related import related_posts
+
+from .synthetic import financial_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--topics", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'topics':>7}  {'full s':>7}  {'topics/s':>8}  {'1% edit s':>9}  {'recomputed':>10}")
+    for size in args.topics:
+        entries = [financial.index_entry(record) for record in financial_records(size)]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_file = os.path.join(tmp, "related.json")
+            start = time.perf_counter()
+            related_posts(entries, cache_file=cache_file, log=lambda message: None)
+            full = time.perf_counter() - start
+
+            for row in range(0, size, 100):
+                entries[row] = dict(entries[row], title=entries[row]["title"] + " (updated)")
+            messages = []
+            start = time.perf_counter()
+            related_posts(entries, cache_file=cache_file, log=messages.append)
+            edit = time.perf_counter() - start
+        recomputed = messages[0].split(": ")[1].split(" of ")[0] if messages else "0"
+        print(f"{size:>7}  {full:>7.2f}  {size / full:>8.0f}  {edit:>9.2f}  {recomputed:>10}")
+
+
+if __name__ == "__main__":
+    main()
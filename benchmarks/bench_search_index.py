@@ -0,0 +1,46 @@
+"""Build time and shard sizes of the client-side search index.
+
+Synthetic titles carry a unique "#N" suffix, so every post adds a term of
+its own; that is a worse dictionary than real content produces.
+
+    python -m benchmarks.bench_search_index --sizes 100 10000 100000
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from blog_pipeline import financial
+from blog_pipeline.blog_index import sort_posts
+from blog_pipeline.search_index import INDEX_NAME, build_search_files, shards_for_prefix
+
+from .synthetic import financial_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'posts':>7}  {'build s':>7}  {'index KB':>8}  {'shards':>6}  {'total MB':>8}  "
+          f"{'median KB':>9}  {'max KB':>6}  {'first query KB':>14}")
+    for size in args.sizes:
+        posts = sort_posts([financial.index_entry(record) for record in financial_records(size)])
+        start = time.perf_counter()
+        files = build_search_files(posts)
+        elapsed = time.perf_counter() - start
+
+        sizes = {name: len(content.encode("utf-8")) for name, content in files.items()}
+        shards = [value for name, value in sizes.items() if name != INDEX_NAME]
+        # index.json, the term shard(s) for "budget" and the docs shard for the top hit
+        index = json.loads(files[INDEX_NAME])
+        query = sizes[INDEX_NAME] + sizes[index["docs"][0]]
+        query += sum(sizes[index["terms"][i][1]] for i in shards_for_prefix(index["terms"], "budget"))
+        print(f"{size:>7}  {elapsed:>7.2f}  {sizes[INDEX_NAME] / 1024:>8.1f}  {len(shards):>6}  "
+              f"{sum(shards) / 1e6:>8.2f}  {statistics.median(shards) / 1024:>9.1f}  "
+              f"{max(shards) / 1024:>6.1f}  {query / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Per-page render time of the compiled page templates.
+
+Compares rendering through the compiled segment list against re-parsing the
+template for every page, for both generators.
+
+    python -m benchmarks.bench_template --pages 20000
+"""
+
+import argparse
+import time
+
+from blog_pipeline import comprehensive, financial
+from blog_pipeline.template import TEMPLATE_DIR, compile_template
+
+from .synthetic import comprehensive_records, financial_records
+
+
+def per_page_us(render, records):
+    start = time.perf_counter()
+    for record in records:
+        render(record)
+    return (time.perf_counter() - start) / len(records) * 1e6
+
+
+def uncompiled(module, template_name):
+    """The module's render with its template re-parsed on every call"""
+    with open(f"{TEMPLATE_DIR}/{template_name}", encoding="utf-8") as f:
+        source = f.read()
+    compiled = module.page_template
+
+    def render(record):
+        module.page_template = lambda: compile_template(source)
+        try:
+            return module.render_page(record)
+        finally:
+            module.page_template = compiled
+    return render
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10000)
+    args = parser.parse_args()
+
+    cases = [
+        ("financial", financial, "financial_concept.tsx.tmpl", list(financial_records(args.pages))),
+        ("comprehensive", comprehensive, "comprehensive.tsx.tmpl", list(comprehensive_records(args.pages))),
+    ]
+    print(f"{'generator':<14} {'compiled us/page':>17} {'parse-per-call us/page':>23}")
+    for name, module, template_name, records in cases:
+        compiled = per_page_us(module.render_page, records)
+        reparsed = per_page_us(uncompiled(module, template_name), records)
+        print(f"{name:<14} {compiled:>17.1f} {reparsed:>23.1f}")
+
+
+if __name__ == "__main__":
+    main()
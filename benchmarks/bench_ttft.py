@@ -0,0 +1,80 @@
+"""Time to first token, buffered versus streamed, against the Grok stub.
+
+Without --url the requests go straight to a benchmarks.grok_stub started in
+this process, which gives the floor the route can reach. With --url they go
+to a running app's /api/chat, itself pointed at the stub (see grok_stub),
+once with "stream": false (the reply is visible when the JSON arrives) and
+once with "stream": true (visible at the first server-sent event). The
+route needs a signed-in user; pass the session cookie with --header.
+
+    python -m benchmarks.bench_ttft
+    python -m benchmarks.bench_ttft --url http://localhost:3000/api/chat --header "Cookie: __session=..."
+"""
+
+import argparse
+import http.client
+import json
+import time
+from urllib.parse import urlsplit
+
+from blog_pipeline.profiling import percentile
+
+from .grok_stub import StubConfig, start_in_thread
+
+
+def request_body(url, stream):
+    if url.endswith("/api/chat"):
+        return {"message": "How should I think about cash flow?", "aiModel": "everyday", "stream": stream}
+    return {"model": "grok-stub", "messages": [{"role": "user", "content": "cash flow?"}], "stream": stream}
+
+
+def timed_request(url, stream, headers):
+    """(seconds to first token, seconds to the end of the reply)"""
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=120)
+    start = time.perf_counter()
+    connection.request("POST", parts.path, json.dumps(request_body(url, stream)),
+                       dict(headers, **{"Content-Type": "application/json"}))
+    response = connection.getresponse()
+    if response.status != 200:
+        raise SystemExit(f"{url}: HTTP {response.status} {response.read()[:200]!r}")
+    first = None
+    if stream:
+        while True:
+            line = response.readline()
+            if not line:
+                break
+            if first is None and line.startswith(b"data:") and line.strip() != b"data: [DONE]":
+                first = time.perf_counter() - start
+    else:
+        response.read()
+    total = time.perf_counter() - start
+    connection.close()
+    return (first if first is not None else total), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="/api/chat of a running app (default: the in-process stub directly)")
+    parser.add_argument("--header", action="append", default=[], metavar="'NAME: VALUE'")
+    parser.add_argument("--requests", type=int, default=10, help="requests per mode")
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--first-token-ms", type=float, default=400.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    url = args.url or start_in_thread(StubConfig(args.tokens, args.first_token_ms, args.token_ms))
+    headers = dict(header.split(":", 1) for header in args.header)
+    headers = {name.strip(): value.strip() for name, value in headers.items()}
+
+    print(f"{url}\n{'mode':<9} {'ttft p50 ms':>11} {'ttft p95 ms':>11} {'total p50 ms':>12}")
+    for mode, stream in (("buffered", False), ("streamed", True)):
+        samples = [timed_request(url, stream, headers) for _ in range(args.requests)]
+        firsts = sorted(first * 1000 for first, _ in samples)
+        totals = sorted(total * 1000 for _, total in samples)
+        print(f"{mode:<9} {percentile(firsts, 0.5):>11.0f} {percentile(firsts, 0.95):>11.0f} "
+              f"{percentile(totals, 0.5):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Local stand-in for the Grok chat-completions endpoint callGrokAPI posts to.
+
+Answers any POST with a canned bookkeeping reply of --tokens words. The
+wait for the first word and between words are drawn from --first-token-ms
+and --token-ms, each a latency distribution: a plain number of
+milliseconds, "uniform:LOW:HIGH", "normal:MEAN:SD", "lognormal:MEDIAN:SIGMA"
+or "exp:MEAN". With "stream": true in the request it sends OpenAI-style
+server-sent events, one per word, ending in `data: [DONE]`; otherwise it
+sends one JSON completion when the last word is ready.
+
+Failures are injected per request: --error-rate answers with one of
+--error-status instead, --disconnect-rate drops the connection halfway
+through the reply and --stall-rate never answers at all. Ctrl-C prints how
+many requests went each way. Point the app at it with
+
+    python -m benchmarks.grok_stub --port 8088 --first-token-ms lognormal:400:0.5 --error-rate 0.02
+    GROK_API_URL=http://127.0.0.1:8088/v1/chat/completions GROK_API_KEY=stub npm run dev
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+
+REPLY = ("Think of cash flow like water moving through pipes: money comes in from customers, "
+         "flows out to bills, and what is left is your buffer. ").split()
+STATUS_TEXT = {429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway",
+               503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+def latency(spec, rng=random):
+    """Sampler returning milliseconds for a latency spec, e.g. 400 or "lognormal:400:0.5" """
+    if isinstance(spec, (int, float)):
+        return lambda: float(spec)
+    kind, _, params = str(spec).partition(":")
+    try:
+        if not params:
+            value = float(kind)
+            return lambda: value
+        args = [float(param) for param in params.split(":")]
+        if kind == "uniform" and len(args) == 2:
+            return lambda: rng.uniform(*args)
+        if kind == "normal" and len(args) == 2:
+            return lambda: max(0.0, rng.gauss(*args))
+        if kind == "lognormal" and len(args) == 2 and args[0] > 0:
+            mu = math.log(args[0])
+            return lambda: rng.lognormvariate(mu, args[1])
+        if kind == "exp" and len(args) == 1 and args[0] > 0:
+            return lambda: rng.expovariate(1 / args[0])
+    except ValueError:
+        pass
+    raise ValueError(f"not a latency distribution: {spec!r}")
+
+
+def latency_spec(spec):
+    """argparse type: the spec itself, once it is known to parse"""
+    latency(spec)
+    return spec
+
+
+class StubConfig:
+    def __init__(self, tokens=200, first_token_ms=400.0, token_ms=20.0, error_rate=0.0,
+                 error_statuses=(500, 429, 503), disconnect_rate=0.0, stall_rate=0.0, seed=None):
+        self.rng = random.Random(seed)
+        self.tokens = tokens
+        self.first_token_ms = latency(first_token_ms, self.rng)
+        self.token_ms = latency(token_ms, self.rng)
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.disconnect_rate = disconnect_rate
+        self.stall_rate = stall_rate
+        self.outcomes = Counter()
+
+    def words(self):
+        return [REPLY[i % len(REPLY)] + " " for i in range(self.tokens)]
+
+    def outcome(self):
+        """What this request gets: 'ok', 'disconnect', 'stall' or an HTTP error status"""
+        draw = self.rng.random()
+        for outcome, rate in (("stall", self.stall_rate), ("disconnect", self.disconnect_rate)):
+            if draw < rate:
+                return outcome
+            draw -= rate
+        if draw < self.error_rate:
+            return self.rng.choice(self.error_statuses)
+        return "ok"
+
+
+async def read_request(reader):
+    """(method, path, headers, body) of one HTTP/1.1 request"""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    if not request_line:
+        return None
+    method, path, _ = request_line.split(" ", 2)
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return method, path, headers, body
+
+
+def completion(model, content):
+    return {
+        "id": f"stub-{time.time_ns()}",
+        "object": "chat.completion",
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+    }
+
+
+def chunk(model, content):
+    return {
+        "id": "stub",
+        "object": "chat.completion.chunk",
+        "model": model,
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+    }
+
+
+def json_response(status, payload):
+    body = json.dumps(payload).encode("utf-8")
+    return (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}\r\nContent-Type: application/json\r\n"
+            f"Connection: close\r\nContent-Length: {len(body)}\r\n\r\n").encode("ascii") + body
+
+
+async def respond(writer, config, request):
+    try:
+        payload = json.loads(request or b"{}")
+    except ValueError:
+        payload = {}
+    model = payload.get("model", "grok-stub")
+    words = config.words()
+    outcome = config.outcome()
+    config.outcomes[outcome] += 1
+    if outcome == "stall":
+        await asyncio.sleep(3600)
+        return
+    await asyncio.sleep(config.first_token_ms() / 1000)
+    if isinstance(outcome, int):
+        writer.write(json_response(outcome, {"error": {"message": f"stub: injected {outcome}", "code": outcome}}))
+        await writer.drain()
+        return
+    # A disconnect cuts the reply off halfway, before any [DONE] or complete JSON body
+    cut = len(words) // 2 if outcome == "disconnect" else None
+
+    if payload.get("stream"):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Connection: close\r\n\r\n")
+        for i, word in enumerate(words[:cut]):
+            if i:
+                await asyncio.sleep(config.token_ms() / 1000)
+            writer.write(f"data: {json.dumps(chunk(model, word))}\n\n".encode("utf-8"))
+            await writer.drain()
+        if cut is None:
+            writer.write(b"data: [DONE]\n\n")
+    else:
+        await asyncio.sleep(sum(config.token_ms() for _ in words[1:]) / 1000)
+        response = json_response(200, completion(model, "".join(words)))
+        writer.write(response[:len(response) // 2] if cut is not None else response)
+    await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8088, config=None):
+    config = config or StubConfig()
+
+    async def handle(reader, writer):
+        try:
+            request = await read_request(reader)
+            if request is not None:
+                await respond(writer, config, request[3])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+def start_in_thread(config):
+    """Run the stub on a free port in a daemon thread; returns its completions URL"""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(serve("127.0.0.1", 0, config))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    port = server.sockets[0].getsockname()[1]
+    return f"http://127.0.0.1:{port}/v1/chat/completions"
+
+
+def add_arguments(parser):
+    """The reply shape and failure options, shared with benchmarks.loadgen"""
+    parser.add_argument("--tokens", type=int, default=200, help="words per reply")
+    parser.add_argument("--first-token-ms", type=latency_spec, default="400", metavar="DIST",
+                        help="wait before the first word (default: 400)")
+    parser.add_argument("--token-ms", type=latency_spec, default="20", metavar="DIST",
+                        help="wait between words (default: 20)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", default="500,429,503", help="statuses the errors are drawn from")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="share of replies cut off halfway")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="share of requests never answered")
+    parser.add_argument("--seed", type=int, help="seed for the latency and failure draws")
+
+
+def config_from_args(args):
+    return StubConfig(args.tokens, args.first_token_ms, args.token_ms, args.error_rate,
+                      [int(status) for status in args.error_status.split(",")],
+                      args.disconnect_rate, args.stall_rate, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    add_arguments(parser)
+    args = parser.parse_args()
+    config = config_from_args(args)
+
+    async def run():
+        server = await serve(args.host, args.port, config)
+        print(f"Grok stub on http://{args.host}:{args.port}/v1/chat/completions")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    print(", ".join(f"{outcome}: {count}" for outcome, count in sorted(config.outcomes.items(), key=str)))
+
+
+if __name__ == "__main__":
+    main()
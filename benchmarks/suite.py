@@ -0,0 +1,139 @@
+"""End-to-end benchmark of both generators against a saved baseline.
+
+Every (generator, size) case writes a synthetic catalog and runs it through
+blog_pipeline.cli.run, the same entry point as the command line, in a fresh
+interpreter, so peak RSS belongs to that case alone. Everything the run
+writes (pages, components, blog index, search index, sitemap, passages)
+goes to a scratch directory, and every stage the command line runs is in
+the timing. Render time comes from the run's own profile. With --backend
+memory pages are kept in a MemoryBackend and never written to disk.
+
+    python -m benchmarks.suite --save             # record benchmarks/baseline.json
+    python -m benchmarks.suite --threshold 0.15   # compare, exit 1 on regression
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from blog_pipeline.backends import DiskBackend, MemoryBackend
+from blog_pipeline.build import page_name
+from blog_pipeline.cli import run
+
+from .synthetic import comprehensive_records, financial_records, write_jsonl
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+GENERATORS = {
+    "financial": ("blog_pipeline.financial", financial_records),
+    "comprehensive": ("blog_pipeline.comprehensive", comprehensive_records),
+}
+SIZES = [100, 10000, 100000]
+# metric -> +1 if larger is better, -1 if smaller is better
+COMPARED = {"pages_per_sec": 1, "peak_rss_mb": -1, "output_bytes": -1}
+
+
+def run_case(generator, size, out_dir, backend="disk"):
+    module_name, records = GENERATORS[generator]
+    catalog = os.path.join(out_dir, "catalog.jsonl")
+    write_jsonl(records(size), catalog)
+    blog_dir = os.path.join(out_dir, "blog")
+    profile_path = os.path.join(out_dir, "profile.json")
+    argv = [
+        "--catalog", catalog, "--out", blog_dir, "--components", os.path.join(out_dir, "components"),
+        "--index", os.path.join(out_dir, "blog-index"), "--search", os.path.join(out_dir, "search"),
+        "--passages", os.path.join(out_dir, "data", "chat-passages.json"), "--public", os.path.join(out_dir, "public"),
+        "--profile-json", profile_path,
+    ]
+    pages = MemoryBackend() if backend == "memory" else DiskBackend(blog_dir)
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        report = run(importlib.import_module(module_name), argv, backend=pages if backend == "memory" else None)
+    total = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    with open(profile_path, encoding="utf-8") as f:
+        stages = {name: row["total_s"] for name, row in json.load(f).items() if name != "page"}
+    return {
+        "pages": len(report.rebuilt),
+        "render_s": round(stages.get("render", 0.0), 4),
+        "total_s": round(total, 4),
+        "stages_s": {name: round(seconds, 4) for name, seconds in stages.items()},
+        "pages_per_sec": round(len(report.rebuilt) / total, 1),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "output_bytes": sum(len(pages.read(page_name(slug)).encode("utf-8")) for slug in pages.pages()),
+    }
+
+
+def measure(generator, size, backend):
+    with tempfile.TemporaryDirectory() as tmp:
+        out = subprocess.run([sys.executable, "-m", "benchmarks.suite", "--case", generator, str(size), tmp, backend],
+                             cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def regressions(results, baseline, threshold):
+    for case, metrics in results.items():
+        previous = baseline.get(case)
+        if previous is None:
+            continue
+        for metric, direction in COMPARED.items():
+            old, new = previous[metric], metrics[metric]
+            if old and direction * (new - old) / old < -threshold:
+                yield f"{case} {metric}: {old} -> {new} ({(new - old) / old:+.1%})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--backend", choices=["disk", "memory"], default="disk")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="fractional slowdown or growth that counts as a regression (default: 0.10)")
+    parser.add_argument("--case", nargs=4, metavar=("GENERATOR", "SIZE", "OUT_DIR", "BACKEND"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        generator, size, out_dir, backend = args.case
+        print(json.dumps(run_case(generator, int(size), out_dir, backend)))
+        return
+
+    results = {}
+    print(f"{'case':>28}  {'render s':>9}  {'total s':>8}  {'pages/sec':>9}  {'peak MB':>8}  {'bytes':>12}")
+    for generator in args.generators:
+        for size in args.sizes:
+            case = f"{generator}:{size}" + (":memory" if args.backend == "memory" else "")
+            metrics = results[case] = measure(generator, size, args.backend)
+            print(f"{case:>28}  {metrics['render_s']:>9.3f}  {metrics['total_s']:>8.3f}  "
+                  f"{metrics['pages_per_sec']:>9.0f}  {metrics['peak_rss_mb']:>8.1f}  {metrics['output_bytes']:>12,}")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save to record one")
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    failed = list(regressions(results, baseline, args.threshold))
+    if failed:
+        print(f"\nRegressions beyond {args.threshold:.0%}:\n" + "\n".join(f"  {line}" for line in failed))
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Synthetic topic catalogs built by cycling the real catalog entries."""
+
+import json
+from itertools import cycle, islice
+
+from blog_pipeline.catalog import COMPREHENSIVE_CATALOG, FINANCIAL_CATALOG, iter_catalog
+
+
+def _cycled(path, count):
+    for i, record in enumerate(islice(cycle(list(iter_catalog(path))), count)):
+        yield dict(record, slug=f"{record['slug']}-{i}", title=f"{record['title']} #{i}")
+
+
+def financial_records(count):
+    return _cycled(FINANCIAL_CATALOG, count)
+
+
+def comprehensive_records(count):
+    return _cycled(COMPREHENSIVE_CATALOG, count)
+
+
+def write_jsonl(records, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
@@ -0,0 +1,12 @@
+"""Shared build tooling for the generated blog pages under app/blog.
+
+Each generator is a module with a pure `render_page(topic)` and a
+`build(catalog, backend)` that renders a whole catalog:
+
+    from blog_pipeline import financial
+    source = financial.render_page({"slug": ..., "title": ..., "description": ..., "keywords": [...]})
+
+Importing the package or a generator reads and writes nothing; templates
+are loaded on first render. `python -m blog_pipeline <generator>` is the
+command line (see blog_pipeline.cli).
+"""
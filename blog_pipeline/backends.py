@@ -0,0 +1,270 @@
+"""Where build_pages puts rendered pages.
+
+A backend takes paths relative to its root ("<slug>/page.tsx"):
+
+    DiskBackend     files under a directory, replaced atomically, unchanged files untouched
+    MemoryBackend   a dict, for tests and benchmarks
+    ArchiveBackend  one .tar, .tar.gz or .zip, streamed as pages arrive
+
+The disk backend keeps its build manifest beside the pages and the memory
+backend for its own lifetime; an archive starts empty on every run. The
+disk and memory backends can read their pages back, which is how the blog
+index, sitemap and passage index see what a run built. build_pages stages
+every page and commits them together once the whole run has rendered (and
+validated), so a failed run leaves the existing pages as they were.
+"""
+
+import io
+import os
+import time
+
+from .manifest import MANIFEST_NAME, BuildManifest
+
+
+def stage_if_changed(file_path, content):
+    """Write content to a temp file beside file_path unless the file already holds it; returns the temp path or None"""
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            if f.read() == content:
+                return None
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def write_if_changed(file_path, content):
+    """Write content unless the file already holds exactly it, so untouched pages keep their mtime.
+
+    The new content goes to a temp file in the same directory and is renamed
+    over the old one, so readers never see a half-written file.
+    """
+    tmp_path = stage_if_changed(file_path, content)
+    if tmp_path is None:
+        return False
+    os.replace(tmp_path, file_path)
+    return True
+
+
+class Backend:
+    """Base class; `write` returns True when it stored new content."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, name):
+        """Human-readable location of a page, for log lines"""
+        raise NotImplementedError
+
+    def manifest(self):
+        """The build manifest to check pages against; by default an empty one, so everything is rebuilt"""
+        return BuildManifest(None)
+
+    def exists(self, name):
+        raise NotImplementedError
+
+    def read(self, name):
+        """Committed content of `name`, or None if there is none"""
+        raise NotImplementedError
+
+    def pages(self):
+        """Sorted slugs that have a committed <slug>/page.tsx"""
+        raise NotImplementedError
+
+    def prepare(self, name):
+        """Create whatever must exist before `name` is written"""
+
+    def write(self, name, content):
+        raise NotImplementedError
+
+    def stage(self, name, content):
+        """Like write, but the page need only become visible on commit()"""
+        return self.write(name, content)
+
+    def commit(self):
+        pass
+
+    def abort(self):
+        """Drop everything staged since the last commit"""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class DiskBackend(Backend):
+    """Files under root. With prepared=True the caller has already created
+    every page directory (see blog_pipeline.planner), so prepare() is skipped."""
+
+    def __init__(self, root, prepared=False):
+        super().__init__(root)
+        self.prepared = prepared
+        self.staged = []
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def manifest(self):
+        return BuildManifest(self.path(MANIFEST_NAME))
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def read(self, name):
+        try:
+            with open(self.path(name), encoding="utf-8") as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def pages(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(slug for slug in os.listdir(self.root) if os.path.isfile(self.path(f"{slug}/page.tsx")))
+
+    def prepare(self, name):
+        if not self.prepared:
+            os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+
+    def write(self, name, content):
+        return write_if_changed(self.path(name), content)
+
+    def stage(self, name, content):
+        tmp_path = stage_if_changed(self.path(name), content)
+        if tmp_path is None:
+            return False
+        self.staged.append((tmp_path, self.path(name)))
+        return True
+
+    def commit(self):
+        for tmp_path, file_path in self.staged:
+            os.replace(tmp_path, file_path)
+        self.staged = []
+
+    def abort(self):
+        # After a commit that failed part way, the pages it got to are already in place
+        for tmp_path, _ in self.staged:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.staged = []
+
+
+class MemoryBackend(Backend):
+    def __init__(self, root="memory:"):
+        super().__init__(root)
+        self.files = {}
+        self.staged = {}
+        self.build_manifest = BuildManifest(None)
+
+    def path(self, name):
+        return f"{self.root}{name}"
+
+    def manifest(self):
+        return self.build_manifest
+
+    def exists(self, name):
+        return name in self.files
+
+    def read(self, name):
+        return self.files.get(name)
+
+    def pages(self):
+        return sorted(name.removesuffix("/page.tsx") for name in self.files if name.endswith("/page.tsx"))
+
+    def write(self, name, content):
+        if self.files.get(name) == content:
+            return False
+        self.files[name] = content
+        return True
+
+    def stage(self, name, content):
+        if self.files.get(name) == content:
+            return False
+        self.staged[name] = content
+        return True
+
+    def commit(self):
+        self.files.update(self.staged)
+        self.staged = {}
+
+    def abort(self):
+        self.staged = {}
+
+
+class ArchiveBackend(Backend):
+    """Streams pages into an archive chosen by extension (.zip, .tar, .tar.gz or .tgz).
+
+    Members are stored under `prefix` (app/blog by default) so the archive
+    unpacks into place at the repository root. Pages are streamed straight
+    into the archive, so abort() deletes the archive file.
+    """
+
+    def __init__(self, root, prefix="app/blog"):
+        super().__init__(root)
+        self.prefix = prefix.strip("/")
+        self.names = set()
+        self.mtime = int(os.environ.get("SOURCE_DATE_EPOCH", time.time()))
+        # tarfile and zipfile are imported here so importing the backends stays cheap
+        import tarfile
+        import zipfile
+
+        self.zip = root.endswith(".zip")
+        self.streams = []  # under a .tar.gz, closed after the archive
+        if self.zip:
+            self.archive = zipfile.ZipFile(root, "w", compression=zipfile.ZIP_DEFLATED)
+        elif root.endswith((".tar.gz", ".tgz")):
+            import gzip
+
+            # The gzip header holds a file name and timestamp too; pin both so equal pages give equal bytes
+            f = open(root, "wb")
+            self.streams = [gzip.GzipFile(filename="", mode="wb", fileobj=f, mtime=self.mtime), f]
+            self.archive = tarfile.open(mode="w|", fileobj=self.streams[0])
+        else:
+            self.archive = tarfile.open(root, "w|")
+
+    def path(self, name):
+        return f"{self.root}:{self.member(name)}"
+
+    def member(self, name):
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def exists(self, name):
+        return name in self.names
+
+    def write(self, name, content):
+        import tarfile
+        import zipfile
+
+        data = content.encode("utf-8")
+        if self.zip:
+            info = zipfile.ZipInfo(self.member(name), date_time=time.gmtime(max(self.mtime, 315532800))[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self.archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(self.member(name))
+            info.size = len(data)
+            info.mtime = self.mtime
+            self.archive.addfile(info, io.BytesIO(data))
+        self.names.add(name)
+        return True
+
+    def abort(self):
+        self.close()
+        os.remove(self.root)
+
+    def close(self):
+        self.archive.close()
+        for stream in self.streams:
+            stream.close()
@@ -0,0 +1,69 @@
+"""Paginated data for the /blog index page.
+
+Index cards come from two places: the build manifest, where each generator
+stores the card for every page it renders, and the catalog of hand-written
+posts. They are sorted newest first and written as fixed-size JSON shards
+under data/blog-index/, so a listing page only loads its own shard.
+"""
+
+import glob
+import json
+import os
+
+from .backends import write_if_changed
+from .catalog import HANDWRITTEN_CATALOG, iter_catalog
+
+INDEX_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data", "blog-index"))
+PAGE_SIZE = 12
+CARD_FIELDS = ("slug", "title", "excerpt", "date", "readTime", "icon", "category")
+
+ICONS_MODULE = """// Generated by blog_pipeline.blog_index from the icons the blog index uses.
+import {{ {names} }} from 'lucide-react'
+import type {{ LucideIcon }} from 'lucide-react'
+
+export const blogIcons: Record<string, LucideIcon> = {{ {names} }}
+"""
+
+
+def index_entries(backend, handwritten=HANDWRITTEN_CATALOG):
+    """Cards for every generated page recorded in the backend's manifest plus every hand-written post"""
+    entries = {slug: entry["index"] for slug, entry in backend.manifest().pages.items() if "index" in entry}
+    for record in iter_catalog(handwritten):
+        entries.setdefault(record["slug"], record)
+    return entries.values()
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def sort_posts(entries):
+    """Newest first, ties by slug: the order of the index pages and the search index's post ids"""
+    posts = sorted(entries, key=lambda entry: entry["slug"])
+    posts.sort(key=lambda entry: entry["date"], reverse=True)
+    return posts
+
+
+def write_blog_index(entries, out_dir=INDEX_DIR, page_size=PAGE_SIZE, log=print):
+    posts = sort_posts(entries)
+    featured = [post for post in posts if post.get("featured")]
+    cards = [{field: post[field] for field in CARD_FIELDS} for post in posts]
+    pages = [cards[start:start + page_size] for start in range(0, len(cards), page_size)] or [[]]
+
+    files = {
+        "meta.json": _dump({"pageSize": page_size, "totalPosts": len(cards), "totalPages": len(pages)}),
+        "featured.json": _dump([{field: post[field] for field in CARD_FIELDS} for post in featured]),
+        "icons.ts": ICONS_MODULE.format(names=", ".join(sorted({post["icon"] for post in posts}))),
+    }
+    for number, shard in enumerate(pages, 1):
+        files[f"page-{number}.json"] = _dump(shard)
+
+    for name, content in files.items():
+        file_path = os.path.join(out_dir, name)
+        if write_if_changed(file_path, content):
+            log(f"Created: {file_path}")
+    for stale in glob.glob(os.path.join(out_dir, "page-*.json")):
+        if os.path.basename(stale) not in files:
+            os.remove(stale)
+            log(f"Removed: {stale}")
+    return len(pages)
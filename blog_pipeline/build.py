@@ -0,0 +1,178 @@
+"""Incremental render/write loop shared by the blog generators."""
+
+import os
+import time
+
+from functools import partial
+
+from .backends import DiskBackend
+from .catalog import DuplicateSlugError, check_slugs, iter_catalog
+from .manifest import record_hash
+from .parallel import DEFAULT_CHUNK_SIZE, render_all
+from .profiling import NULL_PROFILER
+from .related import related_posts
+from .validate import PageValidationError, render_checked
+
+BLOG_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "app", "blog"))
+
+
+class BuildReport:
+    def __init__(self):
+        self.rebuilt = []
+        self.skipped = 0
+        self.orphaned = []
+
+    def __str__(self):
+        summary = f"{len(self.rebuilt)} rebuilt, {self.skipped} skipped, {len(self.orphaned)} orphaned"
+        if self.orphaned:
+            summary += "\nOrphaned pages (no longer in the catalog):\n" + "\n".join(f"  {slug}" for slug in self.orphaned)
+        return summary
+
+
+def page_name(slug):
+    return f"{slug}/page.tsx"
+
+
+def page_path(out_dir, slug):
+    return os.path.join(out_dir, page_name(slug))
+
+
+def build_pages(generator, records, render, template_version, out_dir=BLOG_DIR, force=False, workers=1,
+                chunk_size=DEFAULT_CHUNK_SIZE, index_entry=None, profiler=NULL_PROFILER, backend=None,
+                validate=False, log=print):
+    """Render and write every record whose hash or template version changed since the last run.
+
+    `records` yields dicts with at least a "slug" key; `render` turns one record
+    into page source. With `workers` > 1 rendering happens in a process pool
+    while writes stay in this process, in catalog order. Pages this generator
+    produced earlier whose slug is gone from the catalog are reported as
+    orphaned but left on disk. `index_entry`, if given, maps a record to its
+    blog index card, which is kept in the manifest for write_blog_index.
+    `profiler` (see blog_pipeline.profiling) receives a sample per stage.
+    `backend` (see blog_pipeline.backends) defaults to a DiskBackend on out_dir.
+
+    Pages are staged and only committed once every record has rendered. With
+    `validate`, each page is also checked by blog_pipeline.validate in the
+    render step (so in the pool when there is one); if any page fails, the
+    staged pages are discarded and PageValidationError is raised. Any other
+    error before the commit (DuplicateSlugError for a slug that appears
+    twice, a render or write failure) discards them too.
+    """
+    backend = backend or DiskBackend(out_dir)
+    manifest = backend.manifest()
+    report = BuildReport()
+    seen = set()
+    digests = {}
+    records = iter(records)
+
+    def stale():
+        while True:
+            with profiler.stage("lookup"):
+                record = next(records, None)
+            if record is None:
+                return
+            slug = record["slug"]
+            if slug in seen:
+                raise DuplicateSlugError(f"{generator}: duplicate slug {slug!r}; every topic needs its own")
+            seen.add(slug)
+            with profiler.stage("check"):
+                digest = record_hash(record)
+                fresh = (not force and manifest.is_fresh(slug, generator, digest, template_version)
+                         and backend.exists(page_name(slug)))
+            if fresh:
+                report.skipped += 1
+                continue
+            digests[slug] = digest
+            yield record
+
+    # Worker processes cannot report back into the profiler, so with a pool
+    # the time spent waiting on results (lookup and check included) is
+    # recorded instead of render.
+    if workers == 1:
+        render = profiler.timed("render", render)
+        wait = NULL_PROFILER.stage
+    else:
+        wait = profiler.stage
+    if validate:
+        render = partial(render_checked, render)
+    rendered = render_all(render, stale(), workers=workers, chunk_size=chunk_size)
+    written = []
+    failures = []
+    page_start = time.perf_counter_ns()
+    # Whatever stops the build before commit (a duplicate slug, a render or
+    # write error, an interrupt) discards the staged pages
+    committed = False
+    try:
+        while True:
+            with wait("render_wait"):
+                item = next(rendered, None)
+            if item is None:
+                break
+            record, content = item
+            slug = record["slug"]
+            name = page_name(slug)
+            if validate:
+                content, errors = content
+                if errors:
+                    failures.append((slug, errors))
+                    continue
+            if failures:
+                continue
+            with profiler.stage("makedirs"):
+                backend.prepare(name)
+            with profiler.stage("write"):
+                if backend.stage(name, content):
+                    written.append(name)
+            index = index_entry(record) if index_entry else None
+            manifest.update(slug, generator, digests.pop(slug), template_version, index=index)
+            report.rebuilt.append(slug)
+            now = time.perf_counter_ns()
+            profiler.add("page", now - page_start)
+            page_start = now
+
+        if failures:
+            raise PageValidationError(failures)
+        with profiler.stage("commit"):
+            backend.commit()
+        committed = True
+    finally:
+        if not committed:
+            backend.abort()
+            rendered.close()
+    for name in written:
+        log(f"Created: {backend.path(name)}")
+
+    for slug in sorted(manifest.owned_by(generator)):
+        if slug in seen:
+            continue
+        if backend.exists(page_name(slug)):
+            report.orphaned.append(slug)
+        else:
+            manifest.forget(slug)
+
+    with profiler.stage("manifest"):
+        manifest.save()
+    return report
+
+
+def build_catalog(generator, catalog, render, index_entry, template_version, related_cache=None,
+                  force=False, profiler=NULL_PROFILER, log=print, **options):
+    """build_pages over a catalog file or a list of topic records, each given its related-articles links.
+
+    `catalog` is read twice, once for the related-articles pass and once to
+    render, so a path is streamed each time but other iterables must be
+    reusable. Neither pass holds the records, but the related pass keeps
+    each topic's slug, title and TF-IDF vector and postings: about 5 KB a
+    topic at its peak, freed before rendering starts. `related_cache` is the blog_pipeline.related cache file, or
+    None to compute every list afresh. Other options go to build_pages.
+    """
+    def topics():
+        if isinstance(catalog, (str, os.PathLike)):
+            return iter_catalog(os.fspath(catalog))
+        return check_slugs(catalog, generator)
+
+    with profiler.stage("related"):
+        related = related_posts((index_entry(topic) for topic in topics()), cache_file=related_cache, force=force,
+                                log=log)
+    return build_pages(generator, (dict(topic, related=related[topic["slug"]]) for topic in topics()), render,
+                       template_version, force=force, index_entry=index_entry, profiler=profiler, log=log, **options)
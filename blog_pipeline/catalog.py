@@ -0,0 +1,85 @@
+"""Streaming topic catalog readers.
+
+Catalogs are JSONL (one topic object per line) or CSV with a header row.
+CSV rows are typed like the JSONL records they stand for: the `keywords`
+column holds the keywords separated by `|`, flag columns such as
+`featured` hold true/false, and a blank cell means the field is absent.
+Both readers are generators, so a render/write loop that consumes them
+only ever holds one record in memory (plus the set of slugs seen, since
+two topics with one slug would write the same page).
+"""
+
+import csv
+import json
+import os
+
+CATALOG_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "catalogs"))
+FINANCIAL_CATALOG = os.path.join(CATALOG_DIR, "financial_concepts.jsonl")
+COMPREHENSIVE_CATALOG = os.path.join(CATALOG_DIR, "comprehensive.jsonl")
+# Index cards for the hand-written posts no generator produces
+HANDWRITTEN_CATALOG = os.path.join(CATALOG_DIR, "handwritten_posts.jsonl")
+
+KEYWORD_SEPARATOR = "|"
+BOOLEAN_FIELDS = ("featured",)
+BOOLEANS = {"true": True, "yes": True, "1": True, "false": False, "no": False, "0": False}
+
+
+class DuplicateSlugError(ValueError):
+    pass
+
+
+def check_slugs(records, source):
+    """Pass records through, raising DuplicateSlugError on the first slug seen twice"""
+    seen = set()
+    for record in records:
+        slug = record["slug"]
+        if slug in seen:
+            raise DuplicateSlugError(f"{source}: duplicate slug {slug!r}; every topic needs its own")
+        seen.add(slug)
+        yield record
+
+
+def iter_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from None
+
+
+def csv_record(row, where):
+    record = {}
+    for key, value in row.items():
+        value = value or ""
+        if key == "keywords":
+            record[key] = [k.strip() for k in value.split(KEYWORD_SEPARATOR) if k.strip()]
+        elif not value.strip():
+            continue
+        elif key in BOOLEAN_FIELDS:
+            try:
+                record[key] = BOOLEANS[value.strip().lower()]
+            except KeyError:
+                raise ValueError(f"{where}: {key} must be true or false, not {value!r}") from None
+        else:
+            record[key] = value
+    return record
+
+
+def iter_csv(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield csv_record(row, f"{path}:{reader.line_num}")
+
+
+def iter_catalog(path):
+    """Yield topic records from a .jsonl or .csv catalog; slugs must be unique"""
+    if path.endswith(".jsonl"):
+        return check_slugs(iter_jsonl(path), path)
+    if path.endswith(".csv"):
+        return check_slugs(iter_csv(path), path)
+    raise ValueError(f"Unsupported catalog format: {path} (expected .jsonl or .csv)")
@@ -0,0 +1,115 @@
+"""Command line for the blog generators.
+
+    python -m blog_pipeline financial [--force] [-j N] ...
+    python -m blog_pipeline comprehensive --archive pages.tar.gz
+
+generate_financial_blogs.py and generate_comprehensive_blogs.py at the
+repository root run the same command for one generator.
+"""
+
+import argparse
+import importlib
+
+from .backends import ArchiveBackend, DiskBackend
+from .blog_index import INDEX_DIR, index_entries, sort_posts, write_blog_index
+from .build import BLOG_DIR
+from .catalog import iter_catalog
+from .components import COMPONENTS_DIR, emit_components
+from .parallel import default_workers
+from .passages import EXPORT_PATH, update_passages
+from .planner import plan_directories
+from .profiling import NULL_PROFILER, add_profile_arguments, profile_from_args
+from .related import cache_path
+from .search_index import SEARCH_DIR, write_search_index
+from .sitemap import PUBLIC_DIR, write_sitemaps
+from .validate import PageValidationError
+
+GENERATORS = {
+    "financial": "blog_pipeline.financial",
+    "comprehensive": "blog_pipeline.comprehensive",
+}
+
+
+def run(generator, argv=None, backend=None):
+    """Build one generator's pages, then the blog index, search index, sitemap and chat passages; returns the BuildReport
+
+    A `backend` (see blog_pipeline.backends) replaces --out and --archive; the
+    later stages read the pages back from it. benchmarks.suite passes a
+    MemoryBackend to time the whole run without writing pages to disk.
+    """
+    parser = argparse.ArgumentParser(description=generator.DESCRIPTION)
+    parser.add_argument("--catalog", default=generator.CATALOG, help="topic catalog (.jsonl or .csv)")
+    parser.add_argument("--out", default=BLOG_DIR, help="blog output directory (default: app/blog)")
+    parser.add_argument("--components", default=COMPONENTS_DIR,
+                        help="shared blog component directory (default: components/blog)")
+    parser.add_argument("--index", default=INDEX_DIR, help="blog index data directory (default: data/blog-index)")
+    parser.add_argument("--search", default=SEARCH_DIR, help="search index directory (default: public/search)")
+    parser.add_argument("--passages", default=EXPORT_PATH,
+                        help="chat passage index export; the SQLite index sits beside it (default: data/chat-passages.json)")
+    parser.add_argument("--public", default=PUBLIC_DIR, help="directory for sitemap.xml and its shards (default: public)")
+    parser.add_argument("--archive", metavar="FILE",
+                        help="write pages into one .tar, .tar.gz or .zip instead of --out (skips the indexes and sitemap)")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every page and related-articles list, ignoring the build manifest and cache")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="skip the structural check of rendered pages (see blog_pipeline.validate)")
+    if generator.FRAGMENTS is not None:
+        parser.add_argument("--fragment-cache", metavar="FILE",
+                            help="keep the shared page fragments in FILE between runs (see blog_pipeline.fragments)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help=f"render in N worker processes (this machine has {default_workers()})")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profile_from_args(args) as profiler:
+        with profiler.stage("components"):
+            emit_components(generator.COMPONENTS, generator.component_values(), out_dir=args.components)
+        if getattr(args, "fragment_cache", None):
+            generator.FRAGMENTS.load(args.fragment_cache, generator.template_version())
+        plan = None
+        if backend is None and args.archive:
+            backend = ArchiveBackend(args.archive)
+        elif backend is None:
+            with profiler.stage("plan"):
+                plan = plan_directories(args.out, (topic["slug"] for topic in iter_catalog(args.catalog)))
+                plan.execute()
+            backend = DiskBackend(args.out, prepared=True)
+        try:
+            report = generator.build(
+                args.catalog, backend, out_dir=args.out,
+                related_cache=cache_path(args.out, generator.NAME) if isinstance(backend, DiskBackend) else None,
+                force=args.force, workers=args.workers, validate=not args.no_validate, profiler=profiler,
+            )
+        except PageValidationError as e:
+            raise SystemExit(f"Nothing written: {e}")
+        if generator.FRAGMENTS is not None:
+            generator.FRAGMENTS.save()
+        if isinstance(backend, ArchiveBackend):
+            backend.close()
+        else:
+            with profiler.stage("index"):
+                posts = sort_posts(index_entries(backend))
+                write_blog_index(posts, out_dir=args.index)
+            with profiler.stage("search"):
+                write_search_index(posts, out_dir=args.search)
+            with profiler.stage("sitemap"):
+                write_sitemaps(posts, public_dir=args.public, backend=backend)
+            with profiler.stage("passages"):
+                update_passages(backend, export_path=args.passages)
+    print(f"\n{generator.LABEL}: {report}")
+    if generator.FRAGMENTS is not None and args.workers == 1 and report.rebuilt:
+        print(f"Fragment cache: {generator.FRAGMENTS}")
+    if plan:
+        print(plan)
+    if profiler is not NULL_PROFILER:
+        print(f"\n{profiler.format()}")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the blog pages of one generator",
+                                     epilog="Run `python -m blog_pipeline <generator> --help` for its options.")
+    parser.add_argument("generator", choices=GENERATORS)
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="options for the generator")
+    args = parser.parse_args(argv)
+    run(importlib.import_module(GENERATORS[args.generator]), args.args)
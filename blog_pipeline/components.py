@@ -0,0 +1,17 @@
+"""The shared blog component library the generated pages render through."""
+
+import os
+
+from .backends import write_if_changed
+from .template import load_template
+
+COMPONENTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "components", "blog"))
+
+
+def emit_components(names, values=None, out_dir=COMPONENTS_DIR, log=print):
+    """Write components/blog/<name> from templates/components/<name>.tmpl, skipping unchanged files"""
+    for name in names:
+        template = load_template(os.path.join("components", f"{name}.tmpl"))
+        file_path = os.path.join(out_dir, name)
+        if write_if_changed(file_path, template.render(values or {})):
+            log(f"Created: {file_path}")
@@ -0,0 +1,129 @@
+"""Comprehensive pages: long-form bookkeeping and metrics articles, one intro per category.
+
+Importing this module reads no files; the page template is loaded on
+first use and kept for the life of the process, and each category's intro
+is escaped once into FRAGMENTS.
+"""
+
+import functools
+
+from .build import BLOG_DIR, build_catalog
+from .catalog import COMPREHENSIVE_CATALOG
+from .fragments import FragmentCache
+from .manifest import version_hash
+from .profiling import NULL_PROFILER
+from .template import load_template
+from .tsx import ts_block, ts_fields, ts_literal
+
+NAME = "comprehensive"
+LABEL = "Comprehensive blogs"
+DESCRIPTION = "Generate the comprehensive bookkeeping and metrics blog pages"
+CATALOG = COMPREHENSIVE_CATALOG
+
+# Varied intro paragraphs by category; only the one a page needs gets formatted
+INTROS = {
+    "Software Reviews": "In today's digital landscape, the right software can transform how small businesses manage their finances. {description} This comprehensive guide explores the features, benefits, and implementation strategies that make modern bookkeeping software essential for business success.",
+    "How-To Guides": "Setting up proper financial systems doesn't have to be overwhelming. {description} This step-by-step guide breaks down the process into manageable tasks that any business owner can complete.",
+    "Budget Tools": "Managing finances effectively doesn't require expensive software. {description} This guide reveals the best free and affordable tools that deliver professional results without the premium price tag.",
+    "Tax Preparation": "Tax season doesn't have to be stressful. {description} This comprehensive guide provides everything you need to organize your finances and maximize deductions.",
+    "Cash Management": "Cash flow is the lifeblood of any business. {description} Understanding and optimizing cash management can mean the difference between thriving and merely surviving.",
+    "Financial Metrics": "What gets measured gets managed. {description} This guide shows you how to track, analyze, and optimize this critical metric for business success.",
+    "Marketing Metrics": "Understanding your marketing effectiveness is crucial for growth. {description} Learn how to measure, analyze, and improve this key performance indicator.",
+    "Operations Metrics": "Operational efficiency drives profitability. {description} Discover how to use this metric to optimize your business operations.",
+    "Customer Metrics": "Customer satisfaction drives long-term success. {description} This guide shows you how to measure and improve customer relationships.",
+    "HR Metrics": "Your team is your greatest asset. {description} Learn how to measure and enhance workforce performance for maximum productivity.",
+    "Digital Metrics": "Online performance directly impacts revenue. {description} Master these metrics to optimize your digital presence and drive sales."
+}
+
+DEFAULT_INTRO = "Understanding key business concepts is essential for success. {description} This comprehensive guide provides the knowledge and strategies you need."
+
+# Blog index card icon per category
+INDEX_ICONS = {
+    "Software Reviews": "Bot",
+    "How-To Guides": "BookOpen",
+    "Budget Tools": "DollarSign",
+    "Tax Preparation": "Receipt",
+    "Cash Management": "RefreshCw",
+    "Accounting Basics": "Calculator",
+    "Business Strategy": "Target",
+    "Freelancer Finance": "Users",
+    "Business Growth": "TrendingUp",
+    "Financial Metrics": "BarChart3",
+    "Marketing Metrics": "Target",
+    "Operations Metrics": "Package",
+    "Customer Metrics": "Users",
+    "HR Metrics": "Users",
+    "Digital Metrics": "TrendingUp",
+}
+
+PUBLISHED_DATE = "2024-12-29"
+COMPONENTS = ["ArticleHeader.tsx", "ComprehensiveArticle.tsx", "RelatedArticles.tsx", "metadata.ts"]
+
+# Category and intro lines per category (see blog_pipeline.fragments)
+FRAGMENTS = FragmentCache()
+
+
+@functools.lru_cache(maxsize=None)
+def page_template():
+    return load_template("comprehensive.tsx.tmpl")
+
+
+def category_fields(category):
+    """The category and intro lines, split where the topic's escaped description goes"""
+    before, after = INTROS.get(category, DEFAULT_INTRO).split("{description}")
+    head = ts_fields({"category": category, "intro": before})
+    return [head[:-2], ts_literal(after)[1:] + ","]
+
+
+def render_page(topic):
+    """Generate the page module for one comprehensive (1500-2000 word) blog"""
+    title, description = topic["title"], topic["description"]
+    url = "https://myaibookkeeper.com/blog/" + title.lower().replace(" ", "-").replace(":", "").replace("'", "")
+
+    # Category-specific intro or the default, with the description spliced in
+    head, tail = FRAGMENTS.get(("category", topic["category"]), lambda: category_fields(topic["category"]))
+    related = [{"slug": other, "title": other_title} for other, other_title in topic.get("related", ())]
+
+    return page_template().render({
+        "article": ts_block(
+            ts_fields({
+                "title": title,
+                "description": description,
+                "keywords": topic["keywords"],
+                "url": url,
+            }),
+            head + ts_literal(description)[1:-1] + tail,
+            ts_fields({"related": related}),
+        ),
+    })
+
+
+def component_values():
+    return None
+
+
+def index_entry(topic):
+    return {
+        "slug": topic["slug"],
+        "title": topic["title"],
+        "excerpt": topic.get("excerpt") or topic["description"],
+        "date": PUBLISHED_DATE,
+        "readTime": "9 min read",
+        "icon": INDEX_ICONS.get(topic["category"], "BookOpen"),
+        "keywords": topic["keywords"],
+        "category": topic["category"],
+        "featured": topic.get("featured", False),
+    }
+
+
+def template_version():
+    return version_hash(page_template().version, render_page, index_entry, category_fields, ts_literal, ts_fields,
+                        ts_block, INTROS, DEFAULT_INTRO, INDEX_ICONS, PUBLISHED_DATE)
+
+
+def build(catalog=CATALOG, backend=None, out_dir=BLOG_DIR, related_cache=None, force=False, workers=1,
+          validate=True, profiler=NULL_PROFILER, log=print):
+    """Render every topic of `catalog` into `backend` (a DiskBackend on out_dir by default)"""
+    return build_catalog(NAME, catalog, render_page, index_entry, template_version(), backend=backend,
+                         out_dir=out_dir, related_cache=related_cache, force=force, workers=workers,
+                         validate=validate, profiler=profiler, log=log)
@@ -0,0 +1,204 @@
+"""Near-duplicate detection across the blog with MinHash and LSH banding.
+
+Each page is reduced to the text a reader sees: its own headings and
+paragraphs plus, for a generated page, the text of the shared article
+component it renders, so pages that differ only in their article data show
+up as the boilerplate they are. The text is cut into overlapping word
+shingles and summarised as a one-permutation MinHash signature: shingle
+hashes are spread over SIGNATURE_SIZE bins and each bin keeps its minimum,
+so a page costs one hash per shingle. Signatures are split into BANDS
+bands; every pair of pages sharing a band's bucket is compared once, and
+pairs whose estimated Jaccard similarity reaches the threshold are
+near-duplicates. A bucket of more than MAX_BUCKET pages is skipped (and
+reported) rather than costing a quadratic number of comparisons. Clusters
+use complete linkage: two groups merge only if every page in one is a
+near-duplicate of every page in the other, so a chain of pages that each
+resemble the next stays apart.
+
+    python -m blog_pipeline.duplicates                     # report
+    python -m blog_pipeline.duplicates --json dupes.json --max-duplicates 0
+
+With --max-duplicates the command exits with status 1 when more pages than
+that duplicate another one, so CI can gate on it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from itertools import combinations
+
+from .build import BLOG_DIR
+from .components import COMPONENTS_DIR
+from .passages import page_passages
+from .validate import jsx_text
+
+SHINGLE_WORDS = 5
+SIGNATURE_SIZE = 128
+BANDS = 16
+THRESHOLD = 0.8
+MAX_BUCKET = 1000
+BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+WORD = re.compile(r"[a-z0-9]+")
+COMPONENT_IMPORT = re.compile(r"from\s*['\"]@/components/blog/(\w+)['\"]")
+
+
+class ComponentText:
+    """JSX text of components/blog/<name>.tsx, read once per run"""
+
+    def __init__(self, components_dir):
+        self.components_dir = components_dir
+        self.texts = {}
+
+    def __getitem__(self, name):
+        if name not in self.texts:
+            try:
+                with open(os.path.join(self.components_dir, f"{name}.tsx"), encoding="utf-8") as f:
+                    self.texts[name] = " ".join(text for _, text in jsx_text(f.read()))
+            except FileNotFoundError:
+                self.texts[name] = ""
+        return self.texts[name]
+
+
+def page_text(source, components):
+    title, passages = page_passages(source)
+    parts = [title]
+    for heading, body in passages:
+        parts += (heading, body)
+    parts.extend(components[name] for name in COMPONENT_IMPORT.findall(source))
+    return " ".join(parts)
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    words = WORD.findall(text.lower())
+    return {" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))} if words else set()
+
+
+def signature(shingle_set, size=SIGNATURE_SIZE):
+    """One-permutation MinHash: the minimum hash per bin, empty bins filled from the next non-empty one"""
+    bins = [None] * size
+    for shingle in shingle_set:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+        index = value & (size - 1)
+        value >>= BIN_BITS
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    filled = [i for i, value in enumerate(bins) if value is not None]
+    if not filled:
+        return bins
+    for i in range(size):
+        if bins[i] is None:
+            # Rotation densification: borrow from the next filled bin, offset by the distance walked
+            j = next((j for j in filled if j > i), filled[0] + size)
+            bins[i] = bins[j % size] + (j - i) * (1 << (64 - BIN_BITS))
+    return bins
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def near_duplicate_pairs(signatures, threshold=THRESHOLD, bands=BANDS, max_bucket=MAX_BUCKET, log=print):
+    """{(name, other name): estimated similarity} for every bucketed pair at or above the threshold"""
+    names = sorted(signatures)
+    rows = SIGNATURE_SIZE // bands
+    checked = set()
+    pairs = {}
+    skipped = 0
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for i, name in enumerate(names):
+            buckets[tuple(signatures[name][band * rows:(band + 1) * rows])].append(i)
+        for members in buckets.values():
+            if len(members) > max_bucket:
+                skipped += 1
+                continue
+            for pair in combinations(members, 2):
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                score = similarity(signatures[names[pair[0]]], signatures[names[pair[1]]])
+                if score >= threshold:
+                    pairs[names[pair[0]], names[pair[1]]] = score
+    if skipped:
+        log(f"Skipped {skipped} LSH buckets of more than {max_bucket} pages; their pairs were not compared")
+    return pairs
+
+
+def find_clusters(signatures, threshold=THRESHOLD, bands=BANDS, max_bucket=MAX_BUCKET, log=print):
+    """[(members, lowest similarity between any two members)] for every complete-linkage group of near-duplicates"""
+    pairs = near_duplicate_pairs(signatures, threshold, bands, max_bucket, log)
+
+    def score(a, b):
+        return pairs.get((a, b) if a < b else (b, a))
+
+    clusters = {}
+    for (a, b), _ in sorted(pairs.items(), key=lambda item: (-item[1], item[0])):
+        first, second = clusters.setdefault(a, [a]), clusters.setdefault(b, [b])
+        if first is not second and all(score(x, y) is not None for x in first for y in second):
+            first.extend(second)
+            for name in second:
+                clusters[name] = first
+
+    groups = {id(members): members for members in clusters.values() if len(members) > 1}.values()
+    result = []
+    for members in groups:
+        members.sort()
+        low = min(score(a, b) for a, b in combinations(members, 2))
+        result.append((members, low))
+    result.sort(key=lambda cluster: (-len(cluster[0]), cluster[0][0]))
+    return result
+
+
+def page_signatures(blog_dir=BLOG_DIR, components_dir=COMPONENTS_DIR):
+    components = ComponentText(components_dir)
+    signatures = {}
+    for slug in sorted(os.listdir(blog_dir)):
+        path = os.path.join(blog_dir, slug, "page.tsx")
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                signatures[slug] = signature(shingles(page_text(f.read(), components)))
+    return signatures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report clusters of near-duplicate blog pages")
+    parser.add_argument("--blog", default=BLOG_DIR, help="blog pages directory (default: app/blog)")
+    parser.add_argument("--components", default=COMPONENTS_DIR,
+                        help="shared blog component directory (default: components/blog)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="estimated Jaccard similarity (default: 0.8)")
+    parser.add_argument("--max-bucket", type=int, default=MAX_BUCKET, metavar="N",
+                        help=f"skip LSH buckets of more than N pages (default: {MAX_BUCKET})")
+    parser.add_argument("--json", metavar="FILE", help="write the clusters as JSON")
+    parser.add_argument("--max-duplicates", type=int, metavar="N",
+                        help="exit with status 1 if more than N pages duplicate another page")
+    args = parser.parse_args(argv)
+
+    signatures = page_signatures(args.blog, args.components)
+    clusters = find_clusters(signatures, args.threshold, max_bucket=args.max_bucket)
+    duplicates = sum(len(members) - 1 for members, _ in clusters)
+    print(f"{len(signatures)} pages, {len(clusters)} near-duplicate clusters at similarity >= {args.threshold:.2f} "
+          f"({duplicates} pages duplicate another)")
+    for members, low in clusters:
+        print(f"\n  {len(members)} pages, similarity >= {low:.2f}:")
+        print("\n".join(f"    {name}" for name in members))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "threshold": args.threshold,
+                "pages": len(signatures),
+                "duplicates": duplicates,
+                "clusters": [{"size": len(members), "similarity": low, "pages": members} for members, low in clusters],
+            }, f, indent=1)
+            f.write("\n")
+    if args.max_duplicates is not None and duplicates > args.max_duplicates:
+        sys.exit(f"{duplicates} duplicate pages, more than the {args.max_duplicates} allowed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""Financial concept pages: one article per accounting concept, styled by content_map.
+
+Importing this module reads no files. The page template and the slug
+matcher over CONTENT_MAP are built on first use and kept for the life of
+the process, so a long-lived worker pays for them once.
+"""
+
+import functools
+
+from .build import BLOG_DIR, build_catalog
+from .catalog import FINANCIAL_CATALOG
+from .manifest import version_hash
+from .matcher import SlugMatcher
+from .profiling import NULL_PROFILER
+from .template import load_template
+from .tsx import ts_block, ts_fields, ts_literal
+
+NAME = "financial"
+LABEL = "Financial concept blogs"
+DESCRIPTION = "Generate the financial concept blog pages"
+CATALOG = FINANCIAL_CATALOG
+
+# Map slugs to specific content details
+CONTENT_MAP = {
+    "equity-explained": {
+        "icon": "PieChart",
+        "color": "green",
+        "read_time": "8",
+        "intro": "Equity represents the true ownership value in your business—what remains after all debts are paid",
+        "sections": ["Understanding Shareholders Equity", "Components of Equity", "Equity vs Debt Financing", "Building Equity Value"]
+    },
+    "boosting-revenue": {
+        "icon": "TrendingUp", 
+        "color": "blue",
+        "read_time": "9",
+        "intro": "Revenue is the lifeblood of any business, representing the total income generated from operations",
+        "sections": ["Revenue Growth Strategies", "Diversifying Income Streams", "Pricing Optimization", "Customer Retention"]
+    },
+    "cutting-expenses": {
+        "icon": "Scissors",
+        "color": "red",
+        "read_time": "8",
+        "intro": "Strategic expense reduction can dramatically improve profitability without compromising quality",
+        "sections": ["Identifying Cost Drivers", "Strategic Cost Reduction", "Technology and Automation", "Vendor Management"]
+    },
+    "net-income": {
+        "icon": "Target",
+        "color": "purple",
+        "read_time": "7",
+        "intro": "Net income represents the true bottom line—what remains after all expenses, taxes, and costs",
+        "sections": ["Calculating Net Income", "Net vs Gross Profit", "Improving Net Margins", "Industry Benchmarks"]
+    },
+    "accounts-receivable": {
+        "icon": "FileText",
+        "color": "blue",
+        "read_time": "9",
+        "intro": "Effective accounts receivable management is crucial for maintaining healthy cash flow",
+        "sections": ["AR Management Best Practices", "Collection Strategies", "Credit Policies", "Reducing DSO"]
+    },
+    "accounts-payable": {
+        "icon": "CreditCard",
+        "color": "orange",
+        "read_time": "8",
+        "intro": "Strategic accounts payable management balances cash flow optimization with vendor relationships",
+        "sections": ["Payment Optimization", "Vendor Relations", "Early Payment Discounts", "AP Automation"]
+    },
+    "power-of-cash": {
+        "icon": "Banknote",
+        "color": "green",
+        "read_time": "8",
+        "intro": "Cash is the ultimate measure of business liquidity and operational flexibility",
+        "sections": ["Cash Management Fundamentals", "Liquidity Optimization", "Cash Reserves Strategy", "Cash Flow Forecasting"]
+    },
+    "inventory-management": {
+        "icon": "Package",
+        "color": "amber",
+        "read_time": "9",
+        "intro": "Optimal inventory management balances customer demand with carrying costs",
+        "sections": ["Inventory Optimization", "Just-in-Time Strategies", "Turnover Improvement", "Technology Solutions"]
+    },
+    "fixed-assets": {
+        "icon": "Building2",
+        "color": "indigo",
+        "read_time": "8",
+        "intro": "Fixed assets represent long-term investments that drive operational capacity",
+        "sections": ["Asset Investment Strategy", "Depreciation Planning", "Maintenance vs Replacement", "ROI Optimization"]
+    },
+    "current-assets": {
+        "icon": "Wallet",
+        "color": "cyan",
+        "read_time": "7",
+        "intro": "Current assets provide the liquidity needed for day-to-day operations",
+        "sections": ["Liquidity Management", "Working Capital Optimization", "Asset Conversion", "Risk Management"]
+    },
+    "current-liabilities": {
+        "icon": "Clock",
+        "color": "red",
+        "read_time": "8",
+        "intro": "Managing current liabilities effectively ensures operational continuity and financial flexibility",
+        "sections": ["Short-term Debt Management", "Payment Prioritization", "Cash Flow Alignment", "Vendor Relations"]
+    },
+    "long-term-liabilities": {
+        "icon": "Calendar",
+        "color": "purple",
+        "read_time": "9",
+        "intro": "Long-term liabilities provide capital for growth while requiring careful management",
+        "sections": ["Debt Structure Optimization", "Refinancing Strategies", "Covenant Management", "Leverage Ratios"]
+    },
+    "retained-earnings": {
+        "icon": "PiggyBank",
+        "color": "green",
+        "read_time": "8",
+        "intro": "Retained earnings represent the accumulated profits reinvested in business growth",
+        "sections": ["Retention vs Distribution", "Growth Financing", "Building Equity", "Shareholder Value"]
+    },
+    "gross-profit": {
+        "icon": "Calculator",
+        "color": "blue",
+        "read_time": "8",
+        "intro": "Gross profit reveals the fundamental profitability of your core business operations",
+        "sections": ["Margin Analysis", "Pricing Strategies", "Cost Reduction", "Competitive Positioning"]
+    },
+    "operating-income": {
+        "icon": "Activity",
+        "color": "orange",
+        "read_time": "8",
+        "intro": "Operating income measures the profitability of core business operations",
+        "sections": ["EBIT Analysis", "Operational Efficiency", "Cost Management", "Performance Metrics"]
+    },
+    "cost-of-goods": {
+        "icon": "ShoppingCart",
+        "color": "red",
+        "read_time": "9",
+        "intro": "Managing COGS effectively is crucial for maintaining healthy profit margins",
+        "sections": ["Direct Cost Management", "Supply Chain Optimization", "Vendor Negotiations", "Process Improvement"]
+    },
+    "depreciation": {
+        "icon": "TrendingDown",
+        "color": "gray",
+        "read_time": "8",
+        "intro": "Depreciation allocates asset costs over time, impacting both taxes and profitability",
+        "sections": ["Depreciation Methods", "Tax Implications", "Asset Planning", "Financial Impact"]
+    },
+    "amortization": {
+        "icon": "Layers",
+        "color": "indigo",
+        "read_time": "7",
+        "intro": "Amortization spreads intangible asset costs and loan payments over time",
+        "sections": ["Amortization Types", "Calculation Methods", "Tax Benefits", "Strategic Planning"]
+    },
+    "shareholders-equity": {
+        "icon": "Users",
+        "color": "blue",
+        "read_time": "8",
+        "intro": "Shareholders equity represents the owners residual claim on company assets",
+        "sections": ["Equity Components", "Valuation Metrics", "Investor Perspectives", "Building Value"]
+    },
+    "managing-debt": {
+        "icon": "Scale",
+        "color": "red",
+        "read_time": "9",
+        "intro": "Strategic debt management balances growth financing with financial stability",
+        "sections": ["Optimal Leverage", "Debt Restructuring", "Interest Management", "Risk Mitigation"]
+    },
+    "cash-flow-essentials": {
+        "icon": "Droplets",
+        "color": "cyan",
+        "read_time": "9",
+        "intro": "Cash flow is the lifeblood that keeps your business operations running smoothly",
+        "sections": ["Operating Cash Flow", "Cash Flow Forecasting", "Working Capital", "Crisis Management"]
+    },
+    "accrued-expenses": {
+        "icon": "Archive",
+        "color": "amber",
+        "read_time": "7",
+        "intro": "Accrued expenses ensure accurate financial reporting by matching costs to periods",
+        "sections": ["Accrual Accounting", "Common Accruals", "Financial Impact", "Management Strategies"]
+    },
+    "prepaid-expenses": {
+        "icon": "FastForward",
+        "color": "green",
+        "read_time": "7",
+        "intro": "Prepaid expenses represent future economic benefits already paid for",
+        "sections": ["Prepayment Benefits", "Accounting Treatment", "Cash Flow Impact", "Strategic Use"]
+    },
+    "controlling-operating": {
+        "icon": "Settings",
+        "color": "purple",
+        "read_time": "8",
+        "intro": "Controlling operating expenses is essential for maintaining profitability",
+        "sections": ["Expense Categories", "Cost Control Methods", "Efficiency Metrics", "Continuous Improvement"]
+    },
+    "interest-expense": {
+        "icon": "Percent",
+        "color": "red",
+        "read_time": "8",
+        "intro": "Interest expense represents the cost of borrowed capital for business operations",
+        "sections": ["Interest Rate Management", "Debt Optimization", "Tax Deductibility", "Refinancing Strategies"]
+    },
+    "taxes-business": {
+        "icon": "Receipt",
+        "color": "gray",
+        "read_time": "9",
+        "intro": "Strategic tax planning can significantly impact your bottom line profitability",
+        "sections": ["Tax Planning Strategies", "Deduction Optimization", "Structure Benefits", "Compliance Management"]
+    },
+    "dividends": {
+        "icon": "Gift",
+        "color": "green",
+        "read_time": "8",
+        "intro": "Dividend policy balances rewarding shareholders with retaining capital for growth",
+        "sections": ["Dividend Strategies", "Payout Ratios", "Tax Implications", "Growth vs Income"]
+    },
+    "working-capital": {
+        "icon": "RefreshCw",
+        "color": "blue",
+        "read_time": "9",
+        "intro": "Working capital management ensures sufficient liquidity for daily operations",
+        "sections": ["Working Capital Cycle", "Optimization Strategies", "Industry Benchmarks", "Crisis Planning"]
+    }
+}
+
+# Used when no content_map key occurs in the slug; the intro falls back to the description
+DEFAULT_DETAILS = {
+    "icon": "BarChart3",
+    "color": "blue",
+    "read_time": "8",
+    "intro": None,
+    "sections": ["Key Concepts", "Best Practices", "Common Challenges", "Strategic Implementation"]
+}
+
+# Tailwind classes per content_map color, written out to components/blog/palettes.ts
+PALETTE_CLASSES = {
+    "hero": "from-{color}-50 via-white to-{color}-50",
+    "link": "text-{color}-600 hover:text-{color}-700",
+    "badge": "bg-{color}-100 text-{color}-700",
+    "panel": "from-{color}-50 to-{color}-50",
+    "accent": "text-{color}-600",
+    "border": "border-{color}-500",
+    "takeaways": "from-{color}-50",
+    "button": "from-{color}-600 to-{color}-600 hover:from-{color}-700 hover:to-{color}-700",
+}
+PUBLISHED_DATE = "2024-12-29"
+COMPONENTS = ["ArticleHeader.tsx", "FinancialConceptArticle.tsx", "RelatedArticles.tsx", "palettes.ts", "metadata.ts"]
+
+# No fragment cache (see blog_pipeline.fragments): the catalog has one topic per content_map
+# family, so a family's fields are never rendered twice in a run
+FRAGMENTS = None
+
+
+@functools.lru_cache(maxsize=None)
+def page_template():
+    return load_template("financial_concept.tsx.tmpl")
+
+
+@functools.lru_cache(maxsize=None)
+def content_matcher():
+    return SlugMatcher(CONTENT_MAP)
+
+
+def page_details(slug, description):
+    # Extract key from slug (longest content_map key occurring in it)
+    key = content_matcher().match(slug)
+    return CONTENT_MAP[key] if key is not None else dict(DEFAULT_DETAILS, intro=description)
+
+
+def family_fields(details):
+    return ts_fields({
+        "color": details["color"],
+        "readTime": details["read_time"],
+        "intro": details["intro"],
+        "sections": details["sections"],
+    })
+
+
+def render_page(topic):
+    """Generate the page module for one financial concept blog"""
+    slug = topic["slug"]
+    details = page_details(slug, topic["description"])
+    related = [{"slug": other, "title": other_title} for other, other_title in topic.get("related", ())]
+    return page_template().render({
+        "icon": details["icon"],
+        "component": slug.replace("-", "").title().replace("-", ""),
+        "article": ts_block(
+            ts_fields({
+                "title": topic["title"],
+                "description": topic["description"],
+                "keywords": topic["keywords"],
+                "url": f"https://myaibookkeeper.com/blog/{slug}",
+            }),
+            family_fields(details),
+            ts_fields({"related": related}),
+        ),
+    })
+
+
+def render_palettes():
+    colors = sorted({details["color"] for details in CONTENT_MAP.values()} | {DEFAULT_DETAILS["color"]})
+    entries = []
+    for color in colors:
+        classes = "".join(f"    {name}: {ts_literal(pattern.format(color=color))},\n" for name, pattern in PALETTE_CLASSES.items())
+        entries.append(f"  {color}: {{\n{classes}  }},")
+    return "\n".join(entries)
+
+
+def component_values():
+    return {"palettes": render_palettes()}
+
+
+def index_entry(topic):
+    details = page_details(topic["slug"], topic["description"])
+    return {
+        "slug": topic["slug"],
+        "title": topic["title"],
+        "excerpt": topic.get("excerpt") or topic["description"],
+        "date": PUBLISHED_DATE,
+        "readTime": f"{details['read_time']} min read",
+        "icon": details["icon"],
+        "keywords": topic["keywords"],
+        "headings": details["sections"],
+        "category": topic.get("category", "Financial Fundamentals"),
+        "featured": topic.get("featured", False),
+    }
+
+
+def template_version():
+    return version_hash(page_template().version, render_page, index_entry, page_details, family_fields,
+                        content_matcher, SlugMatcher, ts_literal, ts_fields, ts_block, CONTENT_MAP,
+                        DEFAULT_DETAILS, PUBLISHED_DATE)
+
+
+def build(catalog=CATALOG, backend=None, out_dir=BLOG_DIR, related_cache=None, force=False, workers=1,
+          validate=True, profiler=NULL_PROFILER, log=print):
+    """Render every topic of `catalog` into `backend` (a DiskBackend on out_dir by default)"""
+    return build_catalog(NAME, catalog, render_page, index_entry, template_version(), backend=backend,
+                         out_dir=out_dir, related_cache=related_cache, force=force, workers=workers,
+                         validate=validate, profiler=profiler, log=log)
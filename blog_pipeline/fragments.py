@@ -0,0 +1,81 @@
+"""LRU cache for the parts of a page that depend on less than the whole topic.
+
+Much of a comprehensive page is shared by every topic in its category: the
+category line and intro. render_page asks the generator's FragmentCache for
+such a fragment under a key naming only the inputs it depends on, so a
+catalog of 10,000 pages over a dozen categories renders each fragment a
+dozen times. A generator whose fragments would not repeat within a run sets
+FRAGMENTS to None instead (financial: one topic per content_map family). The cache keeps the `maxsize` most recently used
+fragments and counts hits, misses and evictions.
+
+save() writes the fragments to a JSON file that load() reads back in a
+later run, as long as the version it is given (the generator's template
+version) is unchanged, so that version must cover every function and
+constant a fragment is built from. Worker processes (-j) each fill their own copy, so
+only a single-process build reports statistics or persists new fragments.
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+from .backends import write_if_changed
+
+DEFAULT_SIZE = 1024
+CACHE_VERSION = 1
+
+
+class FragmentCache:
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self.fragments = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.path = None
+        self.version = None
+
+    def get(self, key, render):
+        """The fragment stored under `key` (a tuple of strings), from render() on a miss"""
+        fragment = self.fragments.get(key)
+        if fragment is not None:
+            self.hits += 1
+            self.fragments.move_to_end(key)
+            return fragment
+        self.misses += 1
+        fragment = self.fragments[key] = render()
+        if len(self.fragments) > self.maxsize:
+            self.fragments.popitem(last=False)
+            self.evictions += 1
+        return fragment
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self.fragments.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def load(self, path, version):
+        """Use `path` for persistence, keeping what it holds if it was saved under `version`"""
+        self.path = path
+        self.version = version
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("cache") == CACHE_VERSION and data.get("version") == version:
+            for key, fragment in data["fragments"][-self.maxsize:] if self.maxsize else ():
+                self.fragments[tuple(key)] = fragment
+
+    def save(self):
+        if self.path:
+            fragments = [[list(key), fragment] for key, fragment in self.fragments.items()]
+            content = json.dumps({"cache": CACHE_VERSION, "version": self.version, "fragments": fragments},
+                                 ensure_ascii=False, indent=1)
+            write_if_changed(self.path, content + "\n")
+
+    def __str__(self):
+        return (f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions "
+                f"({self.hit_rate():.1%} hit rate, {len(self.fragments)} of {self.maxsize} slots used)")
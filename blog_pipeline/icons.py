@@ -0,0 +1,126 @@
+"""lucide-react import pruning and an icon usage report across the site.
+
+Generated pages import exactly the one icon they render, and
+blog_pipeline.validate rejects a page with an unused icon import, so the
+generators cannot regress. This module covers the rest of the tree: it finds
+icons that are imported but never rendered and can rewrite the imports to
+the exact list.
+
+    python -m blog_pipeline.icons                  # report
+    python -m blog_pipeline.icons --fix            # also rewrite the imports
+    python -m blog_pipeline.icons --json icons.json
+"""
+
+import argparse
+import glob
+import json
+import os
+from collections import Counter
+
+from .validate import LUCIDE_IMPORT, scan
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+SOURCE_GLOBS = ("app/**/*.tsx", "components/**/*.tsx")
+
+
+def icon_usage(source):
+    """(local names imported from lucide-react in import order, set of those actually used, local -> icon name)"""
+    imported = []
+    icons = {}
+    for clause in LUCIDE_IMPORT.findall(source):
+        for part in clause.split(","):
+            names = part.split()
+            if names:
+                imported.append(names[-1])
+                icons[names[-1]] = names[0]
+    _, identifiers, _ = scan(source)
+    counts = Counter(imported)
+    used = {local for local in counts if identifiers.get(local, 0) > counts[local]}
+    return imported, used, icons
+
+
+def prune_icon_imports(source):
+    """Rewrite each lucide-react import to the icons the file uses, dropping duplicates and empty imports"""
+    _, used, _ = icon_usage(source)
+    kept = set()
+
+    def rewrite(match):
+        parts = [" ".join(part.split()) for part in match.group(1).split(",")]
+        parts = [part for part in parts if part]
+        specifiers = []
+        for part in parts:
+            local = part.split(" as ")[-1]
+            if local in used and local not in kept:
+                kept.add(local)
+                specifiers.append(part)
+        if specifiers == parts:
+            return match.group(0)
+        if not specifiers:
+            return ""
+        if "\n" in match.group(1):
+            return "import {\n" + ",\n".join(f"  {part}" for part in specifiers) + "\n} from 'lucide-react'"
+        return f"import {{ {', '.join(specifiers)} }} from 'lucide-react'"
+
+    pruned = LUCIDE_IMPORT.sub(rewrite, source)
+    # An emptied import leaves a blank line behind
+    return pruned.replace("\n\n\n", "\n\n") if pruned != source else source
+
+
+def icon_report(paths, root=ROOT_DIR):
+    files = {}
+    usage = Counter()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            imported, used, icons = icon_usage(f.read())
+        unused = sorted(set(imported) - used)
+        duplicated = sorted(icon for icon, count in Counter(imported).items() if count > 1)
+        files[os.path.relpath(path, root)] = {"imported": len(imported), "unused": unused, "duplicated": duplicated}
+        usage.update(icons[local] for local in used)
+    return {
+        "icons": dict(sorted(usage.items(), key=lambda item: (-item[1], item[0]))),
+        "files": files,
+        "imports": sum(entry["imported"] for entry in files.values()),
+        "unused": sum(len(entry["unused"]) + len(entry["duplicated"]) for entry in files.values()),
+    }
+
+
+def source_files(root=ROOT_DIR):
+    paths = set()
+    for pattern in SOURCE_GLOBS:
+        paths.update(glob.glob(os.path.join(root, pattern), recursive=True))
+    return sorted(paths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report (and optionally prune) unused lucide-react icon imports")
+    parser.add_argument("paths", nargs="*", help="files to check (default: app/ and components/)")
+    parser.add_argument("--fix", action="store_true", help="rewrite imports to the icons each file uses")
+    parser.add_argument("--json", metavar="FILE", help="write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or source_files()
+    report = icon_report(paths)
+    print(f"{len(report['icons'])} icons used across {len(paths)} files; "
+          f"{report['unused']} of {report['imports']} icon imports are unused or duplicated")
+    for name, entry in report["files"].items():
+        if entry["unused"] or entry["duplicated"]:
+            print(f"  {name}: " + ", ".join(entry["unused"] + [f"{icon} (twice)" for icon in entry["duplicated"]]))
+    print("\nMost used:\n" + "\n".join(f"  {count:>4}  {icon}" for icon, count in list(report["icons"].items())[:15]))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+            f.write("\n")
+    if args.fix:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            pruned = prune_icon_imports(source)
+            if pruned != source:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(pruned)
+                print(f"Pruned: {path}")
+
+
+if __name__ == "__main__":
+    main()
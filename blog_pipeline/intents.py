@@ -0,0 +1,171 @@
+"""Compiles the free-tier chat intents into the routing table getFreeResponse loads.
+
+catalogs/chat_intents.json declares every canned answer: the keywords that
+select it (substrings of the lowercased message, the way the route's
+`includes` chain matched them), whole messages that select it ("exact",
+compared after trimming and dropping trailing punctuation), a priority,
+and a response template whose `{{ message }}` slot holds the question.
+"fallback" intents only answer when no blog passage does (see
+blog_pipeline.passages). The one intent without keywords or exact
+messages is the default.
+
+The table in data/chat-intents.json lists the intents by priority, maps
+exact messages to them, and holds an Aho-Corasick automaton over all the
+keywords. Each state records the best intent whose keyword ends there,
+including those reached along its failure links, so lib/intentRouter.ts
+walks the message once and keeps a running minimum. Routing cost follows
+the message length, not the number of intents.
+
+    python -m blog_pipeline.intents                           # compile
+    python -m blog_pipeline.intents "can I deduct mileage?"   # compile, then route a message
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from collections import deque
+
+from .backends import write_if_changed
+from .catalog import CATALOG_DIR
+from .passages import DATA_DIR
+from .template import compile_template
+
+INTENT_CATALOG = os.path.join(CATALOG_DIR, "chat_intents.json")
+TABLE_PATH = os.path.join(DATA_DIR, "chat-intents.json")
+TABLE_VERSION = 1
+# Kept in step with exactKey in lib/intentRouter.ts
+TRAILING = re.compile(r"[\s!.,?]+$")
+
+
+class IntentCatalogError(ValueError):
+    pass
+
+
+def exact_key(message):
+    return TRAILING.sub("", message.strip().lower())
+
+
+def is_default(intent):
+    return not any(trigger.strip() for trigger in intent.get("keywords", []) + intent.get("exact", []))
+
+
+def load_intents(path=INTENT_CATALOG):
+    """The catalog's intents sorted by priority (catalog order breaks ties), checked for mistakes"""
+    with open(path, encoding="utf-8") as f:
+        intents = json.load(f)["intents"]
+    names = set()
+    defaults = []
+    for intent in intents:
+        name = intent.get("name")
+        if not name or name in names:
+            raise IntentCatalogError(f"{path}: intent names must be present and unique, got {name!r}")
+        names.add(name)
+        if not isinstance(intent.get("priority"), int):
+            raise IntentCatalogError(f"{path}: intent {name!r} needs an integer priority")
+        if is_default(intent):
+            defaults.append(name)
+    if len(defaults) != 1:
+        raise IntentCatalogError(f"{path}: exactly one intent must have no keywords (the default), got {defaults}")
+    return sorted(intents, key=lambda intent: intent["priority"])
+
+
+def build_automaton(keywords):
+    """(goto, fail, best) for {keyword: intent index}; best[state] is the lowest index matched there, or -1"""
+    goto = [{}]
+    best = [-1]
+    for keyword, intent in keywords.items():
+        state = 0
+        for char in keyword:
+            if char not in goto[state]:
+                goto[state][char] = len(goto)
+                goto.append({})
+                best.append(-1)
+            state = goto[state][char]
+        best[state] = intent
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, child in goto[state].items():
+            link = fail[state]
+            while link and char not in goto[link]:
+                link = fail[link]
+            fail[child] = goto[link].get(char, 0)
+            inherited = best[fail[child]]
+            if inherited >= 0 and (best[child] < 0 or inherited < best[child]):
+                best[child] = inherited
+            queue.append(child)
+    return goto, fail, best
+
+
+def compile_intents(intents):
+    keywords = {}
+    exact = {}
+    for index, intent in enumerate(intents):
+        for keyword in intent.get("keywords", ()):
+            keywords.setdefault(keyword.lower(), index)
+        for message in intent.get("exact", ()):
+            exact.setdefault(exact_key(message), index)
+    goto, fail, best = build_automaton(keywords)
+    compiled = []
+    for intent in intents:
+        response = intent["response"]
+        template = compile_template("\n".join(response) if isinstance(response, list) else response)
+        compiled.append({
+            "name": intent["name"],
+            "fallback": intent.get("fallback", False),
+            "response": {"parts": template.parts, "slots": template.slots},
+        })
+    return {
+        "version": TABLE_VERSION,
+        "default": next(index for index, intent in enumerate(intents) if is_default(intent)),
+        "intents": compiled,
+        "exact": exact,
+        "goto": goto,
+        "fail": fail,
+        "best": best,
+    }
+
+
+def route(table, message):
+    """Index of the intent that answers `message`; the same walk as routeIntent in lib/intentRouter.ts"""
+    goto, fail, best = table["goto"], table["fail"], table["best"]
+    found = table["exact"].get(exact_key(message), -1)
+    state = 0
+    for char in message.lower():
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if best[state] >= 0 and (found < 0 or best[state] < found):
+            found = best[state]
+    return found if found >= 0 else table["default"]
+
+
+def write_table(table, path=TABLE_PATH):
+    return write_if_changed(path, json.dumps(table, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the chat intent catalog into the free-tier routing table")
+    parser.add_argument("message", nargs="?", help="message to route after compiling")
+    parser.add_argument("--catalog", default=INTENT_CATALOG, help="intent catalog (default: catalogs/chat_intents.json)")
+    parser.add_argument("--out", default=TABLE_PATH, help="routing table (default: data/chat-intents.json)")
+    args = parser.parse_args(argv)
+
+    intents = load_intents(args.catalog)
+    table = compile_intents(intents)
+    if write_table(table, args.out):
+        print(f"Created: {args.out}")
+    print(f"{len(intents)} intents, {len(table['goto'])} automaton states, {len(table['exact'])} exact messages")
+    if args.message:
+        start = time.perf_counter()
+        intent = table["intents"][route(table, args.message)]
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"{intent['name']}{' (after blog passages)' if intent['fallback'] else ''} in {elapsed:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Build manifest used to skip pages whose inputs have not changed."""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def record_hash(record):
+    """Stable hash of a topic record (key order does not matter)"""
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def version_hash(*parts):
+    """Template version covering everything besides the record that shapes a page.
+
+    Functions contribute their source; template hashes and lookup tables are
+    hashed as data.
+    """
+    import inspect
+
+    digest = hashlib.sha256()
+    for part in parts:
+        if callable(part):
+            part = inspect.getsource(part)
+        digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class BuildManifest:
+    """Records which topic record and template version produced each page.
+
+    Entries are keyed by slug and tagged with the generator that owns them, so
+    several generators can share one manifest in the same output directory.
+    With no path the manifest lives only in memory and save() is a no-op.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.pages = data.get("pages", {})
+
+    def is_fresh(self, slug, generator, digest, template):
+        entry = self.pages.get(slug)
+        return (
+            entry is not None
+            and entry["generator"] == generator
+            and entry["record"] == digest
+            and entry["template"] == template
+        )
+
+    def update(self, slug, generator, digest, template, index=None):
+        entry = {"generator": generator, "record": digest, "template": template}
+        if index is not None:
+            entry["index"] = index
+        self.pages[slug] = entry
+        self.dirty = True
+
+    def forget(self, slug):
+        del self.pages[slug]
+        self.dirty = True
+
+    def owned_by(self, generator):
+        return [slug for slug, entry in self.pages.items() if entry["generator"] == generator]
+
+    def save(self):
+        if not self.dirty or not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "pages": self.pages}, f, indent=1, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,67 @@
+"""Multi-pattern substring matching for slug lookups.
+
+`SlugMatcher` compiles a set of keys into an Aho-Corasick automaton once,
+then resolves a slug in a single pass over its characters, independent of
+how many keys there are. When several keys occur in a slug the longest one
+wins, and among equally long keys the one starting first.
+"""
+
+from collections import deque
+
+
+class SlugMatcher:
+    def __init__(self, keys):
+        self.keys = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._longest = [None]  # index of the longest key ending in each state
+
+        for key in keys:
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._longest.append(None)
+                state = next_state
+            if self._longest[state] is None:
+                self._longest[state] = len(self.keys)
+                self.keys.append(key)
+
+        # Breadth-first so a state's failure target is finished before the state itself.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                if self._longest[child] is None:
+                    self._longest[child] = self._longest[self._fail[child]]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def match(self, text):
+        """Return the longest key occurring in `text` (leftmost on ties), or None"""
+        goto, fail, longest, keys = self._goto, self._fail, self._longest, self.keys
+        state = 0
+        best = None
+        best_length = best_start = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            index = longest[state]
+            if index is not None:
+                length = len(keys[index])
+                start = end - length
+                if length > best_length or (length == best_length and start < best_start):
+                    best, best_length, best_start = keys[index], length, start
+        return best
@@ -0,0 +1,53 @@
+"""Process-pool page rendering that keeps catalog order."""
+
+import os
+from collections import deque
+from itertools import islice
+
+DEFAULT_CHUNK_SIZE = 32
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _render_chunk(render, records):
+    return [render(record) for record in records]
+
+
+def render_all(render, records, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (record, content) pairs in the same order as `records`.
+
+    With more than one worker the records are split into chunks that are
+    rendered in a process pool. At most two chunks per worker are in flight,
+    so a long catalog is never materialised up front. `render` must be a
+    module-level function so it can be pickled.
+    """
+    if workers <= 1:
+        for record in records:
+            yield record, render(record)
+        return
+
+    # Loading the pool machinery (multiprocessing, sockets) costs more than a serial build needs
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        chunks = chunked(records, chunk_size)
+        for chunk in islice(chunks, workers * 2):
+            pending.append((chunk, pool.submit(_render_chunk, render, chunk)))
+        while pending:
+            chunk, future = pending.popleft()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append((next_chunk, pool.submit(_render_chunk, render, next_chunk)))
+            yield from zip(chunk, future.result())
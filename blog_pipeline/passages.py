@@ -0,0 +1,236 @@
+"""SQLite FTS5 index of blog article text for the chat free tier.
+
+Every app/blog/*/page.tsx is reduced to plain-text passages: one per h2/h3
+section of a hand-written post, and one per generated page built from its
+article data (title, description, intro, section names); the shared
+article components add the same boilerplate to every generated page, so it
+is left out. Passages go into an FTS5 table ranked with bm25(). The index is
+incremental: a page whose source hash is unchanged is not re-read into the
+table, and pages that disappeared are dropped.
+
+The route handler cannot open SQLite, so export_index() also writes the
+table's posting lists, read back through fts5vocab, to
+data/chat-passages.json. lib/passageIndex.ts scores that export with the
+same BM25 formula and column weights FTS5 uses.
+
+    python -m blog_pipeline.passages                       # update and export
+    python -m blog_pipeline.passages "late invoice fees"   # also query
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+
+from .backends import DiskBackend, write_if_changed
+from .build import BLOG_DIR, page_name
+from .search_index import tokenize
+from .validate import jsx_text
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data"))
+DB_PATH = os.path.join(DATA_DIR, "chat-passages.sqlite")
+EXPORT_PATH = os.path.join(DATA_DIR, "chat-passages.json")
+SCHEMA_VERSION = 3
+# bm25() weights for (slug, title, heading, body); kept in step with lib/passageIndex.ts
+COLUMN_WEIGHTS = (0, 2, 3, 1)
+BM25_K1 = 1.2
+BM25_B = 0.75
+HEADINGS = {"h1", "h2", "h3"}
+MIN_BODY_CHARS = 40
+STRING = r"""("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')"""
+TITLE = re.compile(r"^\s*title:\s*" + STRING, re.MULTILINE)
+ARTICLE_FIELD = re.compile(r"^\s*(description|intro):\s*" + STRING, re.MULTILINE)
+ARTICLE_SECTIONS = re.compile(r"^\s*sections:\s*\[([^\]]*)\]", re.MULTILINE)
+STRING_LITERAL = re.compile(STRING)
+
+
+def _literal(token):
+    """Value of a JS string literal"""
+    body = token[1:-1]
+    if token[0] == "'":
+        body = body.replace('\\"', '"').replace("\\'", "'").replace('"', '\\"')
+    return json.loads(f'"{body}"')
+
+
+def _clean(text):
+    return " ".join(html.unescape(text).split())
+
+
+def page_passages(source):
+    """(page title, [(heading, body), ...]) for one page.tsx"""
+    match = TITLE.search(source)
+    title = _literal(match.group(1)) if match else ""
+
+    fields = {name: _literal(value) for name, value in ARTICLE_FIELD.findall(source)}
+    if "intro" in fields:
+        sections = ARTICLE_SECTIONS.search(source)
+        topics = [_literal(token) for token in STRING_LITERAL.findall(sections.group(1))] if sections else []
+        body = " ".join(filter(None, [fields.get("description"), fields["intro"].rstrip(".") + "."]))
+        if topics:
+            body += " Covers: " + ", ".join(topics) + "."
+        return title, [(title, body)]
+
+    passages = []
+    heading, body, last, headed = title, [], None, False
+    for tag, raw in jsx_text(source):
+        text = _clean(raw)
+        if not text or not any(c.isalpha() for c in text):
+            continue
+        if tag in HEADINGS:
+            if not headed:
+                # Text ahead of the first heading is header chrome: back link, category, date, read time
+                heading, body, headed = text, [], True
+            elif last in HEADINGS and not body:
+                heading = f"{heading} {text}"
+            else:
+                passages.append((heading, " ".join(body)))
+                heading, body = text, []
+        else:
+            body.append(text)
+        last = tag
+    passages.append((heading, " ".join(body)))
+    return title, [(heading, body) for heading, body in passages if len(body) >= MIN_BODY_CHARS]
+
+
+def query_terms(query):
+    """Distinct search tokens of a question, with diacritics stripped as the FTS5 tokenizer strips them"""
+    text = "".join(c for c in unicodedata.normalize("NFKD", query) if not unicodedata.combining(c))
+    return list(dict.fromkeys(tokenize(text)))
+
+
+class PassageIndex:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.db.executescript(f"""
+                DROP TABLE IF EXISTS pages;
+                DROP TABLE IF EXISTS passages;
+                CREATE TABLE pages (slug TEXT PRIMARY KEY, digest TEXT NOT NULL, first INTEGER, last INTEGER);
+                CREATE VIRTUAL TABLE passages USING fts5(
+                    slug UNINDEXED, title, heading, body, tokenize = 'unicode61 remove_diacritics 2');
+                PRAGMA user_version = {SCHEMA_VERSION};
+            """)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def update(self, backend):
+        """Re-index the backend's pages whose source changed and drop removed ones; returns (updated, removed)"""
+        indexed = {slug: (digest, first, last) for slug, digest, first, last
+                   in self.db.execute("SELECT slug, digest, first, last FROM pages")}
+        seen = set()
+        updated = 0
+        with self.db:
+            for slug in backend.pages():
+                source = backend.read(page_name(slug))
+                if source is None:
+                    continue
+                seen.add(slug)
+                digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+                if slug in indexed:
+                    if indexed[slug][0] == digest:
+                        continue
+                    self.db.execute("DELETE FROM passages WHERE rowid BETWEEN ? AND ?", indexed[slug][1:])
+                title, passages = page_passages(source)
+                # A page's passages get consecutive rowids, so removing them later is a rowid range delete
+                rowids = [self.db.execute("INSERT INTO passages (slug, title, heading, body) VALUES (?, ?, ?, ?)",
+                                          (slug, title, heading, body)).lastrowid for heading, body in passages]
+                self.db.execute("INSERT OR REPLACE INTO pages (slug, digest, first, last) VALUES (?, ?, ?, ?)",
+                                (slug, digest, rowids[0] if rowids else 0, rowids[-1] if rowids else -1))
+                updated += 1
+            removed = sorted(set(indexed) - seen)
+            for slug in removed:
+                self.db.execute("DELETE FROM passages WHERE rowid BETWEEN ? AND ?", indexed[slug][1:])
+                self.db.execute("DELETE FROM pages WHERE slug = ?", (slug,))
+        return updated, len(removed)
+
+    def search(self, query, limit=3):
+        """Top passages for a free-text question as (slug, title, heading, body, score), best first"""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+        return self.db.execute(
+            f"SELECT slug, title, heading, body, bm25(passages, {weights}) AS score FROM passages "
+            "WHERE passages MATCH ? ORDER BY score LIMIT ?",
+            (" OR ".join(f'"{term}"' for term in terms), limit),
+        ).fetchall()
+
+    def export(self):
+        """The table as postings for lib/passageIndex.ts: per term, [passage id, weighted frequency, ...]"""
+        rows = self.db.execute("SELECT rowid, slug, title, heading, body FROM passages ORDER BY slug, rowid").fetchall()
+        ids = {row[0]: i for i, row in enumerate(rows)}
+        lengths = [0] * len(rows)
+        postings = {}
+        self.db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.passage_terms USING fts5vocab(main, passages, instance)")
+        for term, rowid, column, count in self.db.execute(
+                "SELECT term, doc, col, count(*) FROM temp.passage_terms GROUP BY term, doc, col ORDER BY term, doc"):
+            doc = ids[rowid]
+            lengths[doc] += count
+            frequencies = postings.setdefault(term, {})
+            weight = COLUMN_WEIGHTS[("slug", "title", "heading", "body").index(column)]
+            frequencies[doc] = frequencies.get(doc, 0) + weight * count
+        return {
+            "version": SCHEMA_VERSION,
+            "k1": BM25_K1,
+            "b": BM25_B,
+            "passages": [[slug, title, heading, body, lengths[i]] for i, (_, slug, title, heading, body) in enumerate(rows)],
+            "terms": {term: [value for item in sorted(docs.items()) for value in item] for term, docs in postings.items()},
+        }
+
+
+def export_index(index, path=EXPORT_PATH):
+    content = json.dumps(index.export(), ensure_ascii=False, separators=(",", ":")) + "\n"
+    return write_if_changed(path, content)
+
+
+def update_passages(backend=None, export_path=EXPORT_PATH, db_path=None, log=print):
+    """Bring the index up to date with the backend's pages and refresh the export; returns (updated, removed).
+
+    The backend defaults to a DiskBackend on app/blog and the database to the
+    export path with a .sqlite extension.
+    """
+    with PassageIndex(db_path or os.path.splitext(export_path)[0] + ".sqlite") as index:
+        updated, removed = index.update(backend or DiskBackend(BLOG_DIR))
+        if (updated or removed or not os.path.exists(export_path)) and export_index(index, export_path):
+            log(f"Created: {export_path}")
+    return updated, removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the chat passage index and optionally query it")
+    parser.add_argument("query", nargs="?", help="question to look up")
+    parser.add_argument("--blog", default=BLOG_DIR, help="blog pages directory (default: app/blog)")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database (default: data/chat-passages.sqlite)")
+    parser.add_argument("--export", default=EXPORT_PATH, help="JSON export (default: data/chat-passages.json)")
+    parser.add_argument("--limit", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    updated, removed = update_passages(DiskBackend(args.blog), args.export, args.db)
+    print(f"Passage index: {updated} pages updated, {removed} removed")
+    if args.query:
+        with PassageIndex(args.db) as index:
+            start = time.perf_counter()
+            hits = index.search(args.query, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+        for slug, _, heading, body, score in hits:
+            print(f"\n{score:8.3f}  /blog/{slug}  [{heading}]\n          {body[:200]}")
+        print(f"\n{len(hits)} passages in {elapsed:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Plans the app/blog directory tree before any page is written.
+
+The expected tree is every slug in the generator's catalog. Anything else
+that may legitimately live in the blog directory (pages recorded in the
+build manifest, hand-written posts, Next.js route folders such as page/ or
+[slug]/) is left alone; the remaining directories are reported as empty or
+orphaned, never deleted. Generated pages that dropped out of their catalog
+are reported by build_pages instead.
+"""
+
+import os
+
+from .catalog import HANDWRITTEN_CATALOG, iter_catalog
+from .manifest import MANIFEST_NAME, BuildManifest
+
+ROUTE_DIRS = {"page"}
+ROUTE_PREFIXES = ("[", "(", "_", "@")
+
+
+class DirectoryPlan:
+    def __init__(self, out_dir, missing, empty, orphaned):
+        self.out_dir = out_dir
+        self.missing = missing
+        self.empty = empty
+        self.orphaned = orphaned
+
+    def execute(self, log=print):
+        """Create the missing slug directories in one sorted pass"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        for slug in self.missing:
+            os.mkdir(os.path.join(self.out_dir, slug))
+        if self.missing:
+            log(f"Created {len(self.missing)} directories under {self.out_dir}")
+
+    def __str__(self):
+        lines = [f"{len(self.missing)} directories created, {len(self.empty)} empty, {len(self.orphaned)} orphaned"]
+        if self.empty:
+            lines.append("Empty directories:\n" + "\n".join(f"  {name}" for name in self.empty))
+        if self.orphaned:
+            lines.append("Orphaned directories (in no catalog):\n" + "\n".join(f"  {name}" for name in self.orphaned))
+        return "\n".join(lines)
+
+
+def _has_files(path):
+    for _, _, files in os.walk(path):
+        if files:
+            return True
+    return False
+
+
+def plan_directories(out_dir, slugs, handwritten=HANDWRITTEN_CATALOG):
+    """Compare the catalog slugs against what is already in out_dir"""
+    expected = set(slugs)
+    manifest = BuildManifest(os.path.join(out_dir, MANIFEST_NAME))
+    known = set(manifest.pages)
+    known.update(record["slug"] for record in iter_catalog(handwritten))
+
+    existing = set()
+    empty, orphaned = [], []
+    if os.path.isdir(out_dir):
+        with os.scandir(out_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name in ROUTE_DIRS or entry.name.startswith(ROUTE_PREFIXES):
+                    continue
+                existing.add(entry.name)
+                if entry.name in expected:
+                    continue
+                if not _has_files(entry.path):
+                    empty.append(entry.name)
+                elif entry.name not in known:
+                    orphaned.append(entry.name)
+    return DirectoryPlan(out_dir, sorted(expected - existing), sorted(empty), sorted(orphaned))
@@ -0,0 +1,127 @@
+"""Per-stage timers for a generator run.
+
+    with profile(json_path="build-profile.json") as profiler:
+        build_pages(..., profiler=profiler)
+    print(profiler.summary())
+
+Each stage keeps one sample per call, so stages that run once per page
+(lookup, check, render, makedirs, write) get p50/p95/max across pages. The
+"page" series is the wall time between consecutive pages written, which
+holds whether rendering happens in this process or in a worker pool.
+"""
+
+import contextlib
+import cProfile
+import json
+import math
+import time
+from collections import defaultdict
+
+STAGE_ORDER = ("components", "related", "plan", "lookup", "check", "render", "render_wait", "makedirs", "write", "commit",
+               "manifest", "index", "search", "sitemap", "passages", "page")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Profiler:
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.samples[name].append(time.perf_counter_ns() - start)
+
+    def add(self, name, nanoseconds):
+        self.samples[name].append(nanoseconds)
+
+    def timed(self, name, func):
+        """Wrap func so every call is recorded under name"""
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def summary(self):
+        stages = {}
+        names = sorted(self.samples, key=lambda name: (STAGE_ORDER.index(name) if name in STAGE_ORDER
+                                                       else len(STAGE_ORDER), name))
+        for name in names:
+            values = sorted(self.samples[name])
+            stages[name] = {
+                "count": len(values),
+                "total_s": round(sum(values) / 1e9, 6),
+                "p50_ms": round(percentile(values, 0.50) / 1e6, 4),
+                "p95_ms": round(percentile(values, 0.95) / 1e6, 4),
+                "max_ms": round(values[-1] / 1e6, 4),
+            }
+        return stages
+
+    def format(self):
+        lines = [f"{'stage':>12}  {'count':>7}  {'total s':>9}  {'p50 ms':>8}  {'p95 ms':>8}  {'max ms':>8}"]
+        for name, row in self.summary().items():
+            lines.append(f"{name:>12}  {row['count']:>7}  {row['total_s']:>9.3f}  {row['p50_ms']:>8.3f}  "
+                         f"{row['p95_ms']:>8.3f}  {row['max_ms']:>8.3f}")
+        return "\n".join(lines)
+
+
+class NullProfiler:
+    """Stands in for Profiler when profiling is off."""
+
+    def stage(self, name):
+        return contextlib.nullcontext()
+
+    def add(self, name, nanoseconds):
+        pass
+
+    def timed(self, name, func):
+        return func
+
+
+NULL_PROFILER = NullProfiler()
+
+
+@contextlib.contextmanager
+def profile(json_path=None, pstats_path=None):
+    """Collect stage timings for the block, optionally under cProfile.
+
+    On exit the summary is written to json_path and the cProfile stats to
+    pstats_path, when given.
+    """
+    profiler = Profiler()
+    cprofile = cProfile.Profile() if pstats_path else None
+    if cprofile:
+        cprofile.enable()
+    try:
+        yield profiler
+    finally:
+        if cprofile:
+            cprofile.disable()
+            cprofile.dump_stats(pstats_path)
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(profiler.summary(), f, indent=1)
+                f.write("\n")
+
+
+def add_profile_arguments(parser):
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true", help="print per-stage and per-page timings")
+    group.add_argument("--profile-json", metavar="FILE", help="write the timing summary as JSON (implies --profile)")
+    group.add_argument("--profile-pstats", metavar="FILE", help="dump cProfile stats to FILE (implies --profile)")
+
+
+def profile_from_args(args):
+    """profile() for a parsed command line, or a no-op context when profiling is off"""
+    if not (args.profile or args.profile_json or args.profile_pstats):
+        return contextlib.nullcontext(NULL_PROFILER)
+    return profile(json_path=args.profile_json, pstats_path=args.profile_pstats)
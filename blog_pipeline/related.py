@@ -0,0 +1,166 @@
+""""Related articles" links from TF-IDF similarity between catalog topics.
+
+Each topic's title, excerpt, keywords and section headings become an
+L2-normalised TF-IDF vector (sublinear term frequency, smoothed idf, title
+counted twice). Neighbours come from an inverted index rather than from
+comparing every pair. Each term's posting list is capped at the
+MAX_POSTINGS topics that weight it highest; a topic walks the lists of its
+terms, highest-weighted first, until it has read POSTINGS_BUDGET entries,
+and the RERANK best candidates by that partial dot product are rescored
+with the exact cosine similarity. The work per topic is bounded however
+large the catalog grows, and on a catalog small enough that every list fits
+the budget the result is exact.
+
+Neighbour lists are cached next to the build manifest. A run recomputes
+only topics whose text changed, topics whose cached neighbours changed or
+disappeared, and unchanged topics a changed topic now outranks a cached
+neighbour of; everything else keeps its cached list. Cached scores use the
+idf of the run that computed them, so `--force` recomputes every list.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+from .backends import write_if_changed
+from .search_index import tokenize
+
+RELATED_COUNT = 4
+MAX_POSTINGS = 100
+POSTINGS_BUDGET = 1500
+RERANK = 20
+CACHE_VERSION = 1
+
+
+def cache_path(out_dir, generator):
+    return os.path.join(out_dir, f".related-{generator}.json")
+
+
+def topic_text(entry):
+    """Text a topic is compared on, from its blog index entry"""
+    parts = [entry["title"], entry["title"], entry.get("excerpt", "")]
+    parts.extend(entry.get("keywords", ()))
+    parts.extend(entry.get("headings", ()))
+    return " ".join(parts)
+
+
+def tfidf_vectors(counts):
+    """One {term: weight} dict per Counter of term frequencies, L2-normalised
+
+    The list of counts is replaced by the vectors in place, so the two are
+    never both held for the whole catalog.
+    """
+    df = Counter(term for count in counts for term in count)
+    n = len(counts)
+    idf = {term: math.log((1 + n) / (1 + frequency)) + 1 for term, frequency in df.items()}
+    for row, count in enumerate(counts):
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in count.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        counts[row] = {term: weight / norm for term, weight in vector.items()}
+    return counts
+
+
+def inverted_index(vectors, max_postings=MAX_POSTINGS):
+    """term -> [(row, weight)] keeping the max_postings highest weights"""
+    postings = defaultdict(list)
+    for row, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings[term].append((row, weight))
+    for term, entries in postings.items():
+        if len(entries) > max_postings:
+            postings[term] = heapq.nlargest(max_postings, entries, key=lambda entry: entry[1])
+    return postings
+
+
+def cosine(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def similarities(vectors, postings, row, budget=POSTINGS_BUDGET, rerank=RERANK):
+    """{other row: cosine similarity} for the `rerank` best candidates of `row`"""
+    vector = vectors[row]
+    partial = defaultdict(float)
+    for term, weight in sorted(vector.items(), key=itemgetter(1), reverse=True):
+        entries = postings[term]
+        for other, other_weight in entries:
+            partial[other] += weight * other_weight
+        budget -= len(entries)
+        if budget <= 0:
+            break
+    partial.pop(row, None)
+    return {other: cosine(vector, vectors[other]) for other, _ in heapq.nlargest(rerank, partial.items(), key=itemgetter(1))}
+
+
+def top_k(scores, slugs, k):
+    """[(slug, score)] of the k best, ties broken by slug so lists are stable"""
+    best = sorted(scores.items(), key=lambda item: (-item[1], slugs[item[0]]))[:k]
+    return [(slugs[other], round(score, 6)) for other, score in best]
+
+
+class RelatedCache:
+    def __init__(self, path):
+        self.path = path
+        self.topics = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.topics = data["topics"]
+
+    def save(self):
+        if self.path:
+            content = json.dumps({"version": CACHE_VERSION, "topics": self.topics}, sort_keys=True, indent=1)
+            write_if_changed(self.path, content + "\n")
+
+
+def related_posts(entries, k=RELATED_COUNT, cache_file=None, force=False, max_postings=MAX_POSTINGS, log=print):
+    """{slug: [(slug, title), ...]} with each topic's k nearest neighbours, best first
+
+    `entries` is read once and may be a generator: only each topic's slug,
+    title, digest and term counts are kept, not the entries themselves.
+    """
+    slugs, titles, digests, counts = [], {}, [], []
+    for entry in entries:
+        text = topic_text(entry)
+        slugs.append(entry["slug"])
+        titles[entry["slug"]] = entry["title"]
+        digests.append(hashlib.sha256(text.encode("utf-8")).hexdigest()[:16])
+        counts.append(Counter(tokenize(text)))
+    cache = RelatedCache(cache_file)
+    cached = {} if force else cache.topics
+
+    changed = {row for row, slug in enumerate(slugs) if cached.get(slug, {}).get("digest") != digests[row]}
+    gone = set(cached) - set(slugs)
+    if changed or gone:
+        vectors = tfidf_vectors(counts)
+        postings = inverted_index(vectors, max_postings)
+        moved = {slugs[row] for row in changed} | gone
+        stale = set(changed)
+        fresh = {}
+        for row in sorted(changed):
+            scores = similarities(vectors, postings, row)
+            fresh[row] = top_k(scores, slugs, k)
+            # A changed topic may now outrank the weakest cached neighbour of an unchanged one
+            for other, score in scores.items():
+                if other not in stale:
+                    neighbours = cached[slugs[other]]["related"]
+                    if len(neighbours) < k or score > neighbours[-1][1]:
+                        stale.add(other)
+        for row, slug in enumerate(slugs):
+            if row not in stale and any(neighbour in moved for neighbour, _ in cached[slug]["related"]):
+                stale.add(row)
+        for row in sorted(stale - set(fresh)):
+            fresh[row] = top_k(similarities(vectors, postings, row), slugs, k)
+
+        cache.topics = {slug: cached[slug] for slug in slugs if slug in cached}
+        for row, neighbours in fresh.items():
+            cache.topics[slugs[row]] = {"digest": digests[row], "related": [list(item) for item in neighbours]}
+        cache.save()
+        log(f"Related articles: {len(fresh)} of {len(slugs)} topics recomputed")
+    return {slug: [(neighbour, titles[neighbour]) for neighbour, _ in cache.topics[slug]["related"]] for slug in slugs}
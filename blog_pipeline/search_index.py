@@ -0,0 +1,140 @@
+"""Static inverted index for the client-side blog search (lib/blogSearch.ts).
+
+Posts are numbered in blog index order (newest first). Every title,
+excerpt, keyword and section heading is tokenised the same way
+lib/blogSearch.ts tokenises a query, and each term gets a posting list of
+(post id, weight) pairs, weighted by the field it came from.
+
+The sorted term dictionary is cut into range shards of roughly SHARD_BYTES
+each, and the post list into fixed-size shards. Shard files are named by a
+hash of their content, so they can be cached forever; public/search/index.json
+is the only file the browser has to revalidate. A prefix lookup reads
+index.json, binary-searches the shard boundaries and fetches only the shards
+whose range covers the prefix.
+"""
+
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_right
+from collections import defaultdict
+
+from .backends import write_if_changed
+
+SEARCH_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "public", "search"))
+INDEX_NAME = "index.json"
+SHARD_BYTES = 16 * 1024
+DOC_SHARD_SIZE = 256
+FIELD_WEIGHTS = {"title": 6, "keywords": 4, "headings": 3, "excerpt": 2, "category": 1}
+# Kept in step with STOPWORDS in lib/blogSearch.ts
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in into is it its of on or that the this to what when why with you your".split()
+)
+TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(text):
+    return [token for token in TOKEN_SPLIT.split(text.lower()) if len(token) > 1 and token not in STOPWORDS]
+
+
+def _field_text(value):
+    return " ".join(value) if isinstance(value, (list, tuple)) else (value or "")
+
+
+def build_postings(posts):
+    """term -> [(post id, weight), ...] with ids ascending; a term's weight is the best field it appears in"""
+    postings = defaultdict(list)
+    for doc_id, post in enumerate(posts):
+        weights = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(_field_text(post.get(field))):
+                if weights.get(term, 0) < weight:
+                    weights[term] = weight
+        for term, weight in weights.items():
+            postings[term].append((doc_id, weight))
+    return postings
+
+
+def _encode(postings):
+    """Flatten to [id delta, weight, id delta, weight, ...]"""
+    flat, previous = [], 0
+    for doc_id, weight in postings:
+        flat += (doc_id - previous, weight)
+        previous = doc_id
+    return flat
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _hashed(prefix, content):
+    return f"{prefix}-{hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]}.json"
+
+
+def term_shards(postings, shard_bytes=SHARD_BYTES):
+    """Yield (terms, encoded posting lists) for consecutive ranges of the sorted dictionary"""
+    terms, lists, size = [], [], 0
+    for term in sorted(postings):
+        encoded = _encode(postings[term])
+        cost = len(term) + 4 + len(_dump(encoded))
+        if terms and size + cost > shard_bytes:
+            yield terms, lists
+            terms, lists, size = [], [], 0
+        terms.append(term)
+        lists.append(encoded)
+        size += cost
+    if terms:
+        yield terms, lists
+
+
+def build_search_files(posts, shard_bytes=SHARD_BYTES, doc_shard_size=DOC_SHARD_SIZE):
+    """Return {file name: content} for index.json and every shard"""
+    files = {}
+    doc_names = []
+    for start in range(0, len(posts), doc_shard_size):
+        chunk = [[post["slug"], post["title"], post.get("excerpt", ""), post.get("category", "")]
+                 for post in posts[start:start + doc_shard_size]]
+        content = _dump(chunk)
+        name = _hashed("docs", content)
+        files[name] = content
+        doc_names.append(name)
+
+    term_index = []
+    for terms, lists in term_shards(build_postings(posts), shard_bytes):
+        content = _dump({"terms": terms, "postings": lists})
+        name = _hashed("terms", content)
+        files[name] = content
+        term_index.append([terms[0], name])
+
+    files[INDEX_NAME] = _dump({
+        "version": 1,
+        "totalPosts": len(posts),
+        "docShardSize": doc_shard_size,
+        "docs": doc_names,
+        "terms": term_index,
+    }) + "\n"
+    return files
+
+
+def shards_for_prefix(term_index, prefix):
+    """Positions in index.json's "terms" whose range can hold a term starting with prefix"""
+    firsts = [first for first, _ in term_index]
+    start = max(bisect_right(firsts, prefix) - 1, 0)
+    end = bisect_right(firsts, prefix + "\uffff")
+    return range(start, max(end, start + 1)) if firsts else range(0)
+
+
+def write_search_index(posts, out_dir=SEARCH_DIR, log=print):
+    """Write the search files for `posts` (already in blog index order); returns {file name: size}"""
+    files = build_search_files(posts)
+    for name, content in files.items():
+        file_path = os.path.join(out_dir, name)
+        if write_if_changed(file_path, content):
+            log(f"Created: {file_path}")
+    for name in os.listdir(out_dir):
+        if name not in files:
+            os.remove(os.path.join(out_dir, name))
+            log(f"Removed: {os.path.join(out_dir, name)}")
+    return {name: len(content.encode("utf-8")) for name, content in files.items()}
@@ -0,0 +1,218 @@
+"""Static sitemap files for the marketing pages and every blog post.
+
+Each URL's lastmod is the date its page last changed. A page's hash covers
+its page.tsx and every local module it imports, directly or through other
+modules (a generated page is mostly components/blog/*), so a template change
+moves the date of every page that renders it. Hashes are kept in
+data/sitemap-history.json; a URL's date only moves forward when its hash
+differs from the one recorded on the previous run, so regenerating an
+unchanged tree leaves the sitemap byte-identical.
+
+URLs are split into shards of at most 50,000 entries (the protocol limit)
+under public/sitemaps/, and public/sitemap.xml is a sitemap index pointing at
+them. Every file also gets a pre-gzipped .gz twin.
+"""
+
+import datetime
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+from xml.sax.saxutils import escape
+
+from .backends import DiskBackend, write_if_changed
+from .build import page_name
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+APP_DIR = os.path.join(ROOT_DIR, "app")
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+SITE_URL = os.environ.get("NEXT_PUBLIC_SITE_URL", "https://myaibookkeeper.com")
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+# (path, changefreq, priority) for the hand-built pages under app/
+STATIC_ROUTES = (
+    ("/", "daily", "1.0"),
+    ("/about", "monthly", "0.8"),
+    ("/faq", "monthly", "0.8"),
+    ("/how-to-use", "monthly", "0.8"),
+    ("/popular-uses", "monthly", "0.7"),
+    ("/blog", "weekly", "0.7"),
+)
+# Local imports: the "@/" alias (the repository root) or a path relative to the importing file
+LOCAL_IMPORT = re.compile(r"""(?:from|import)\s*['"]((?:@|\.{1,2})/[^'"]+)['"]""")
+MODULE_EXTENSIONS = (".tsx", ".ts", "/index.tsx", "/index.ts")
+POST_CHANGEFREQ = "monthly"
+POST_PRIORITY = "0.6"
+
+URLSET_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = "</urlset>\n"
+INDEX_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+INDEX_CLOSE = "</sitemapindex>\n"
+
+
+class ImportHashes:
+    """Hash of a page source together with the local modules it imports, transitively.
+
+    Each module is read and resolved once per run, however many pages import it.
+    """
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.modules = {}
+
+    def resolve(self, spec, base_dir):
+        base = os.path.join(self.root_dir, spec[2:]) if spec.startswith("@/") else os.path.join(base_dir, spec)
+        for extension in MODULE_EXTENSIONS:
+            if os.path.isfile(base + extension):
+                return os.path.normpath(base + extension)
+        return None
+
+    def imports(self, source, base_dir):
+        """Paths of every local module the source imports, directly or not"""
+        paths = set()
+        for spec in LOCAL_IMPORT.findall(source):
+            path = self.resolve(spec, base_dir)
+            if path and path not in paths:
+                paths.add(path)
+                paths |= self.module(path)[1]
+        return paths
+
+    def module(self, path):
+        """(sha256 of the file, its transitive imports), cached"""
+        if path not in self.modules:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+            self.modules[path] = (digest, frozenset())  # so an import cycle stops here
+            self.modules[path] = (digest, frozenset(self.imports(source, os.path.dirname(path))))
+        return self.modules[path]
+
+    def digest(self, source, base_dir):
+        digest = hashlib.sha256(source.encode("utf-8"))
+        for path in sorted(self.imports(source, base_dir)):
+            digest.update(os.path.relpath(path, self.root_dir).encode("utf-8"))
+            digest.update(self.module(path)[0].encode("ascii"))
+        return digest.hexdigest()
+
+
+class LastmodHistory:
+    """Content hash and last-changed date for each URL path."""
+
+    def __init__(self, path, today=None):
+        self.path = path
+        self.today = today or datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        self.entries = {}
+        self.seen = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def lastmod(self, url_path, digest):
+        """Date the page last changed, given its current hash, or None if it has no source"""
+        self.seen.add(url_path)
+        if digest is None:
+            return None
+        entry = self.entries.get(url_path)
+        if entry is None or entry["hash"] != digest:
+            entry = self.entries[url_path] = {"hash": digest, "lastmod": self.today}
+        return entry["lastmod"]
+
+    def save(self):
+        entries = {url_path: self.entries[url_path] for url_path in sorted(self.seen) if url_path in self.entries}
+        content = json.dumps(entries, indent=1, sort_keys=True) + "\n"
+        return write_if_changed(self.path, content)
+
+
+def sitemap_urls(entries, history, app_dir=APP_DIR, backend=None):
+    """Yield (loc, lastmod, changefreq, priority) for the static routes and every blog post
+
+    Blog pages are read from `backend`, a DiskBackend on app_dir/blog by default.
+    """
+    blog_dir = os.path.join(app_dir, "blog")
+    backend = backend or DiskBackend(blog_dir)
+    routes = DiskBackend(app_dir)
+    hashes = ImportHashes(os.path.dirname(os.path.normpath(app_dir)))
+
+    def digest(source, base_dir):
+        return None if source is None else hashes.digest(source, base_dir)
+
+    for url_path, changefreq, priority in STATIC_ROUTES:
+        name = os.path.join(url_path.strip("/"), "page.tsx")
+        lastmod = history.lastmod(url_path, digest(routes.read(name), os.path.dirname(routes.path(name))))
+        yield SITE_URL + url_path.rstrip("/"), lastmod, changefreq, priority
+    for slug in sorted(entry["slug"] for entry in entries):
+        url_path = f"/blog/{slug}"
+        lastmod = history.lastmod(url_path, digest(backend.read(page_name(slug)), os.path.join(blog_dir, slug)))
+        yield SITE_URL + url_path, lastmod, POST_CHANGEFREQ, POST_PRIORITY
+
+
+def _url_element(loc, lastmod, changefreq, priority):
+    lines = [f"  <url>\n    <loc>{escape(loc)}</loc>\n"]
+    if lastmod:
+        lines.append(f"    <lastmod>{lastmod}</lastmod>\n")
+    lines.append(f"    <changefreq>{changefreq}</changefreq>\n    <priority>{priority}</priority>\n  </url>\n")
+    return "".join(lines)
+
+
+def shard_urls(urls, max_urls=MAX_URLS, max_bytes=MAX_BYTES):
+    """Group rendered <url> elements into shards under both protocol limits; yields (body, latest lastmod)"""
+    limit = max_bytes - len(URLSET_OPEN) - len(URLSET_CLOSE)
+    elements, size, latest = [], 0, None
+    for url in urls:
+        element = _url_element(*url)
+        if elements and (len(elements) == max_urls or size + len(element.encode("utf-8")) > limit):
+            yield "".join(elements), latest
+            elements, size, latest = [], 0, None
+        elements.append(element)
+        size += len(element.encode("utf-8"))
+        if url[1] and (latest is None or url[1] > latest):
+            latest = url[1]
+    if elements:
+        yield "".join(elements), latest
+
+
+def _write_pair(file_path, content):
+    """Write an XML file and its .gz twin; mtime is pinned so unchanged content gives unchanged bytes"""
+    changed = write_if_changed(file_path, content)
+    gz_path = file_path + ".gz"
+    if changed or not os.path.exists(gz_path):
+        with open(gz_path, "wb") as f:
+            f.write(gzip.compress(content.encode("utf-8"), mtime=0))
+    return changed
+
+
+def write_sitemaps(entries, public_dir=PUBLIC_DIR, app_dir=APP_DIR, backend=None,
+                   history_path=None, max_urls=MAX_URLS, log=print):
+    """Write public/sitemap.xml (an index) and its shards; returns the number of shards
+
+    The lastmod history defaults to data/sitemap-history.json beside public_dir.
+    """
+    history = LastmodHistory(history_path or os.path.join(public_dir, os.pardir, "data", "sitemap-history.json"))
+    shard_dir = os.path.join(public_dir, "sitemaps")
+    names = []
+    index = [INDEX_OPEN]
+    urls = sitemap_urls(entries, history, app_dir=app_dir, backend=backend)
+    for number, (body, latest) in enumerate(shard_urls(urls, max_urls=max_urls), 1):
+        name = f"sitemap-{number}.xml"
+        names.append(name)
+        file_path = os.path.join(shard_dir, name)
+        if _write_pair(file_path, URLSET_OPEN + body + URLSET_CLOSE):
+            log(f"Created: {file_path}")
+        index.append(f"  <sitemap>\n    <loc>{escape(f'{SITE_URL}/sitemaps/{name}.gz')}</loc>\n")
+        if latest:
+            index.append(f"    <lastmod>{latest}</lastmod>\n")
+        index.append("  </sitemap>\n")
+    index.append(INDEX_CLOSE)
+
+    index_path = os.path.join(public_dir, "sitemap.xml")
+    if _write_pair(index_path, "".join(index)):
+        log(f"Created: {index_path}")
+    for stale in glob.glob(os.path.join(shard_dir, "sitemap-*.xml*")):
+        if os.path.basename(stale).removesuffix(".gz") not in names:
+            os.remove(stale)
+            log(f"Removed: {stale}")
+    history.save()
+    return len(names)
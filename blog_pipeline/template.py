@@ -0,0 +1,78 @@
+"""Compile-once page templates.
+
+A template is plain page source with `{{ name }}` slots. It is parsed once
+into alternating static segments and slot names; rendering copies the
+precomputed segment list, drops the slot values in and joins it. Compiled
+templates are cached on disk next to the template files, keyed by the hash
+of the template source, so a rerun does not even re-parse them.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+CACHE_DIR = os.path.join(TEMPLATE_DIR, ".cache")
+
+SLOT_RE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+_loaded = {}
+
+
+class Template:
+    def __init__(self, parts, slots, version):
+        # parts holds the static segments with a None placeholder at every slot
+        # position; slots pairs each placeholder index with its slot name.
+        self.parts = parts
+        self.slots = slots
+        self.version = version
+        self.names = frozenset(name for _, name in slots)
+
+    def render(self, values):
+        parts = self.parts.copy()
+        for index, name in self.slots:
+            parts[index] = values[name]
+        return "".join(parts)
+
+
+def compile_template(source, version=None):
+    parts, slots = [], []
+    position = 0
+    for match in SLOT_RE.finditer(source):
+        if match.start() > position:
+            parts.append(source[position:match.start()])
+        slots.append((len(parts), match.group(1)))
+        parts.append(None)
+        position = match.end()
+    if position < len(source):
+        parts.append(source[position:])
+    return Template(parts, slots, version or hashlib.sha256(source.encode("utf-8")).hexdigest()[:16])
+
+
+def load_template(name, template_dir=TEMPLATE_DIR, cache_dir=CACHE_DIR):
+    """Load a template file, reusing the in-process or on-disk compiled form when the source is unchanged"""
+    path = os.path.join(template_dir, name)
+    with open(path, "rb") as f:
+        source = f.read()
+    version = hashlib.sha256(source).hexdigest()[:16]
+
+    cached = _loaded.get(path)
+    if cached is not None and cached.version == version:
+        return cached
+
+    cache_path = os.path.join(cache_dir, f"{name}.{version}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        template = Template(data["parts"], [tuple(slot) for slot in data["slots"]], version)
+    except (FileNotFoundError, ValueError, KeyError):
+        template = compile_template(source.decode("utf-8"), version)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"parts": template.parts, "slots": template.slots}, f)
+        os.replace(tmp_path, cache_path)
+
+    _loaded[path] = template
+    return template
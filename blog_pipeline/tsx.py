@@ -0,0 +1,22 @@
+"""Helpers for emitting TypeScript source from Python values."""
+
+import json
+
+
+def ts_literal(value):
+    """A JSON value is also a valid TypeScript literal, with quotes and backslashes escaped"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def ts_fields(fields, indent="  "):
+    """The property lines of ts_object, for building an object from several pieces"""
+    return "\n".join(f"{indent}{key}: {ts_literal(value)}," for key, value in fields.items())
+
+
+def ts_object(fields, indent="  "):
+    return ts_block(ts_fields(fields, indent))
+
+
+def ts_block(*pieces):
+    """An object literal from property lines made by ts_fields"""
+    return "{\n" + "\n".join(pieces) + "\n}"
@@ -0,0 +1,293 @@
+"""Structural checks for rendered page.tsx source, cheap enough to run on every page.
+
+This is not a TypeScript parser. It scans the source once, tracking string
+and template literals, comments, bracket nesting and JSX elements, which is
+enough to catch the mistakes a template can make before `next build` does:
+
+- a string literal broken by an unescaped quote (an apostrophe in a
+  single-quoted title)
+- unbalanced (), [] or {} and unclosed or mismatched JSX tags
+- a default-exported component whose name is not a valid identifier
+  (a slug such as "5-bookkeeping-mistakes" turned into "5Bookkeeping...")
+- lucide-react icons imported twice, imported but unused, or rendered as
+  JSX without being imported or declared
+"""
+
+import bisect
+import keyword
+import re
+
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+TAG_NAME = re.compile(r"[\w$.:-]*")
+TOKEN = re.compile(r"""\s*(?:
+    (?P<skip>//[^\n]*|/\*.*?\*/)
+  | (?P<comment>/\*)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<quote>['"])
+  | (?P<backtick>`)
+  | (?P<open>[([{])
+  | (?P<close>[)\]}])
+  | (?P<tag><(?=[A-Za-z>]))
+  | (?P<op>=>|&&|\|\||.)
+)""", re.VERBOSE | re.DOTALL)
+STRING_STOP = {"'": re.compile(r"[\\'\n]"), '"': re.compile(r'[\\"\n]')}
+TEMPLATE_STOP = re.compile(r"[\\`]|\$\{")
+TEXT_STOP = re.compile(r"[<{]")
+COMPONENT = re.compile(r"export\s+default\s+function\s*([^\s(]*)\s*\(")
+LUCIDE_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*['\"]lucide-react['\"]")
+DECLARATION = re.compile(r"\b(?:function|const|let|var|class)\s+([A-Za-z_$][\w$]*)")
+DESTRUCTURED = re.compile(r"[{,]\s*[\w$]+\s*:\s*([A-Z][\w$]*)")
+IMPORT_CLAUSE = re.compile(r"import\s+(?:type\s+)?([^'\"]*?)\s+from\s")
+CLOSERS = {"(": ")", "[": "]", "{": "}"}
+# Tokens after which "<" starts a JSX element rather than a comparison or type argument
+JSX_AFTER = {None, "(", ",", "=", "{", "[", "?", ":", "return", "=>", "&&", "||"}
+RESERVED = set(keyword.kwlist) | {"default", "function", "export", "import", "new", "this", "typeof", "var", "let",
+                                  "const", "switch", "case", "void", "delete", "instanceof", "enum", "extends"}
+
+
+class PageValidationError(ValueError):
+    """Raised with every failing page, before any page is written."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        details = "\n".join(f"  {name}: {error}" for name, errors in failures for error in errors)
+        super().__init__(f"{len(failures)} page(s) failed validation:\n{details}")
+
+
+class _Scanner:
+    def __init__(self, source):
+        self.src = source
+        self.i = 0
+        self.errors = []
+        self.identifiers = {}
+        self.jsx_tags = set()
+        self.texts = None
+        self.last = None
+        self.newlines = [m.start() for m in re.finditer("\n", source)]
+
+    def line(self, index):
+        return bisect.bisect_left(self.newlines, index) + 1
+
+    def error(self, index, message):
+        self.errors.append(f"line {self.line(index)}: {message}")
+
+    def code(self, opener=None, start=None):
+        src = self.src
+        closer = CLOSERS.get(opener)
+        while True:
+            match = TOKEN.match(src, self.i)
+            if match is None:
+                self.i = len(src)
+                break
+            kind = match.lastgroup
+            token = match.group(kind)
+            self.i = match.start(kind)
+            if kind == "skip":
+                self.i = match.end()
+            elif kind == "comment":
+                self.error(self.i, "unterminated comment")
+                self.i = len(src)
+            elif kind == "word":
+                self.identifiers[token] = self.identifiers.get(token, 0) + 1
+                self.last = token
+                self.i = match.end()
+            elif kind == "quote":
+                self.string(token)
+                self.last = "string"
+            elif kind == "backtick":
+                self.template()
+                self.last = "string"
+            elif kind == "open":
+                self.i += 1
+                self.last = token
+                self.code(token, self.i - 1)
+                self.last = CLOSERS[token]
+            elif kind == "close":
+                self.i += 1
+                if token == closer:
+                    return
+                self.error(self.i - 1, f"unexpected '{token}'" + (f", expected '{closer}'" if closer else ""))
+            elif kind == "tag" and self.last in JSX_AFTER:
+                self.element()
+                self.last = "jsx"
+            else:
+                self.last = token
+                self.i = match.end()
+        if closer:
+            self.error(start, f"unclosed '{opener}'")
+
+    def string(self, quote):
+        src = self.src
+        start = self.i
+        self.i += 1
+        stop = STRING_STOP[quote]
+        while True:
+            match = stop.search(src, self.i)
+            if match is None:
+                self.i = len(src)
+                break
+            self.i = match.start()
+            c = match.group()
+            if c == "\\":
+                self.i += 2
+            elif c == quote:
+                self.i += 1
+                return
+            else:
+                break
+        self.error(start, f"unterminated string literal {src[start:self.i][:40]!r}")
+
+    def template(self):
+        src = self.src
+        start = self.i
+        self.i += 1
+        while True:
+            match = TEMPLATE_STOP.search(src, self.i)
+            if match is None:
+                break
+            self.i = match.start()
+            c = match.group()
+            if c == "\\":
+                self.i += 2
+            elif c == "`":
+                self.i += 1
+                return
+            else:
+                self.i += 2
+                self.last = "{"
+                self.code("{", self.i - 1)
+        self.i = len(src)
+        self.error(start, "unterminated template literal")
+
+    def element(self):
+        src = self.src
+        start = self.i
+        self.i += 1
+        match = TAG_NAME.match(src, self.i)
+        name = match.group()
+        self.i = match.end()
+        if name:
+            self.jsx_tags.add(name)
+            root = name.split(".")[0]
+            self.identifiers[root] = self.identifiers.get(root, 0) + 1
+        while self.i < len(src):
+            c = src[self.i]
+            if c.isspace():
+                self.i += 1
+            elif src.startswith("/>", self.i):
+                self.i += 2
+                return
+            elif c == ">":
+                self.i += 1
+                self.children(name, start)
+                return
+            elif c == "{":
+                self.i += 1
+                self.last = "{"
+                self.code("{", self.i - 1)
+            elif c in "'\"":
+                end = src.find(c, self.i + 1)
+                if end < 0:
+                    self.error(self.i, "unterminated attribute string")
+                    self.i = len(src)
+                else:
+                    self.i = end + 1
+            elif c == "<":
+                self.error(self.i, f"unexpected '<' inside <{name}>")
+                return
+            else:
+                self.i += 1
+        self.error(start, f"unclosed tag <{name}>")
+
+    def children(self, name, start):
+        src = self.src
+        while self.i < len(src):
+            c = src[self.i]
+            if src.startswith("</", self.i):
+                end = src.find(">", self.i)
+                closing = src[self.i + 2:end].strip() if end >= 0 else ""
+                if closing != name:
+                    self.error(self.i, f"</{closing}> closes <{name}> opened on line {self.line(start)}")
+                self.i = len(src) if end < 0 else end + 1
+                return
+            if c == "<":
+                self.element()
+            elif c == "{":
+                self.i += 1
+                self.last = "{"
+                self.code("{", self.i - 1)
+            else:
+                match = TEXT_STOP.search(src, self.i)
+                end = match.start() if match else len(src)
+                if self.texts is not None:
+                    self.texts.append((name, src[self.i:end]))
+                self.i = end
+        self.error(start, f"unclosed <{name}>")
+
+
+def import_names(clause):
+    """Local names bound by an import clause such as `X, { A, B as C }`"""
+    names = []
+    for part in re.split(r"[{},]", clause):
+        part = part.strip()
+        if part.startswith("type "):
+            part = part[5:].strip()
+        if part.startswith("* as "):
+            part = part[5:]
+        if part:
+            names.append(part.split(" as ")[-1].strip())
+    return names
+
+
+def scan(source):
+    """Scan source once; returns (errors, identifier counts outside strings and comments, JSX tag names)"""
+    scanner = _Scanner(source)
+    scanner.code()
+    return scanner.errors, scanner.identifiers, scanner.jsx_tags
+
+
+def jsx_text(source):
+    """(enclosing tag name, raw text) for every JSX text node, in source order"""
+    scanner = _Scanner(source)
+    scanner.texts = []
+    scanner.code()
+    return scanner.texts
+
+
+def validate_page(source):
+    """Return a list of problems found in one page; empty means it passed"""
+    errors, identifiers, jsx_tags = scan(source)
+
+    match = COMPONENT.search(source)
+    if not match:
+        errors.append("no `export default function` component")
+    else:
+        name = match.group(1)
+        if not IDENTIFIER.fullmatch(name) or name in RESERVED:
+            errors.append(f"component name {name!r} is not a valid identifier")
+        elif not name[0].isupper():
+            errors.append(f"component name {name!r} must start with an uppercase letter")
+
+    icons = []
+    for clause in LUCIDE_IMPORT.findall(source):
+        icons.extend(import_names(clause))
+    for icon in sorted({icon for icon in icons if icons.count(icon) > 1}):
+        errors.append(f"icon {icon} is imported more than once")
+    for icon in sorted(set(icons)):
+        if identifiers.get(icon, 0) < 2:
+            errors.append(f"icon {icon} is imported but never used")
+
+    declared = set(DECLARATION.findall(source)) | set(DESTRUCTURED.findall(source))
+    for clause in IMPORT_CLAUSE.findall(source):
+        declared.update(import_names(clause))
+    for tag in sorted(jsx_tags):
+        root = tag.split(".")[0]
+        if root[:1].isupper() and root not in declared:
+            errors.append(f"<{tag}> is rendered but never imported or declared")
+    return errors
+
+
+def render_checked(render, record):
+    """Render a record and validate the result; module-level so process pools can pickle it"""
+    content = render(record)
+    return content, validate_page(content)
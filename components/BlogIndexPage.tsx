@@ -0,0 +1,185 @@
+import Link from 'next/link'
+import { Calendar, Clock, ArrowLeft, ArrowRight, BookOpen } from 'lucide-react'
+import BlogSearch from '@/components/BlogSearch'
+import { blogIcons } from '@/data/blog-index/icons'
+import { BlogIndexEntry, blogIndexHref, blogIndexMeta, getBlogIndexPage, getFeaturedPosts } from '@/lib/blogIndex'
+
+interface BlogIndexPageProps {
+  page: number
+}
+
+const { totalPages } = blogIndexMeta
+
+export default async function BlogIndexPage({ page }: BlogIndexPageProps) {
+  const [posts, featured] = await Promise.all([
+    getBlogIndexPage(page),
+    page === 1 ? getFeaturedPosts() : Promise.resolve<BlogIndexEntry[]>([]),
+  ])
+
+  return (
+    <div className="min-h-screen bg-gradient-to-b from-neutral-50 to-white">
+      {/* Header */}
+      <div className="bg-gradient-to-br from-secondary-50 via-white to-accent-50 border-b border-neutral-200">
+        <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-16">
+          <div className="text-center">
+            <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 mb-4">
+              AI Bookkeeping Blog
+            </h1>
+            <p className="text-xl text-neutral-600 max-w-3xl mx-auto">
+              Expert guides, tips, and insights on DIY bookkeeping, AI accounting tools, and financial management for small business owners
+            </p>
+            <BlogSearch />
+          </div>
+        </div>
+      </div>
+
+      {/* Featured Posts */}
+      <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
+        {featured.length > 0 && (
+          <>
+            <h2 className="text-2xl font-bold text-neutral-900 mb-8">Featured Articles</h2>
+            <div className="grid md:grid-cols-2 gap-8 mb-16">
+              {featured.map((post) => {
+                const Icon = blogIcons[post.icon] ?? BookOpen
+                return (
+                  <Link
+                    key={post.slug}
+                    href={`/blog/${post.slug}`}
+                    className="group bg-white rounded-2xl shadow-sm hover:shadow-xl transition-all duration-300 overflow-hidden border border-neutral-100"
+                  >
+                    <div className="p-8">
+                      <div className="flex items-center space-x-3 mb-4">
+                        <div className="p-2 bg-secondary-100 rounded-lg group-hover:bg-secondary-200 transition-colors">
+                          <Icon className="w-5 h-5 text-secondary-600" />
+                        </div>
+                        <span className="text-sm font-medium text-secondary-600">{post.category}</span>
+                      </div>
+                      <h3 className="text-2xl font-bold text-neutral-900 mb-3 group-hover:text-secondary-600 transition-colors">
+                        {post.title}
+                      </h3>
+                      <p className="text-neutral-600 mb-4 line-clamp-2">
+                        {post.excerpt}
+                      </p>
+                      <div className="flex items-center justify-between">
+                        <div className="flex items-center space-x-4 text-sm text-neutral-500">
+                          <div className="flex items-center space-x-1">
+                            <Calendar className="w-4 h-4" />
+                            <span>{new Date(post.date).toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' })}</span>
+                          </div>
+                          <div className="flex items-center space-x-1">
+                            <Clock className="w-4 h-4" />
+                            <span>{post.readTime}</span>
+                          </div>
+                        </div>
+                        <ArrowRight className="w-5 h-5 text-secondary-500 group-hover:translate-x-1 transition-transform" />
+                      </div>
+                    </div>
+                  </Link>
+                )
+              })}
+            </div>
+          </>
+        )}
+
+        {/* All Posts */}
+        <h2 className="text-2xl font-bold text-neutral-900 mb-8">
+          All Articles
+          {page > 1 && <span className="ml-3 text-base font-medium text-neutral-500">Page {page} of {totalPages}</span>}
+        </h2>
+        <div className="space-y-6">
+          {posts.map((post) => {
+            const Icon = blogIcons[post.icon] ?? BookOpen
+            return (
+              <Link
+                key={post.slug}
+                href={`/blog/${post.slug}`}
+                className="group block bg-white rounded-xl shadow-sm hover:shadow-lg transition-all duration-300 border border-neutral-100 p-6"
+              >
+                <div className="flex items-start space-x-4">
+                  <div className="flex-shrink-0 p-2 bg-neutral-100 rounded-lg group-hover:bg-secondary-100 transition-colors">
+                    <Icon className="w-5 h-5 text-neutral-600 group-hover:text-secondary-600" />
+                  </div>
+                  <div className="flex-1 min-w-0">
+                    <div className="flex items-center space-x-3 mb-2">
+                      <span className="text-sm font-medium text-secondary-600">{post.category}</span>
+                      <span className="text-sm text-neutral-400">•</span>
+                      <span className="text-sm text-neutral-500">{post.readTime}</span>
+                    </div>
+                    <h3 className="text-xl font-bold text-neutral-900 mb-2 group-hover:text-secondary-600 transition-colors">
+                      {post.title}
+                    </h3>
+                    <p className="text-neutral-600 mb-3 line-clamp-2">
+                      {post.excerpt}
+                    </p>
+                    <div className="flex items-center text-sm text-neutral-500">
+                      <Calendar className="w-4 h-4 mr-1" />
+                      <span>{new Date(post.date).toLocaleDateString('en-US', { month: 'long', day: 'numeric', year: 'numeric' })}</span>
+                    </div>
+                  </div>
+                  <ArrowRight className="flex-shrink-0 w-5 h-5 text-neutral-400 group-hover:text-secondary-500 group-hover:translate-x-1 transition-all" />
+                </div>
+              </Link>
+            )
+          })}
+        </div>
+
+        {/* Pagination */}
+        {totalPages > 1 && (
+          <nav className="flex items-center justify-center space-x-2 mt-12" aria-label="Blog pages">
+            {page > 1 && (
+              <Link
+                href={blogIndexHref(page - 1)}
+                className="inline-flex items-center px-4 py-2 text-sm font-medium text-neutral-600 hover:text-secondary-600 transition-colors"
+              >
+                <ArrowLeft className="w-4 h-4 mr-1" />
+                Previous
+              </Link>
+            )}
+            {Array.from({ length: totalPages }, (_, i) => i + 1).map((number) => (
+              <Link
+                key={number}
+                href={blogIndexHref(number)}
+                aria-current={number === page ? 'page' : undefined}
+                className={`px-4 py-2 text-sm font-medium rounded-lg transition-colors ${
+                  number === page
+                    ? 'bg-secondary-600 text-white'
+                    : 'text-neutral-600 hover:bg-secondary-50 hover:text-secondary-600'
+                }`}
+              >
+                {number}
+              </Link>
+            ))}
+            {page < totalPages && (
+              <Link
+                href={blogIndexHref(page + 1)}
+                className="inline-flex items-center px-4 py-2 text-sm font-medium text-neutral-600 hover:text-secondary-600 transition-colors"
+              >
+                Next
+                <ArrowRight className="w-4 h-4 ml-1" />
+              </Link>
+            )}
+          </nav>
+        )}
+      </div>
+
+      {/* CTA Section */}
+      <div className="bg-gradient-to-r from-secondary-50 to-accent-50 py-16 mt-16">
+        <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
+          <h2 className="text-3xl font-bold text-neutral-900 mb-4">
+            Ready to Transform Your Bookkeeping?
+          </h2>
+          <p className="text-lg text-neutral-600 mb-8">
+            Try My AI Bookkeeper free today and discover how AI can simplify your business finances
+          </p>
+          <Link
+            href="/"
+            className="inline-flex items-center px-6 py-3 bg-gradient-to-r from-secondary-500 to-secondary-600 hover:from-secondary-600 hover:to-secondary-700 text-white font-medium rounded-full transition-all duration-200 shadow-lg hover:shadow-xl transform hover:scale-105"
+          >
+            Start Free Trial
+            <ArrowRight className="ml-2 w-5 h-5" />
+          </Link>
+        </div>
+      </div>
+    </div>
+  )
+}
\ No newline at end of file
@@ -0,0 +1,65 @@
+'use client'
+
+import { useEffect, useState } from 'react'
+import Link from 'next/link'
+import { Search } from 'lucide-react'
+import { BlogSearchResult, searchBlog } from '@/lib/blogSearch'
+
+export default function BlogSearch() {
+  const [query, setQuery] = useState('')
+  const [results, setResults] = useState<BlogSearchResult[]>([])
+  const [error, setError] = useState(false)
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setResults([])
+      return
+    }
+    let cancelled = false
+    const timer = setTimeout(() => {
+      searchBlog(query)
+        .then((found) => {
+          if (!cancelled) {
+            setResults(found)
+            setError(false)
+          }
+        })
+        .catch(() => {
+          if (!cancelled) setError(true)
+        })
+    }, 120)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [query])
+
+  return (
+    <div className="max-w-2xl mx-auto mt-8 text-left">
+      <div className="relative">
+        <Search className="absolute left-4 top-1/2 -translate-y-1/2 w-5 h-5 text-neutral-400" />
+        <input
+          type="search"
+          value={query}
+          onChange={(e) => setQuery(e.target.value)}
+          placeholder="Search articles..."
+          aria-label="Search blog articles"
+          className="w-full pl-12 pr-4 py-3 rounded-xl border border-neutral-200 bg-white shadow-sm focus:outline-none focus:ring-2 focus:ring-secondary-500"
+        />
+      </div>
+      {query.trim() && (
+        <div className="mt-2 bg-white rounded-xl border border-neutral-200 shadow-lg divide-y divide-neutral-100">
+          {error && <p className="px-4 py-3 text-sm text-neutral-500">Search is unavailable right now.</p>}
+          {!error && results.length === 0 && <p className="px-4 py-3 text-sm text-neutral-500">No matching articles.</p>}
+          {results.map((result) => (
+            <Link key={result.slug} href={`/blog/${result.slug}`} className="block px-4 py-3 hover:bg-neutral-50">
+              <span className="text-xs font-medium text-secondary-600">{result.category}</span>
+              <p className="font-semibold text-neutral-900">{result.title}</p>
+              <p className="text-sm text-neutral-600 line-clamp-1">{result.excerpt}</p>
+            </Link>
+          ))}
+        </div>
+      )}
+    </div>
+  )
+}
@@ -18,6 +18,8 @@ interface AIModel {
 
 interface ChatInterfaceProps {
   messages: Message[]
+  // Not yet in the conversation: the message being answered and the reply streamed so far
+  streamingMessages?: Message[]
   onSendMessage: (message: string, attachments?: FileAttachment[]) => void
   isLoading?: boolean
   selectedAIModel?: string
@@ -25,8 +27,12 @@ interface ChatInterfaceProps {
   onSubscriptionModalChange?: (isOpen: boolean) => void
 }
 
+// Shared default, so the scroll effect below only reruns when the streamed messages really change
+const NO_MESSAGES: Message[] = []
+
 export default function ChatInterface({ 
   messages, 
+  streamingMessages = NO_MESSAGES,
   onSendMessage, 
   isLoading = false, 
   selectedAIModel: propSelectedAIModel = 'everyday',
@@ -72,7 +78,7 @@ export default function ChatInterface({
 
   useEffect(() => {
     scrollToBottom()
-  }, [messages, isMinimized, isLoading])
+  }, [messages, streamingMessages, isMinimized, isLoading])
 
   const handleSendMessage = () => {
     if (inputMessage.trim() || attachments.length > 0) {
@@ -224,11 +230,11 @@ export default function ChatInterface({
       {/* Messages Area - Show when there are messages or loading */}
       {(messages.length > 0 || isLoading) && (
         <div ref={messagesContainerRef} className="flex-1 overflow-y-auto p-4 sm:p-8 space-y-3 sm:space-y-4 min-h-0">
-          {messages.map((message) => (
+          {messages.concat(streamingMessages).map((message) => (
             <ChatMessage key={message.id} message={message} selectedAIModel={selectedAIModel} />
           ))}
         
-        {isLoading && (
+        {isLoading && !streamingMessages.some((message) => message.role === 'assistant') && (
           <div className="flex items-start space-x-3 max-w-[85%]">
             {/* AI Avatar */}
             <div className="flex-shrink-0 w-8 h-8 rounded-full bg-gradient-to-r from-accent-500 to-accent-600 flex items-center justify-center shadow-lg">
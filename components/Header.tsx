@@ -1,7 +1,7 @@
 'use client'
 
 import { useState } from 'react'
-import { Calculator, User, LogIn } from 'lucide-react'
+import { Calculator, LogIn } from 'lucide-react'
 import { useUser, UserButton, SignInButton } from '@clerk/nextjs'
 import SubscriptionModal from './SubscriptionModal'
 import { useAppStore } from '@/lib/store'
@@ -1,7 +1,7 @@
 'use client'
 
 import { useState } from 'react'
-import { Check, X, Crown, Zap, Star, Sparkles, AlertTriangle } from 'lucide-react'
+import { Check, X, Zap, Star, Sparkles, AlertTriangle } from 'lucide-react'
 import { loadStripe } from '@stripe/stripe-js'
 import { useUser, useClerk } from '@clerk/nextjs'
 
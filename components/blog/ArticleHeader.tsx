@@ -0,0 +1,56 @@
+import Link from 'next/link'
+import { ArrowLeft, Clock, Calendar } from 'lucide-react'
+
+export interface ArticleHeaderTheme {
+  hero: string
+  link: string
+  badge: string
+}
+
+interface ArticleHeaderProps {
+  title: string
+  description: string
+  category: string
+  readTime: string
+  theme: ArticleHeaderTheme
+}
+
+export default function ArticleHeader({ title, description, category, readTime, theme }: ArticleHeaderProps) {
+  return (
+    <div className={`bg-gradient-to-br ${theme.hero} border-b border-neutral-200`}>
+      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
+        <Link 
+          href="/blog" 
+          className={`inline-flex items-center ${theme.link} mb-6 transition-colors`}
+        >
+          <ArrowLeft className="w-4 h-4 mr-2" />
+          Back to Blog
+        </Link>
+        
+        <div className="space-y-4">
+          <div className="flex items-center space-x-4 text-sm text-neutral-600">
+            <span className={`px-3 py-1 ${theme.badge} rounded-full font-medium`}>
+              {category}
+            </span>
+            <div className="flex items-center space-x-1">
+              <Calendar className="w-4 h-4" />
+              <time dateTime="2024-12-29">December 29, 2024</time>
+            </div>
+            <div className="flex items-center space-x-1">
+              <Clock className="w-4 h-4" />
+              <span>{readTime} min read</span>
+            </div>
+          </div>
+          
+          <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 leading-tight">
+            {title}
+          </h1>
+          
+          <p className="text-xl text-neutral-600">
+            {description}
+          </p>
+        </div>
+      </div>
+    </div>
+  )
+}
@@ -0,0 +1,34 @@
+import Link from 'next/link'
+import { ArrowRight } from 'lucide-react'
+
+export interface RelatedArticle {
+  slug: string
+  title: string
+}
+
+interface RelatedArticlesProps {
+  articles?: RelatedArticle[]
+}
+
+export default function RelatedArticles({ articles }: RelatedArticlesProps) {
+  if (!articles || articles.length === 0) return null
+
+  return (
+    <nav aria-label="Related articles" className="mt-12 not-prose">
+      <h2 className="text-2xl font-bold text-neutral-900 mb-4">Related Articles</h2>
+      <ul className="grid sm:grid-cols-2 gap-4">
+        {articles.map((article) => (
+          <li key={article.slug}>
+            <Link
+              href={`/blog/${article.slug}`}
+              className="group flex items-center justify-between h-full bg-white rounded-xl border border-neutral-200 p-5 hover:shadow-md transition-shadow"
+            >
+              <span className="font-medium text-neutral-900">{article.title}</span>
+              <ArrowRight className="w-4 h-4 ml-3 flex-shrink-0 text-neutral-400 group-hover:translate-x-1 transition-transform" />
+            </Link>
+          </li>
+        ))}
+      </ul>
+    </nav>
+  )
+}
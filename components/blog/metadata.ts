@@ -0,0 +1,22 @@
+import { Metadata } from 'next'
+
+interface ArticleMetadataInput {
+  title: string
+  description: string
+  keywords: string[]
+  url: string
+}
+
+export function articleMetadata({ title, description, keywords, url }: ArticleMetadataInput): Metadata {
+  return {
+    title,
+    description,
+    keywords,
+    openGraph: {
+      title,
+      description,
+      type: 'article',
+      url,
+    }
+  }
+}
@@ -0,0 +1,96 @@
+// Generated by generate_financial_blogs.py from the content_map colors.
+// Class names are spelled out in full so Tailwind can find them.
+export const palettes = {
+  amber: {
+    hero: "from-amber-50 via-white to-amber-50",
+    link: "text-amber-600 hover:text-amber-700",
+    badge: "bg-amber-100 text-amber-700",
+    panel: "from-amber-50 to-amber-50",
+    accent: "text-amber-600",
+    border: "border-amber-500",
+    takeaways: "from-amber-50",
+    button: "from-amber-600 to-amber-600 hover:from-amber-700 hover:to-amber-700",
+  },
+  blue: {
+    hero: "from-blue-50 via-white to-blue-50",
+    link: "text-blue-600 hover:text-blue-700",
+    badge: "bg-blue-100 text-blue-700",
+    panel: "from-blue-50 to-blue-50",
+    accent: "text-blue-600",
+    border: "border-blue-500",
+    takeaways: "from-blue-50",
+    button: "from-blue-600 to-blue-600 hover:from-blue-700 hover:to-blue-700",
+  },
+  cyan: {
+    hero: "from-cyan-50 via-white to-cyan-50",
+    link: "text-cyan-600 hover:text-cyan-700",
+    badge: "bg-cyan-100 text-cyan-700",
+    panel: "from-cyan-50 to-cyan-50",
+    accent: "text-cyan-600",
+    border: "border-cyan-500",
+    takeaways: "from-cyan-50",
+    button: "from-cyan-600 to-cyan-600 hover:from-cyan-700 hover:to-cyan-700",
+  },
+  gray: {
+    hero: "from-gray-50 via-white to-gray-50",
+    link: "text-gray-600 hover:text-gray-700",
+    badge: "bg-gray-100 text-gray-700",
+    panel: "from-gray-50 to-gray-50",
+    accent: "text-gray-600",
+    border: "border-gray-500",
+    takeaways: "from-gray-50",
+    button: "from-gray-600 to-gray-600 hover:from-gray-700 hover:to-gray-700",
+  },
+  green: {
+    hero: "from-green-50 via-white to-green-50",
+    link: "text-green-600 hover:text-green-700",
+    badge: "bg-green-100 text-green-700",
+    panel: "from-green-50 to-green-50",
+    accent: "text-green-600",
+    border: "border-green-500",
+    takeaways: "from-green-50",
+    button: "from-green-600 to-green-600 hover:from-green-700 hover:to-green-700",
+  },
+  indigo: {
+    hero: "from-indigo-50 via-white to-indigo-50",
+    link: "text-indigo-600 hover:text-indigo-700",
+    badge: "bg-indigo-100 text-indigo-700",
+    panel: "from-indigo-50 to-indigo-50",
+    accent: "text-indigo-600",
+    border: "border-indigo-500",
+    takeaways: "from-indigo-50",
+    button: "from-indigo-600 to-indigo-600 hover:from-indigo-700 hover:to-indigo-700",
+  },
+  orange: {
+    hero: "from-orange-50 via-white to-orange-50",
+    link: "text-orange-600 hover:text-orange-700",
+    badge: "bg-orange-100 text-orange-700",
+    panel: "from-orange-50 to-orange-50",
+    accent: "text-orange-600",
+    border: "border-orange-500",
+    takeaways: "from-orange-50",
+    button: "from-orange-600 to-orange-600 hover:from-orange-700 hover:to-orange-700",
+  },
+  purple: {
+    hero: "from-purple-50 via-white to-purple-50",
+    link: "text-purple-600 hover:text-purple-700",
+    badge: "bg-purple-100 text-purple-700",
+    panel: "from-purple-50 to-purple-50",
+    accent: "text-purple-600",
+    border: "border-purple-500",
+    takeaways: "from-purple-50",
+    button: "from-purple-600 to-purple-600 hover:from-purple-700 hover:to-purple-700",
+  },
+  red: {
+    hero: "from-red-50 via-white to-red-50",
+    link: "text-red-600 hover:text-red-700",
+    badge: "bg-red-100 text-red-700",
+    panel: "from-red-50 to-red-50",
+    accent: "text-red-600",
+    border: "border-red-500",
+    takeaways: "from-red-50",
+    button: "from-red-600 to-red-600 hover:from-red-700 hover:to-red-700",
+  },
+}
+
+export type PaletteName = keyof typeof palettes
@@ -1,182 +0,0 @@
-#!/usr/bin/env python3
-
-import os
-
-# Blog configurations
-blogs = [
-    {
-        "path": "/workspace/app/blog/equity-explained-company-financial-health",
-        "title": "Equity Explained: What It Means for Your Company's Financial Health",
-        "keywords": ["shareholders equity", "owner equity", "retained earnings", "equity financing", "equity vs debt"],
-        "description": "Understand business equity, its components, and how it reflects your company's true value and financial health."
-    },
-    {
-        "path": "/workspace/app/blog/boosting-revenue-strategies-grow-top-line",
-        "title": "Boosting Revenue: Top Strategies to Grow Your Top Line",
-        "keywords": ["revenue growth strategies", "increase sales revenue", "top line growth", "revenue optimization", "business revenue streams"],
-        "description": "Discover proven strategies to boost revenue, diversify income streams, and accelerate top-line growth for sustainable business expansion."
-    },
-    {
-        "path": "/workspace/app/blog/cutting-expenses-without-sacrificing-quality",
-        "title": "Cutting Expenses Without Sacrificing Quality: A Practical Guide",
-        "keywords": ["expense reduction strategies", "cost cutting measures", "business expense management", "operational efficiency", "reduce business costs"],
-        "description": "Learn how to strategically reduce business expenses while maintaining quality, efficiency, and customer satisfaction."
-    },
-    {
-        "path": "/workspace/app/blog/net-income-ultimate-measure-profitability",
-        "title": "Net Income: Why It's the Ultimate Measure of Profitability",
-        "keywords": ["net income calculation", "bottom line profit", "net profit margin", "profitability metrics", "net income vs gross profit"],
-        "description": "Master net income analysis to understand true profitability, improve margins, and make data-driven business decisions."
-    },
-    {
-        "path": "/workspace/app/blog/accounts-receivable-streamline-collections-cash-flow",
-        "title": "Accounts Receivable: How to Streamline Collections and Improve Cash Flow",
-        "keywords": ["accounts receivable management", "invoice collection strategies", "AR turnover ratio", "cash flow optimization", "credit management"],
-        "description": "Optimize accounts receivable processes to accelerate collections, reduce bad debt, and improve cash flow management."
-    },
-    {
-        "path": "/workspace/app/blog/accounts-payable-best-practices-managing-what-you-owe",
-        "title": "Accounts Payable: Best Practices for Managing What You Owe",
-        "keywords": ["accounts payable management", "vendor payment optimization", "AP automation", "payment terms negotiation", "cash flow management"],
-        "description": "Master accounts payable management to optimize cash flow, maintain vendor relationships, and capture early payment discounts."
-    },
-    {
-        "path": "/workspace/app/blog/power-of-cash-liquidity-business-success",
-        "title": "The Power of Cash: Why Liquidity Is Key to Business Success",
-        "keywords": ["cash management strategies", "business liquidity", "cash flow optimization", "working capital management", "cash reserves"],
-        "description": "Understand why cash is king in business and learn strategies to maintain optimal liquidity for growth and stability."
-    },
-    {
-        "path": "/workspace/app/blog/inventory-management-balancing-stock-maximize-profits",
-        "title": "Inventory Management: Balancing Stock to Maximize Profits",
-        "keywords": ["inventory optimization", "stock management strategies", "inventory turnover", "just in time inventory", "inventory carrying costs"],
-        "description": "Master inventory management techniques to reduce carrying costs, prevent stockouts, and maximize profitability."
-    },
-    {
-        "path": "/workspace/app/blog/fixed-assets-optimize-long-term-investments",
-        "title": "Fixed Assets: How to Optimize Long-Term Investments for Growth",
-        "keywords": ["fixed asset management", "capital investment strategies", "asset depreciation", "ROI optimization", "equipment financing"],
-        "description": "Learn how to strategically manage fixed assets to maximize ROI, optimize depreciation, and support long-term growth."
-    },
-    {
-        "path": "/workspace/app/blog/current-assets-key-short-term-financial-stability",
-        "title": "Current Assets: The Key to Short-Term Financial Stability",
-        "keywords": ["current assets management", "working capital optimization", "liquidity ratios", "short-term assets", "cash conversion cycle"],
-        "description": "Master current asset management to ensure liquidity, meet obligations, and maintain financial flexibility."
-    },
-    {
-        "path": "/workspace/app/blog/navigating-current-liabilities-staying-financially-agile",
-        "title": "Navigating Current Liabilities: Tips for Staying Financially Agile",
-        "keywords": ["current liabilities management", "short-term debt", "working capital", "payables management", "liquidity management"],
-        "description": "Learn to effectively manage current liabilities to maintain financial agility and optimize working capital."
-    },
-    {
-        "path": "/workspace/app/blog/long-term-liabilities-sustainable-debt-management",
-        "title": "Long-Term Liabilities: Planning for Sustainable Debt Management",
-        "keywords": ["long-term debt management", "debt sustainability", "leverage ratios", "debt restructuring", "capital structure"],
-        "description": "Master long-term liability management for sustainable growth, optimal leverage, and financial stability."
-    },
-    {
-        "path": "/workspace/app/blog/retained-earnings-fuel-business-future-growth",
-        "title": "Retained Earnings: How They Fuel Your Business's Future Growth",
-        "keywords": ["retained earnings management", "profit retention strategies", "reinvestment decisions", "dividend policy", "growth financing"],
-        "description": "Understand how retained earnings drive growth and learn strategies for optimal profit retention and reinvestment."
-    },
-    {
-        "path": "/workspace/app/blog/gross-profit-secrets-increase-margins",
-        "title": "Gross Profit Secrets: How to Increase Your Margins",
-        "keywords": ["gross profit margin", "margin improvement strategies", "pricing optimization", "cost reduction", "profitability analysis"],
-        "description": "Discover proven strategies to increase gross profit margins through pricing optimization and cost management."
-    },
-    {
-        "path": "/workspace/app/blog/operating-income-measuring-business-core-performance",
-        "title": "Operating Income: Measuring Your Business's Core Performance",
-        "keywords": ["operating income analysis", "EBIT calculation", "operational efficiency", "core business profitability", "operating margin"],
-        "description": "Master operating income analysis to evaluate core business performance and identify improvement opportunities."
-    },
-    {
-        "path": "/workspace/app/blog/cost-of-goods-sold-strategies-lower-costs",
-        "title": "Cost of Goods Sold: Strategies to Lower Costs and Boost Profits",
-        "keywords": ["COGS reduction", "cost management strategies", "supply chain optimization", "direct cost control", "margin improvement"],
-        "description": "Learn effective strategies to reduce cost of goods sold while maintaining quality and customer satisfaction."
-    },
-    {
-        "path": "/workspace/app/blog/depreciation-demystified-impact-financial-statements",
-        "title": "Depreciation Demystified: How It Impacts Your Financial Statements",
-        "keywords": ["depreciation methods", "asset depreciation", "tax depreciation", "accumulated depreciation", "depreciation impact"],
-        "description": "Understand depreciation methods, tax implications, and how to use depreciation strategically in financial planning."
-    },
-    {
-        "path": "/workspace/app/blog/amortization-understanding-role-income-statement",
-        "title": "Amortization: Understanding Its Role in Your Income Statement",
-        "keywords": ["amortization explained", "intangible asset amortization", "loan amortization", "amortization schedule", "amortization vs depreciation"],
-        "description": "Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning."
-    },
-    {
-        "path": "/workspace/app/blog/shareholders-equity-what-tells-investors",
-        "title": "Shareholders' Equity: What It Tells Investors About Your Company",
-        "keywords": ["shareholders equity analysis", "equity valuation", "book value", "return on equity", "equity investors"],
-        "description": "Understand how shareholders' equity reflects company value and what it signals to investors and stakeholders."
-    },
-    {
-        "path": "/workspace/app/blog/managing-debt-balance-borrowing-financial-health",
-        "title": "Managing Debt: How to Balance Borrowing with Financial Health",
-        "keywords": ["debt management strategies", "optimal debt levels", "debt refinancing", "leverage optimization", "debt service coverage"],
-        "description": "Learn to strategically manage business debt, optimize leverage, and maintain financial health while funding growth."
-    },
-    {
-        "path": "/workspace/app/blog/cash-flow-essentials-keeping-business-liquid",
-        "title": "Cash Flow Essentials: Keeping Your Business Liquid and Thriving",
-        "keywords": ["cash flow management", "cash flow forecasting", "operating cash flow", "free cash flow", "cash flow statement"],
-        "description": "Master cash flow management essentials to maintain liquidity, fund operations, and support sustainable growth."
-    },
-    {
-        "path": "/workspace/app/blog/accrued-expenses-account-hidden-costs",
-        "title": "Accrued Expenses: How to Account for Hidden Costs",
-        "keywords": ["accrued expenses accounting", "accrual accounting", "expense recognition", "financial reporting accuracy", "hidden business costs"],
-        "description": "Understand accrued expenses and their impact on financial statements, cash flow, and business decision-making."
-    },
-    {
-        "path": "/workspace/app/blog/prepaid-expenses-timing-matters-financial-reporting",
-        "title": "Prepaid Expenses: Why Timing Matters in Financial Reporting",
-        "keywords": ["prepaid expenses accounting", "expense timing", "deferred expenses", "matching principle", "financial statement accuracy"],
-        "description": "Learn how to properly account for prepaid expenses and understand their impact on financial reporting and cash flow."
-    },
-    {
-        "path": "/workspace/app/blog/controlling-operating-expenses-lean-business-operations",
-        "title": "Controlling Operating Expenses: Tips for Lean Business Operations",
-        "keywords": ["operating expense reduction", "OPEX optimization", "lean operations", "expense control strategies", "operational efficiency"],
-        "description": "Discover strategies to control operating expenses while maintaining efficiency and driving business growth."
-    },
-    {
-        "path": "/workspace/app/blog/interest-expense-borrowing-costs-affect-bottom-line",
-        "title": "Interest Expense: How Borrowing Costs Affect Your Bottom Line",
-        "keywords": ["interest expense management", "borrowing costs", "interest rate optimization", "debt cost analysis", "financial leverage"],
-        "description": "Understand how interest expenses impact profitability and learn strategies to optimize borrowing costs."
-    },
-    {
-        "path": "/workspace/app/blog/taxes-business-smart-strategies-minimize-burden",
-        "title": "Taxes and Your Business: Smart Strategies to Minimize Tax Burden",
-        "keywords": ["business tax strategies", "tax planning", "tax deductions", "tax optimization", "corporate tax management"],
-        "description": "Learn legal strategies to minimize business taxes through proper planning, deductions, and structure optimization."
-    },
-    {
-        "path": "/workspace/app/blog/dividends-balancing-shareholder-rewards-company-growth",
-        "title": "Dividends: Balancing Shareholder Rewards with Company Growth",
-        "keywords": ["dividend policy", "dividend strategy", "shareholder returns", "profit distribution", "dividend vs reinvestment"],
-        "description": "Master dividend strategy to balance shareholder returns with business growth and capital retention needs."
-    },
-    {
-        "path": "/workspace/app/blog/working-capital-lifeline-business-operations",
-        "title": "Working Capital: The Lifeline of Your Business's Day-to-Day Operations",
-        "keywords": ["working capital management", "working capital optimization", "cash conversion cycle", "liquidity management", "operational funding"],
-        "description": "Understand working capital management to ensure smooth operations, meet obligations, and support business growth."
-    }
-]
-
-print(f"Creating {len(blogs)} financial concept blogs...")
-for blog in blogs:
-    os.makedirs(blog["path"], exist_ok=True)
-    print(f"Created directory: {blog['path']}")
-
-print("All blog directories created successfully!")
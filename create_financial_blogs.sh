@@ -1,34 +0,0 @@
-#!/bin/bash
-
-# Create directories for all 30 financial concept blogs
-mkdir -p /workspace/app/blog/managing-liabilities-keeping-business-debts-in-check
-mkdir -p /workspace/app/blog/equity-explained-company-financial-health
-mkdir -p /workspace/app/blog/boosting-revenue-strategies-grow-top-line
-mkdir -p /workspace/app/blog/cutting-expenses-without-sacrificing-quality
-mkdir -p /workspace/app/blog/net-income-ultimate-measure-profitability
-mkdir -p /workspace/app/blog/accounts-receivable-streamline-collections-cash-flow
-mkdir -p /workspace/app/blog/accounts-payable-best-practices-managing-what-you-owe
-mkdir -p /workspace/app/blog/power-of-cash-liquidity-business-success
-mkdir -p /workspace/app/blog/inventory-management-balancing-stock-maximize-profits
-mkdir -p /workspace/app/blog/fixed-assets-optimize-long-term-investments
-mkdir -p /workspace/app/blog/current-assets-key-short-term-financial-stability
-mkdir -p /workspace/app/blog/navigating-current-liabilities-staying-financially-agile
-mkdir -p /workspace/app/blog/long-term-liabilities-sustainable-debt-management
-mkdir -p /workspace/app/blog/retained-earnings-fuel-business-future-growth
-mkdir -p /workspace/app/blog/gross-profit-secrets-increase-margins
-mkdir -p /workspace/app/blog/operating-income-measuring-business-core-performance
-mkdir -p /workspace/app/blog/cost-of-goods-sold-strategies-lower-costs
-mkdir -p /workspace/app/blog/depreciation-demystified-impact-financial-statements
-mkdir -p /workspace/app/blog/amortization-understanding-role-income-statement
-mkdir -p /workspace/app/blog/shareholders-equity-what-tells-investors
-mkdir -p /workspace/app/blog/managing-debt-balance-borrowing-financial-health
-mkdir -p /workspace/app/blog/cash-flow-essentials-keeping-business-liquid
-mkdir -p /workspace/app/blog/accrued-expenses-account-hidden-costs
-mkdir -p /workspace/app/blog/prepaid-expenses-timing-matters-financial-reporting
-mkdir -p /workspace/app/blog/controlling-operating-expenses-lean-business-operations
-mkdir -p /workspace/app/blog/interest-expense-borrowing-costs-affect-bottom-line
-mkdir -p /workspace/app/blog/taxes-business-smart-strategies-minimize-burden
-mkdir -p /workspace/app/blog/dividends-balancing-shareholder-rewards-company-growth
-mkdir -p /workspace/app/blog/working-capital-lifeline-business-operations
-
-echo "All financial blog directories created successfully"
@@ -1,216 +0,0 @@
-#!/usr/bin/env python3
-import os
-
-blogs = [
-    {
-        "slug": "cloud-based-bookkeeping-software-game-changer",
-        "title": "Why Cloud-Based Bookkeeping Software Is a Game-Changer for Small Businesses",
-        "description": "Explore the benefits of cloud bookkeeping tools like QuickBooks and Xero, including real-time tracking, automation, and scalability for small business needs.",
-        "keywords": ["cloud bookkeeping software", "QuickBooks online", "Xero accounting", "real-time financial tracking", "bookkeeping automation"],
-        "category": "Software Reviews"
-    },
-    {
-        "slug": "set-up-simple-bookkeeping-system-one-weekend",
-        "title": "How to Set Up a Simple Bookkeeping System for Your Small Business in One Weekend",
-        "description": "Step-by-step guide to creating a basic bookkeeping system, covering chart of accounts, expense tracking, and choosing the right software for beginners.",
-        "keywords": ["bookkeeping system setup", "chart of accounts", "expense tracking", "bookkeeping for beginners", "weekend bookkeeping setup"],
-        "category": "How-To Guides"
-    },
-    {
-        "slug": "bookkeeping-on-budget-free-low-cost-tools",
-        "title": "Bookkeeping on a Budget: Free and Low-Cost Tools for Small Business Owners",
-        "description": "Discover affordable bookkeeping solutions like Wave and GnuCash, with tips on maximizing efficiency without breaking the bank.",
-        "keywords": ["free bookkeeping software", "Wave accounting", "GnuCash", "budget bookkeeping", "affordable accounting tools"],
-        "category": "Budget Tools"
-    },
-    {
-        "slug": "prepare-small-business-books-tax-season",
-        "title": "How to Prepare Your Small Business Books for Tax Season Like a Pro",
-        "description": "Complete checklist for organizing financial records, categorizing expenses, and working with accountants for stress-free tax filing.",
-        "keywords": ["tax preparation", "small business taxes", "tax season checklist", "financial records organization", "tax deductions"],
-        "category": "Tax Preparation"
-    },
-    {
-        "slug": "small-business-guide-tracking-cash-flow",
-        "title": "The Small Business Owner's Guide to Tracking Cash Flow with Bookkeeping",
-        "description": "Learn how effective bookkeeping helps monitor cash flow, with strategies to avoid cash crunches and plan for growth.",
-        "keywords": ["cash flow tracking", "cash flow management", "bookkeeping for cash flow", "financial planning", "cash flow forecasting"],
-        "category": "Cash Management"
-    },
-    {
-        "slug": "single-entry-vs-double-entry-bookkeeping",
-        "title": "Single-Entry vs. Double-Entry Bookkeeping: Which Is Right for Your Small Business?",
-        "description": "Understand the differences between bookkeeping methods, their pros and cons, and guidance on choosing the best approach for your business.",
-        "keywords": ["single-entry bookkeeping", "double-entry bookkeeping", "accounting methods", "bookkeeping systems", "small business accounting"],
-        "category": "Accounting Basics"
-    },
-    {
-        "slug": "use-bookkeeping-make-smarter-financial-decisions",
-        "title": "How to Use Bookkeeping to Make Smarter Financial Decisions for Your Business",
-        "description": "Show how accurate financial records guide budgeting, pricing, and investment decisions with real-world examples of data-driven success.",
-        "keywords": ["financial decision making", "data-driven decisions", "business budgeting", "pricing strategy", "investment planning"],
-        "category": "Business Strategy"
-    },
-    {
-        "slug": "bookkeeping-for-freelancers-stay-organized",
-        "title": "Bookkeeping for Freelancers: Simple Tips to Stay Organized and Profitable",
-        "description": "Tailored bookkeeping advice for solopreneurs, covering invoicing, expense tracking, and setting aside funds for taxes.",
-        "keywords": ["freelancer bookkeeping", "solopreneur accounting", "invoice management", "freelance taxes", "self-employed bookkeeping"],
-        "category": "Freelancer Finance"
-    },
-    {
-        "slug": "when-to-hire-bookkeeper-small-business",
-        "title": "When to Hire a Bookkeeper for Your Small Business: Signs It's Time to Outsource",
-        "description": "Identify indicators like time constraints or complex finances, with advice on finding a reliable bookkeeper and what to expect.",
-        "keywords": ["hire bookkeeper", "outsource bookkeeping", "bookkeeping services", "when to hire accountant", "bookkeeper vs DIY"],
-        "category": "Business Growth"
-    }
-]
-
-# Metrics blogs
-metrics_blogs = [
-    {
-        "slug": "gross-profit-margin-key-sustainable-growth",
-        "title": "Why Gross Profit Margin Is Your Small Business's Key to Sustainable Growth",
-        "description": "Learn to calculate and interpret gross profit margin, with strategies to improve it by optimizing pricing and reducing COGS.",
-        "keywords": ["gross profit margin", "profit margin calculation", "pricing optimization", "cost of goods sold", "business profitability"],
-        "category": "Financial Metrics"
-    },
-    {
-        "slug": "tracking-cash-flow-metric-keeps-business-afloat",
-        "title": "Tracking Cash Flow: The Metric That Keeps Your Small Business Afloat",
-        "description": "Understand cash flow monitoring, including how to use cash flow statements and forecasts to avoid liquidity issues.",
-        "keywords": ["cash flow tracking", "cash flow statement", "liquidity management", "cash flow forecast", "working capital"],
-        "category": "Financial Metrics"
-    },
-    {
-        "slug": "customer-acquisition-cost-measure-lower-roi",
-        "title": "Customer Acquisition Cost: How to Measure and Lower It for Better ROI",
-        "description": "Calculate CAC, understand why it matters, and learn actionable ways to optimize marketing spend for new customers.",
-        "keywords": ["customer acquisition cost", "CAC calculation", "marketing ROI", "customer acquisition", "marketing optimization"],
-        "category": "Marketing Metrics"
-    },
-    {
-        "slug": "customer-lifetime-value-boosting-profits",
-        "title": "The Power of Customer Lifetime Value: Boosting Profits for Your Small Business",
-        "description": "Dive into CLV calculation and strategies to increase customer retention and repeat purchases for maximum revenue.",
-        "keywords": ["customer lifetime value", "CLV calculation", "customer retention", "repeat purchases", "customer loyalty"],
-        "category": "Marketing Metrics"
-    },
-    {
-        "slug": "inventory-turnover-ratio-optimize-stock",
-        "title": "Inventory Turnover Ratio: How to Optimize Stock for Small Business Success",
-        "description": "Learn how this metric reveals inventory efficiency, with tips on balancing stock levels to improve cash flow.",
-        "keywords": ["inventory turnover ratio", "stock optimization", "inventory management", "inventory efficiency", "stock levels"],
-        "category": "Operations Metrics"
-    },
-    {
-        "slug": "accounts-receivable-turnover-monitor",
-        "title": "Why Your Small Business Needs to Monitor Accounts Receivable Turnover",
-        "description": "Track how quickly customers pay invoices, with practical steps to improve collections and reduce bad debt.",
-        "keywords": ["accounts receivable turnover", "invoice collection", "payment terms", "bad debt reduction", "AR management"],
-        "category": "Financial Metrics"
-    },
-    {
-        "slug": "net-promoter-score-measuring-customer-loyalty",
-        "title": "Net Promoter Score: Measuring Customer Loyalty for Small Business Growth",
-        "description": "Learn how NPS gauges customer satisfaction and loyalty, with advice on collecting feedback and enhancing your brand.",
-        "keywords": ["net promoter score", "NPS survey", "customer loyalty", "customer satisfaction", "brand loyalty"],
-        "category": "Customer Metrics"
-    },
-    {
-        "slug": "operating-expense-ratio-run-leaner-business",
-        "title": "Breaking Down Operating Expense Ratio: How to Run a Leaner Small Business",
-        "description": "Understand how OER reflects operational efficiency, with strategies to cut costs while maintaining quality.",
-        "keywords": ["operating expense ratio", "OER calculation", "operational efficiency", "cost reduction", "lean operations"],
-        "category": "Financial Metrics"
-    },
-    {
-        "slug": "employee-productivity-metrics-boost-performance",
-        "title": "Employee Productivity Metrics: How to Measure and Boost Your Team's Performance",
-        "description": "Explore key metrics like revenue per employee, with tips on improving workforce efficiency in small business.",
-        "keywords": ["employee productivity", "revenue per employee", "workforce efficiency", "performance metrics", "team productivity"],
-        "category": "HR Metrics"
-    },
-    {
-        "slug": "website-conversion-rate-turning-visitors-customers",
-        "title": "Website Conversion Rate: Turning Small Business Visitors into Paying Customers",
-        "description": "Track and optimize conversion rates for online businesses, with tactics for improving website performance and sales.",
-        "keywords": ["website conversion rate", "conversion optimization", "online sales", "website performance", "e-commerce metrics"],
-        "category": "Digital Metrics"
-    }
-]
-
-all_blogs = blogs + metrics_blogs
-
-for blog in all_blogs:
-    content = f'''import {{ Metadata }} from 'next'
-import Link from 'next/link'
-import {{ ArrowLeft, Clock, Calendar, CheckCircle, TrendingUp, DollarSign, BarChart3, Target, AlertCircle }} from 'lucide-react'
-
-export const metadata: Metadata = {{
-  title: '{blog["title"]}',
-  description: '{blog["description"]}',
-  keywords: {blog["keywords"]},
-  openGraph: {{
-    title: '{blog["title"]}',
-    description: '{blog["description"]}',
-    type: 'article',
-    url: 'https://myaibookkeeper.com/blog/{blog["slug"]}',
-  }}
-}}
-
-export default function BlogPost() {{
-  return (
-    <article className="min-h-screen bg-gradient-to-b from-neutral-50 to-white">
-      <div className="bg-gradient-to-br from-blue-50 via-white to-indigo-50 border-b border-neutral-200">
-        <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-          <Link 
-            href="/blog" 
-            className="inline-flex items-center text-blue-600 hover:text-blue-700 mb-6 transition-colors"
-          >
-            <ArrowLeft className="w-4 h-4 mr-2" />
-            Back to Blog
-          </Link>
-          
-          <div className="space-y-4">
-            <div className="flex items-center space-x-4 text-sm text-neutral-600">
-              <span className="px-3 py-1 bg-blue-100 text-blue-700 rounded-full font-medium">
-                {blog["category"]}
-              </span>
-              <div className="flex items-center space-x-1">
-                <Calendar className="w-4 h-4" />
-                <time dateTime="2024-12-29">December 29, 2024</time>
-              </div>
-              <div className="flex items-center space-x-1">
-                <Clock className="w-4 h-4" />
-                <span>8 min read</span>
-              </div>
-            </div>
-            
-            <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 leading-tight">
-              {blog["title"]}
-            </h1>
-            
-            <p className="text-xl text-neutral-600">
-              {blog["description"]}
-            </p>
-          </div>
-        </div>
-      </div>
-
-      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <div className="prose prose-lg max-w-none">
-          <!-- Content will be generated here -->
-        </div>
-      </div>
-    </article>
-  )
-}}'''
-    
-    file_path = f'/workspace/app/blog/{blog["slug"]}/page.tsx'
-    with open(file_path, 'w') as f:
-        f.write(content)
-    print(f"Created: {blog['slug']}")
-
-print("All blog templates created!")
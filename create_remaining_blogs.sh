@@ -1,16 +0,0 @@
-#!/bin/bash
-
-# Create remaining blog post directories
-mkdir -p /workspace/app/blog/travel-agency-bookkeeping-commissions-booking-fees
-mkdir -p /workspace/app/blog/artisan-craft-business-bookkeeping-inventory-pricing
-mkdir -p /workspace/app/blog/independent-bookstore-bookkeeping-inventory-consignment
-mkdir -p /workspace/app/blog/childcare-center-bookkeeping-enrollment-subsidies
-mkdir -p /workspace/app/blog/home-care-services-bookkeeping-client-billing
-mkdir -p /workspace/app/blog/insurance-broker-bookkeeping-commissions-renewals
-mkdir -p /workspace/app/blog/digital-marketing-agency-bookkeeping-retainers-campaigns
-mkdir -p /workspace/app/blog/cleaning-service-bookkeeping-contracts-supplies
-mkdir -p /workspace/app/blog/veterinary-practice-bookkeeping-medical-inventory
-mkdir -p /workspace/app/blog/music-lesson-studio-bookkeeping-scheduling-recitals
-mkdir -p /workspace/app/blog/food-truck-operator-bookkeeping-permits-locations
-
-echo "Directories created successfully"
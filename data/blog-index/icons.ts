@@ -0,0 +1,5 @@
+// Generated by blog_pipeline.blog_index from the icons the blog index uses.
+import { Activity, AlertCircle, Archive, Banknote, BarChart3, BookOpen, Bot, Building, Building2, Cake, Calculator, Calendar, Camera, Clock, Coffee, CreditCard, DollarSign, Droplets, FastForward, FileText, Gift, Layers, Package, Palette, Percent, PieChart, PiggyBank, Receipt, RefreshCw, Scale, Scissors, Settings, ShoppingCart, Target, Trees, TrendingDown, TrendingUp, Truck, Users, Wallet, Wrench } from 'lucide-react'
+import type { LucideIcon } from 'lucide-react'
+
+export const blogIcons: Record<string, LucideIcon> = { Activity, AlertCircle, Archive, Banknote, BarChart3, BookOpen, Bot, Building, Building2, Cake, Calculator, Calendar, Camera, Clock, Coffee, CreditCard, DollarSign, Droplets, FastForward, FileText, Gift, Layers, Package, Palette, Percent, PieChart, PiggyBank, Receipt, RefreshCw, Scale, Scissors, Settings, ShoppingCart, Target, Trees, TrendingDown, TrendingUp, Truck, Users, Wallet, Wrench }
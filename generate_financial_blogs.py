@@ -1,724 +1,13 @@
 #!/usr/bin/env python3
+"""Generate the financial concept blog pages; the generator lives in blog_pipeline.financial."""
 
-import os
+from blog_pipeline import financial
+from blog_pipeline.cli import run
 
-def create_blog_content(title, description, keywords, slug):
-    """Generate comprehensive blog content with 1500-2000 words"""
-    
-    # Map slugs to specific content details
-    content_map = {
-        "equity-explained": {
-            "icon": "PieChart",
-            "color": "green",
-            "read_time": "8",
-            "intro": "Equity represents the true ownership value in your business—what remains after all debts are paid",
-            "sections": ["Understanding Shareholders Equity", "Components of Equity", "Equity vs Debt Financing", "Building Equity Value"]
-        },
-        "boosting-revenue": {
-            "icon": "TrendingUp", 
-            "color": "blue",
-            "read_time": "9",
-            "intro": "Revenue is the lifeblood of any business, representing the total income generated from operations",
-            "sections": ["Revenue Growth Strategies", "Diversifying Income Streams", "Pricing Optimization", "Customer Retention"]
-        },
-        "cutting-expenses": {
-            "icon": "Scissors",
-            "color": "red",
-            "read_time": "8",
-            "intro": "Strategic expense reduction can dramatically improve profitability without compromising quality",
-            "sections": ["Identifying Cost Drivers", "Strategic Cost Reduction", "Technology and Automation", "Vendor Management"]
-        },
-        "net-income": {
-            "icon": "Target",
-            "color": "purple",
-            "read_time": "7",
-            "intro": "Net income represents the true bottom line—what remains after all expenses, taxes, and costs",
-            "sections": ["Calculating Net Income", "Net vs Gross Profit", "Improving Net Margins", "Industry Benchmarks"]
-        },
-        "accounts-receivable": {
-            "icon": "FileText",
-            "color": "blue",
-            "read_time": "9",
-            "intro": "Effective accounts receivable management is crucial for maintaining healthy cash flow",
-            "sections": ["AR Management Best Practices", "Collection Strategies", "Credit Policies", "Reducing DSO"]
-        },
-        "accounts-payable": {
-            "icon": "CreditCard",
-            "color": "orange",
-            "read_time": "8",
-            "intro": "Strategic accounts payable management balances cash flow optimization with vendor relationships",
-            "sections": ["Payment Optimization", "Vendor Relations", "Early Payment Discounts", "AP Automation"]
-        },
-        "power-of-cash": {
-            "icon": "Banknote",
-            "color": "green",
-            "read_time": "8",
-            "intro": "Cash is the ultimate measure of business liquidity and operational flexibility",
-            "sections": ["Cash Management Fundamentals", "Liquidity Optimization", "Cash Reserves Strategy", "Cash Flow Forecasting"]
-        },
-        "inventory-management": {
-            "icon": "Package",
-            "color": "amber",
-            "read_time": "9",
-            "intro": "Optimal inventory management balances customer demand with carrying costs",
-            "sections": ["Inventory Optimization", "Just-in-Time Strategies", "Turnover Improvement", "Technology Solutions"]
-        },
-        "fixed-assets": {
-            "icon": "Building2",
-            "color": "indigo",
-            "read_time": "8",
-            "intro": "Fixed assets represent long-term investments that drive operational capacity",
-            "sections": ["Asset Investment Strategy", "Depreciation Planning", "Maintenance vs Replacement", "ROI Optimization"]
-        },
-        "current-assets": {
-            "icon": "Wallet",
-            "color": "cyan",
-            "read_time": "7",
-            "intro": "Current assets provide the liquidity needed for day-to-day operations",
-            "sections": ["Liquidity Management", "Working Capital Optimization", "Asset Conversion", "Risk Management"]
-        },
-        "current-liabilities": {
-            "icon": "Clock",
-            "color": "red",
-            "read_time": "8",
-            "intro": "Managing current liabilities effectively ensures operational continuity and financial flexibility",
-            "sections": ["Short-term Debt Management", "Payment Prioritization", "Cash Flow Alignment", "Vendor Relations"]
-        },
-        "long-term-liabilities": {
-            "icon": "Calendar",
-            "color": "purple",
-            "read_time": "9",
-            "intro": "Long-term liabilities provide capital for growth while requiring careful management",
-            "sections": ["Debt Structure Optimization", "Refinancing Strategies", "Covenant Management", "Leverage Ratios"]
-        },
-        "retained-earnings": {
-            "icon": "PiggyBank",
-            "color": "green",
-            "read_time": "8",
-            "intro": "Retained earnings represent the accumulated profits reinvested in business growth",
-            "sections": ["Retention vs Distribution", "Growth Financing", "Building Equity", "Shareholder Value"]
-        },
-        "gross-profit": {
-            "icon": "Calculator",
-            "color": "blue",
-            "read_time": "8",
-            "intro": "Gross profit reveals the fundamental profitability of your core business operations",
-            "sections": ["Margin Analysis", "Pricing Strategies", "Cost Reduction", "Competitive Positioning"]
-        },
-        "operating-income": {
-            "icon": "Activity",
-            "color": "orange",
-            "read_time": "8",
-            "intro": "Operating income measures the profitability of core business operations",
-            "sections": ["EBIT Analysis", "Operational Efficiency", "Cost Management", "Performance Metrics"]
-        },
-        "cost-of-goods": {
-            "icon": "ShoppingCart",
-            "color": "red",
-            "read_time": "9",
-            "intro": "Managing COGS effectively is crucial for maintaining healthy profit margins",
-            "sections": ["Direct Cost Management", "Supply Chain Optimization", "Vendor Negotiations", "Process Improvement"]
-        },
-        "depreciation": {
-            "icon": "TrendingDown",
-            "color": "gray",
-            "read_time": "8",
-            "intro": "Depreciation allocates asset costs over time, impacting both taxes and profitability",
-            "sections": ["Depreciation Methods", "Tax Implications", "Asset Planning", "Financial Impact"]
-        },
-        "amortization": {
-            "icon": "Layers",
-            "color": "indigo",
-            "read_time": "7",
-            "intro": "Amortization spreads intangible asset costs and loan payments over time",
-            "sections": ["Amortization Types", "Calculation Methods", "Tax Benefits", "Strategic Planning"]
-        },
-        "shareholders-equity": {
-            "icon": "Users",
-            "color": "blue",
-            "read_time": "8",
-            "intro": "Shareholders equity represents the owners residual claim on company assets",
-            "sections": ["Equity Components", "Valuation Metrics", "Investor Perspectives", "Building Value"]
-        },
-        "managing-debt": {
-            "icon": "Scale",
-            "color": "red",
-            "read_time": "9",
-            "intro": "Strategic debt management balances growth financing with financial stability",
-            "sections": ["Optimal Leverage", "Debt Restructuring", "Interest Management", "Risk Mitigation"]
-        },
-        "cash-flow-essentials": {
-            "icon": "Droplets",
-            "color": "cyan",
-            "read_time": "9",
-            "intro": "Cash flow is the lifeblood that keeps your business operations running smoothly",
-            "sections": ["Operating Cash Flow", "Cash Flow Forecasting", "Working Capital", "Crisis Management"]
-        },
-        "accrued-expenses": {
-            "icon": "Archive",
-            "color": "amber",
-            "read_time": "7",
-            "intro": "Accrued expenses ensure accurate financial reporting by matching costs to periods",
-            "sections": ["Accrual Accounting", "Common Accruals", "Financial Impact", "Management Strategies"]
-        },
-        "prepaid-expenses": {
-            "icon": "FastForward",
-            "color": "green",
-            "read_time": "7",
-            "intro": "Prepaid expenses represent future economic benefits already paid for",
-            "sections": ["Prepayment Benefits", "Accounting Treatment", "Cash Flow Impact", "Strategic Use"]
-        },
-        "controlling-operating": {
-            "icon": "Settings",
-            "color": "purple",
-            "read_time": "8",
-            "intro": "Controlling operating expenses is essential for maintaining profitability",
-            "sections": ["Expense Categories", "Cost Control Methods", "Efficiency Metrics", "Continuous Improvement"]
-        },
-        "interest-expense": {
-            "icon": "Percent",
-            "color": "red",
-            "read_time": "8",
-            "intro": "Interest expense represents the cost of borrowed capital for business operations",
-            "sections": ["Interest Rate Management", "Debt Optimization", "Tax Deductibility", "Refinancing Strategies"]
-        },
-        "taxes-business": {
-            "icon": "Receipt",
-            "color": "gray",
-            "read_time": "9",
-            "intro": "Strategic tax planning can significantly impact your bottom line profitability",
-            "sections": ["Tax Planning Strategies", "Deduction Optimization", "Structure Benefits", "Compliance Management"]
-        },
-        "dividends": {
-            "icon": "Gift",
-            "color": "green",
-            "read_time": "8",
-            "intro": "Dividend policy balances rewarding shareholders with retaining capital for growth",
-            "sections": ["Dividend Strategies", "Payout Ratios", "Tax Implications", "Growth vs Income"]
-        },
-        "working-capital": {
-            "icon": "RefreshCw",
-            "color": "blue",
-            "read_time": "9",
-            "intro": "Working capital management ensures sufficient liquidity for daily operations",
-            "sections": ["Working Capital Cycle", "Optimization Strategies", "Industry Benchmarks", "Crisis Planning"]
-        }
-    }
-    
-    # Extract key from slug
-    for key in content_map:
-        if key in slug:
-            details = content_map[key]
-            break
-    else:
-        # Default values
-        details = {
-            "icon": "BarChart3",
-            "color": "blue",
-            "read_time": "8",
-            "intro": description,
-            "sections": ["Key Concepts", "Best Practices", "Common Challenges", "Strategic Implementation"]
-        }
-    
-    return f'''import {{ Metadata }} from 'next'
-import Link from 'next/link'
-import {{ ArrowLeft, Clock, Calendar, CheckCircle, {details["icon"]}, DollarSign, TrendingUp, BarChart3, AlertCircle, Target }} from 'lucide-react'
 
-export const metadata: Metadata = {{
-  title: '{title}',
-  description: '{description}',
-  keywords: {keywords},
-  openGraph: {{
-    title: '{title}',
-    description: '{description}',
-    type: 'article',
-    url: 'https://myaibookkeeper.com/blog/{slug}',
-  }}
-}}
+def main(argv=None):
+    run(financial, argv)
 
-export default function {slug.replace("-", "").title().replace("-", "")}() {{
-  return (
-    <article className="min-h-screen bg-gradient-to-b from-neutral-50 to-white">
-      <div className="bg-gradient-to-br from-{details["color"]}-50 via-white to-{details["color"]}-50 border-b border-neutral-200">
-        <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-          <Link 
-            href="/blog" 
-            className="inline-flex items-center text-{details["color"]}-600 hover:text-{details["color"]}-700 mb-6 transition-colors"
-          >
-            <ArrowLeft className="w-4 h-4 mr-2" />
-            Back to Blog
-          </Link>
-          
-          <div className="space-y-4">
-            <div className="flex items-center space-x-4 text-sm text-neutral-600">
-              <span className="px-3 py-1 bg-{details["color"]}-100 text-{details["color"]}-700 rounded-full font-medium">
-                Financial Fundamentals
-              </span>
-              <div className="flex items-center space-x-1">
-                <Calendar className="w-4 h-4" />
-                <time dateTime="2024-12-29">December 29, 2024</time>
-              </div>
-              <div className="flex items-center space-x-1">
-                <Clock className="w-4 h-4" />
-                <span>{details["read_time"]} min read</span>
-              </div>
-            </div>
-            
-            <h1 className="text-4xl sm:text-5xl font-bold text-neutral-900 leading-tight">
-              {title}
-            </h1>
-            
-            <p className="text-xl text-neutral-600">
-              {description}
-            </p>
-          </div>
-        </div>
-      </div>
 
-      <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <div className="prose prose-lg max-w-none">
-          <p className="lead text-xl text-neutral-700 mb-8">
-            {details["intro"]}. Understanding and optimizing this critical financial metric can transform your business's financial health and competitive position. This comprehensive guide explores the fundamental concepts, practical strategies, and real-world applications that will help you master this essential aspect of financial management. Whether you're a startup founder, small business owner, or financial manager, the insights and techniques presented here will equip you with the knowledge needed to make informed decisions and drive sustainable growth.
-          </p>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            {details["sections"][0]}
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            The foundation of effective financial management begins with a clear understanding of core concepts and their practical applications. In today's dynamic business environment, the ability to analyze, interpret, and act on financial data separates successful businesses from those that struggle. This section explores the fundamental principles that underpin sound financial decision-making and provides a framework for implementing best practices in your organization.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Financial metrics serve as the compass guiding business decisions, providing objective measures of performance and highlighting areas for improvement. By establishing clear benchmarks and regularly monitoring key indicators, businesses can identify trends early, capitalize on opportunities, and address challenges before they become critical issues. The key is selecting the right metrics for your specific business model and industry context.
-          </p>
-
-          <div className="bg-gradient-to-r from-{details["color"]}-50 to-{details["color"]}-50 rounded-2xl p-8 my-8 not-prose">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <{details["icon"]} className="w-6 h-6 mr-3 text-{details["color"]}-600" />
-              Key Performance Indicators
-            </h3>
-            <div className="bg-white/80 rounded-xl p-6">
-              <div className="grid md:grid-cols-2 gap-6">
-                <div>
-                  <h4 className="font-semibold text-neutral-900 mb-3">Financial Metrics</h4>
-                  <ul className="space-y-2 text-sm text-neutral-700">
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Revenue growth rate and trends</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Profit margins and efficiency ratios</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Cash flow and liquidity measures</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Return on investment metrics</span>
-                    </li>
-                  </ul>
-                </div>
-                <div>
-                  <h4 className="font-semibold text-neutral-900 mb-3">Operational Indicators</h4>
-                  <ul className="space-y-2 text-sm text-neutral-700">
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Efficiency and productivity rates</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Quality and customer satisfaction</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Market share and competitive position</span>
-                    </li>
-                    <li className="flex items-start">
-                      <CheckCircle className="w-4 h-4 text-green-600 mr-2 mt-0.5 flex-shrink-0" />
-                      <span>Innovation and growth metrics</span>
-                    </li>
-                  </ul>
-                </div>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            {details["sections"][1]}
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Implementing effective financial strategies requires a systematic approach that aligns with your business objectives and market realities. Success depends on understanding not just what to do, but when and how to do it. This section explores proven methodologies and practical techniques that can be adapted to your specific circumstances, providing a roadmap for sustainable financial improvement.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The most successful businesses recognize that financial management is not a one-time exercise but an ongoing process of refinement and optimization. By establishing robust systems and processes, regularly reviewing performance, and maintaining flexibility to adapt to changing conditions, organizations can build resilient financial foundations that support long-term growth and stability.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Strategic Implementation Framework</h3>
-            
-            <div className="space-y-4">
-              <div className="border-l-4 border-{details["color"]}-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Assessment and Analysis</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Begin with a comprehensive evaluation of current financial position, identifying strengths, weaknesses, opportunities, and threats. Use historical data to establish baselines and industry benchmarks to set realistic targets for improvement.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-{details["color"]}-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Planning and Goal Setting</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Develop clear, measurable objectives aligned with overall business strategy. Create detailed action plans with specific timelines, responsibilities, and resource requirements. Ensure goals are ambitious yet achievable.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-{details["color"]}-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Implementation and Monitoring</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Execute strategies systematically while maintaining flexibility to adjust as needed. Establish regular review cycles to track progress, identify deviations, and make course corrections promptly.
-                </p>
-              </div>
-
-              <div className="border-l-4 border-{details["color"]}-500 pl-4">
-                <h4 className="font-semibold text-neutral-900">Optimization and Scaling</h4>
-                <p className="text-sm text-neutral-700 mt-1">
-                  Continuously refine processes based on results and feedback. Document successful practices and scale them across the organization. Foster a culture of continuous improvement and financial awareness.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            {details["sections"][2]}
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Every business faces unique challenges in financial management, from cash flow constraints to competitive pressures. Understanding common pitfalls and developing strategies to overcome them is essential for long-term success. This section addresses frequent obstacles and provides practical solutions based on real-world experience and best practices.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The key to overcoming financial challenges lies in proactive management and systematic problem-solving. By anticipating potential issues, maintaining adequate reserves, and developing contingency plans, businesses can navigate difficulties while maintaining operational stability. Regular stress testing and scenario planning help identify vulnerabilities before they become critical.
-          </p>
-
-          <div className="bg-gradient-to-r from-yellow-50 to-amber-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6 flex items-center">
-              <AlertCircle className="w-6 h-6 mr-3 text-yellow-600" />
-              Common Challenges and Solutions
-            </h3>
-            
-            <div className="grid md:grid-cols-2 gap-4">
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Cash Flow Management</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Irregular revenue patterns</li>
-                  <li>• Extended payment cycles</li>
-                  <li>• Seasonal fluctuations</li>
-                  <li>• Unexpected expenses</li>
-                </ul>
-              </div>
-              <div className="bg-white/80 rounded-lg p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Growth Challenges</h4>
-                <ul className="space-y-1 text-sm text-neutral-700">
-                  <li>• Scaling operations efficiently</li>
-                  <li>• Managing increased complexity</li>
-                  <li>• Maintaining quality standards</li>
-                  <li>• Funding expansion needs</li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            {details["sections"][3]}
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Translating financial knowledge into actionable strategies requires careful planning and disciplined execution. This section provides a comprehensive framework for implementing financial best practices in your organization, ensuring that theoretical understanding translates into practical results. The focus is on creating sustainable systems that deliver consistent improvements over time.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Successful implementation depends on alignment across all levels of the organization. From executive leadership to front-line employees, everyone must understand their role in achieving financial objectives. Clear communication, appropriate training, and consistent reinforcement of financial priorities create a culture where sound financial management becomes embedded in daily operations.
-          </p>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-6 mb-8">
-            <h3 className="text-xl font-bold text-neutral-900 mb-4">Implementation Best Practices</h3>
-            
-            <div className="grid md:grid-cols-2 gap-6">
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">System Development</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Establish clear processes and procedures</span>
-                  </li>
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Implement robust tracking mechanisms</span>
-                  </li>
-                  <li className="flex items-start">
-                    <BarChart3 className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Create accountability structures</span>
-                  </li>
-                </ul>
-              </div>
-              <div>
-                <h4 className="font-semibold text-neutral-900 mb-3">Performance Management</h4>
-                <ul className="space-y-2 text-sm text-neutral-700">
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Set measurable objectives and KPIs</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Regular monitoring and reporting</span>
-                  </li>
-                  <li className="flex items-start">
-                    <Target className="w-4 h-4 text-{details["color"]}-600 mr-2 mt-0.5 flex-shrink-0" />
-                    <span>Continuous improvement initiatives</span>
-                  </li>
-                </ul>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Advanced Strategies and Optimization
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            As businesses mature and financial management capabilities develop, opportunities emerge for more sophisticated optimization strategies. Advanced techniques can deliver significant improvements in financial performance, but require careful implementation and ongoing management. This section explores cutting-edge approaches that leading organizations use to maximize financial efficiency and competitive advantage.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            Technology plays an increasingly important role in financial optimization, from automated data collection and analysis to predictive modeling and artificial intelligence. By leveraging modern tools and platforms, businesses can gain deeper insights, make faster decisions, and achieve levels of financial control previously impossible. The key is selecting technologies that align with your specific needs and capabilities.
-          </p>
-
-          <div className="bg-gradient-to-r from-purple-50 to-pink-50 rounded-2xl p-8 mb-8">
-            <h3 className="text-2xl font-bold text-neutral-900 mb-6">Technology and Innovation</h3>
-            
-            <div className="space-y-4">
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Automation and AI</h4>
-                <p className="text-sm text-neutral-700">
-                  Implement intelligent automation to streamline routine financial processes, reduce errors, and free up resources for strategic activities. Use AI-powered analytics to identify patterns, predict trends, and optimize decision-making across all financial functions.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Real-time Analytics</h4>
-                <p className="text-sm text-neutral-700">
-                  Deploy dashboards and reporting tools that provide instant visibility into financial performance. Enable data-driven decision-making at all organizational levels with accessible, actionable insights updated in real-time.
-                </p>
-              </div>
-              
-              <div className="bg-white/80 rounded-xl p-4">
-                <h4 className="font-semibold text-neutral-900 mb-2">Predictive Modeling</h4>
-                <p className="text-sm text-neutral-700">
-                  Utilize advanced analytics to forecast future financial scenarios, identify risks early, and optimize resource allocation. Build models that account for multiple variables and provide probabilistic outcomes for better planning.
-                </p>
-              </div>
-            </div>
-          </div>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Industry Benchmarks and Best Practices
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Understanding how your financial performance compares to industry standards provides valuable context for improvement efforts. Benchmarking against peers and best-in-class organizations helps identify gaps, set realistic targets, and prioritize improvement initiatives. This section examines key industry metrics and explores proven practices from leading organizations.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            While benchmarks provide useful reference points, it's important to consider your unique circumstances when setting targets. Factors such as business model, market position, growth stage, and strategic objectives all influence what constitutes optimal financial performance for your organization. Use benchmarks as guides, not absolute standards, and focus on continuous improvement relative to your own baseline.
-          </p>
-
-          <h2 className="text-3xl font-bold text-neutral-900 mt-12 mb-6">
-            Building Financial Resilience
-          </h2>
-
-          <p className="text-neutral-700 mb-6">
-            Financial resilience—the ability to withstand and recover from economic shocks—has become increasingly important in today's volatile business environment. Building resilience requires more than just maintaining cash reserves; it involves creating flexible systems, diversifying risk, and developing the organizational capability to adapt quickly to changing conditions.
-          </p>
-
-          <p className="text-neutral-700 mb-6">
-            The most resilient organizations combine strong financial fundamentals with operational agility and strategic foresight. They maintain disciplined financial management during good times, building the resources and capabilities needed to navigate challenges. Regular scenario planning, stress testing, and contingency preparation ensure readiness for various potential futures.
-          </p>
-
-          <div className="bg-gradient-to-r from-{details["color"]}-50 to-cyan-50 rounded-2xl p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Key Takeaways
-            </h2>
-            <ul className="space-y-3 text-neutral-700">
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-{details["color"]}-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Strong financial management provides the foundation for sustainable business growth and competitive advantage</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-{details["color"]}-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Regular monitoring and analysis of key metrics enables proactive decision-making and early problem detection</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-{details["color"]}-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Systematic implementation of best practices delivers consistent improvements in financial performance</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-{details["color"]}-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Technology and automation increasingly enable sophisticated financial optimization strategies</span>
-              </li>
-              <li className="flex items-start">
-                <CheckCircle className="w-5 h-5 text-{details["color"]}-600 mr-3 mt-0.5 flex-shrink-0" />
-                <span>Building financial resilience requires disciplined management combined with flexibility and foresight</span>
-              </li>
-            </ul>
-          </div>
-
-          <div className="bg-white rounded-xl shadow-sm border border-neutral-200 p-8 mt-12">
-            <h2 className="text-2xl font-bold text-neutral-900 mb-4">
-              Transform Your Financial Management with AI-Powered Solutions
-            </h2>
-            <p className="text-neutral-700 mb-6">
-              Take your financial management to the next level with intelligent automation and real-time insights. AI-powered bookkeeping and financial analysis tools provide the visibility, control, and optimization capabilities needed to excel in today's competitive environment. Start building a stronger financial foundation for sustainable growth and success.
-            </p>
-            <Link
-              href="/"
-              className="inline-flex items-center px-6 py-3 bg-gradient-to-r from-{details["color"]}-600 to-{details["color"]}-600 hover:from-{details["color"]}-700 hover:to-{details["color"]}-700 text-white font-medium rounded-full transition-all duration-200 shadow-lg hover:shadow-xl"
-            >
-              Optimize Your Financial Performance Today
-              <ArrowLeft className="w-4 h-4 ml-2 rotate-180" />
-            </Link>
-          </div>
-        </div>
-      </div>
-    </article>
-  )
-}}'''
-
-# Generate all blog files
-blogs = [
-    ("equity-explained-company-financial-health", "Equity Explained: What It Means for Your Company's Financial Health", 
-     "Understand business equity, its components, and how it reflects your company's true value and financial health.",
-     ["shareholders equity", "owner equity", "retained earnings", "equity financing", "equity vs debt"]),
-    
-    ("boosting-revenue-strategies-grow-top-line", "Boosting Revenue: Top Strategies to Grow Your Top Line",
-     "Discover proven strategies to boost revenue, diversify income streams, and accelerate top-line growth for sustainable business expansion.",
-     ["revenue growth strategies", "increase sales revenue", "top line growth", "revenue optimization", "business revenue streams"]),
-    
-    ("cutting-expenses-without-sacrificing-quality", "Cutting Expenses Without Sacrificing Quality: A Practical Guide",
-     "Learn how to strategically reduce business expenses while maintaining quality, efficiency, and customer satisfaction.",
-     ["expense reduction strategies", "cost cutting measures", "business expense management", "operational efficiency", "reduce business costs"]),
-    
-    ("net-income-ultimate-measure-profitability", "Net Income: Why It's the Ultimate Measure of Profitability",
-     "Master net income analysis to understand true profitability, improve margins, and make data-driven business decisions.",
-     ["net income calculation", "bottom line profit", "net profit margin", "profitability metrics", "net income vs gross profit"]),
-    
-    ("accounts-receivable-streamline-collections-cash-flow", "Accounts Receivable: How to Streamline Collections and Improve Cash Flow",
-     "Optimize accounts receivable processes to accelerate collections, reduce bad debt, and improve cash flow management.",
-     ["accounts receivable management", "invoice collection strategies", "AR turnover ratio", "cash flow optimization", "credit management"]),
-    
-    ("accounts-payable-best-practices-managing-what-you-owe", "Accounts Payable: Best Practices for Managing What You Owe",
-     "Master accounts payable management to optimize cash flow, maintain vendor relationships, and capture early payment discounts.",
-     ["accounts payable management", "vendor payment optimization", "AP automation", "payment terms negotiation", "cash flow management"]),
-    
-    ("power-of-cash-liquidity-business-success", "The Power of Cash: Why Liquidity Is Key to Business Success",
-     "Understand why cash is king in business and learn strategies to maintain optimal liquidity for growth and stability.",
-     ["cash management strategies", "business liquidity", "cash flow optimization", "working capital management", "cash reserves"]),
-    
-    ("inventory-management-balancing-stock-maximize-profits", "Inventory Management: Balancing Stock to Maximize Profits",
-     "Master inventory management techniques to reduce carrying costs, prevent stockouts, and maximize profitability.",
-     ["inventory optimization", "stock management strategies", "inventory turnover", "just in time inventory", "inventory carrying costs"]),
-    
-    ("fixed-assets-optimize-long-term-investments", "Fixed Assets: How to Optimize Long-Term Investments for Growth",
-     "Learn how to strategically manage fixed assets to maximize ROI, optimize depreciation, and support long-term growth.",
-     ["fixed asset management", "capital investment strategies", "asset depreciation", "ROI optimization", "equipment financing"]),
-    
-    ("current-assets-key-short-term-financial-stability", "Current Assets: The Key to Short-Term Financial Stability",
-     "Master current asset management to ensure liquidity, meet obligations, and maintain financial flexibility.",
-     ["current assets management", "working capital optimization", "liquidity ratios", "short-term assets", "cash conversion cycle"]),
-    
-    ("navigating-current-liabilities-staying-financially-agile", "Navigating Current Liabilities: Tips for Staying Financially Agile",
-     "Learn to effectively manage current liabilities to maintain financial agility and optimize working capital.",
-     ["current liabilities management", "short-term debt", "working capital", "payables management", "liquidity management"]),
-    
-    ("long-term-liabilities-sustainable-debt-management", "Long-Term Liabilities: Planning for Sustainable Debt Management",
-     "Master long-term liability management for sustainable growth, optimal leverage, and financial stability.",
-     ["long-term debt management", "debt sustainability", "leverage ratios", "debt restructuring", "capital structure"]),
-    
-    ("retained-earnings-fuel-business-future-growth", "Retained Earnings: How They Fuel Your Business's Future Growth",
-     "Understand how retained earnings drive growth and learn strategies for optimal profit retention and reinvestment.",
-     ["retained earnings management", "profit retention strategies", "reinvestment decisions", "dividend policy", "growth financing"]),
-    
-    ("gross-profit-secrets-increase-margins", "Gross Profit Secrets: How to Increase Your Margins",
-     "Discover proven strategies to increase gross profit margins through pricing optimization and cost management.",
-     ["gross profit margin", "margin improvement strategies", "pricing optimization", "cost reduction", "profitability analysis"]),
-    
-    ("operating-income-measuring-business-core-performance", "Operating Income: Measuring Your Business's Core Performance",
-     "Master operating income analysis to evaluate core business performance and identify improvement opportunities.",
-     ["operating income analysis", "EBIT calculation", "operational efficiency", "core business profitability", "operating margin"]),
-    
-    ("cost-of-goods-sold-strategies-lower-costs", "Cost of Goods Sold: Strategies to Lower Costs and Boost Profits",
-     "Learn effective strategies to reduce cost of goods sold while maintaining quality and customer satisfaction.",
-     ["COGS reduction", "cost management strategies", "supply chain optimization", "direct cost control", "margin improvement"]),
-    
-    ("depreciation-demystified-impact-financial-statements", "Depreciation Demystified: How It Impacts Your Financial Statements",
-     "Understand depreciation methods, tax implications, and how to use depreciation strategically in financial planning.",
-     ["depreciation methods", "asset depreciation", "tax depreciation", "accumulated depreciation", "depreciation impact"]),
-    
-    ("amortization-understanding-role-income-statement", "Amortization: Understanding Its Role in Your Income Statement",
-     "Master amortization concepts for intangible assets and loans to optimize financial reporting and tax planning.",
-     ["amortization explained", "intangible asset amortization", "loan amortization", "amortization schedule", "amortization vs depreciation"]),
-    
-    ("shareholders-equity-what-tells-investors", "Shareholders' Equity: What It Tells Investors About Your Company",
-     "Understand how shareholders' equity reflects company value and what it signals to investors and stakeholders.",
-     ["shareholders equity analysis", "equity valuation", "book value", "return on equity", "equity investors"]),
-    
-    ("managing-debt-balance-borrowing-financial-health", "Managing Debt: How to Balance Borrowing with Financial Health",
-     "Learn to strategically manage business debt, optimize leverage, and maintain financial health while funding growth.",
-     ["debt management strategies", "optimal debt levels", "debt refinancing", "leverage optimization", "debt service coverage"]),
-    
-    ("cash-flow-essentials-keeping-business-liquid", "Cash Flow Essentials: Keeping Your Business Liquid and Thriving",
-     "Master cash flow management essentials to maintain liquidity, fund operations, and support sustainable growth.",
-     ["cash flow management", "cash flow forecasting", "operating cash flow", "free cash flow", "cash flow statement"]),
-    
-    ("accrued-expenses-account-hidden-costs", "Accrued Expenses: How to Account for Hidden Costs",
-     "Understand accrued expenses and their impact on financial statements, cash flow, and business decision-making.",
-     ["accrued expenses accounting", "accrual accounting", "expense recognition", "financial reporting accuracy", "hidden business costs"]),
-    
-    ("prepaid-expenses-timing-matters-financial-reporting", "Prepaid Expenses: Why Timing Matters in Financial Reporting",
-     "Learn how to properly account for prepaid expenses and understand their impact on financial reporting and cash flow.",
-     ["prepaid expenses accounting", "expense timing", "deferred expenses", "matching principle", "financial statement accuracy"]),
-    
-    ("controlling-operating-expenses-lean-business-operations", "Controlling Operating Expenses: Tips for Lean Business Operations",
-     "Discover strategies to control operating expenses while maintaining efficiency and driving business growth.",
-     ["operating expense reduction", "OPEX optimization", "lean operations", "expense control strategies", "operational efficiency"]),
-    
-    ("interest-expense-borrowing-costs-affect-bottom-line", "Interest Expense: How Borrowing Costs Affect Your Bottom Line",
-     "Understand how interest expenses impact profitability and learn strategies to optimize borrowing costs.",
-     ["interest expense management", "borrowing costs", "interest rate optimization", "debt cost analysis", "financial leverage"]),
-    
-    ("taxes-business-smart-strategies-minimize-burden", "Taxes and Your Business: Smart Strategies to Minimize Tax Burden",
-     "Learn legal strategies to minimize business taxes through proper planning, deductions, and structure optimization.",
-     ["business tax strategies", "tax planning", "tax deductions", "tax optimization", "corporate tax management"]),
-    
-    ("dividends-balancing-shareholder-rewards-company-growth", "Dividends: Balancing Shareholder Rewards with Company Growth",
-     "Master dividend strategy to balance shareholder returns with business growth and capital retention needs.",
-     ["dividend policy", "dividend strategy", "shareholder returns", "profit distribution", "dividend vs reinvestment"]),
-    
-    ("working-capital-lifeline-business-operations", "Working Capital: The Lifeline of Your Business's Day-to-Day Operations",
-     "Understand working capital management to ensure smooth operations, meet obligations, and support business growth.",
-     ["working capital management", "working capital optimization", "cash conversion cycle", "liquidity management", "operational funding"])
-]
-
-for path, title, description, keywords in blogs:
-    slug = path.split("/")[-1]
-    content = create_blog_content(title, description, keywords, slug)
-    
-    file_path = f"/workspace/app/blog/{path}/page.tsx"
-    with open(file_path, 'w') as f:
-        f.write(content)
-    print(f"Created: {file_path}")
-
-print("\nAll financial concept blogs created successfully!")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import meta from '@/data/blog-index/meta.json'
+
+// Cards and shards are generated by the blog_pipeline Python scripts; see data/blog-index
+export interface BlogIndexEntry {
+  slug: string
+  title: string
+  excerpt: string
+  date: string
+  readTime: string
+  icon: string
+  category: string
+}
+
+export const blogIndexMeta: { pageSize: number; totalPosts: number; totalPages: number } = meta
+
+// Each shard is a separate chunk, so a listing page only pulls in the posts it shows
+export async function getBlogIndexPage(page: number): Promise<BlogIndexEntry[]> {
+  if (!Number.isInteger(page) || page < 1 || page > blogIndexMeta.totalPages) {
+    return []
+  }
+  const shard = await import(`../data/blog-index/page-${page}.json`)
+  return shard.default
+}
+
+export async function getFeaturedPosts(): Promise<BlogIndexEntry[]> {
+  const featured = await import('../data/blog-index/featured.json')
+  return featured.default
+}
+
+export function blogIndexHref(page: number) {
+  return page === 1 ? '/blog' : `/blog/page/${page}`
+}
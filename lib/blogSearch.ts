@@ -0,0 +1,122 @@
+// Client for the static search index that blog_pipeline/search_index.py writes to public/search.
+// index.json lists content-hashed shard files; shards are fetched only when a query needs them.
+
+const SEARCH_BASE = '/search'
+const MAX_PREFIX_TERMS = 50
+
+// Kept in step with STOPWORDS in blog_pipeline/search_index.py
+const STOPWORDS = new Set(
+  'a an and are as at be by for from how in into is it its of on or that the this to what when why with you your'.split(' ')
+)
+
+interface SearchManifest {
+  version: number
+  totalPosts: number
+  docShardSize: number
+  docs: string[]
+  terms: [string, string][]
+}
+
+interface TermShard {
+  terms: string[]
+  postings: number[][]
+}
+
+type DocRow = [slug: string, title: string, excerpt: string, category: string]
+
+export interface BlogSearchResult {
+  slug: string
+  title: string
+  excerpt: string
+  category: string
+  score: number
+}
+
+const cache = new Map<string, Promise<unknown>>()
+
+function fetchJson<T>(name: string): Promise<T> {
+  let pending = cache.get(name)
+  if (!pending) {
+    pending = fetch(`${SEARCH_BASE}/${name}`).then((response) => {
+      if (!response.ok) throw new Error(`Search index ${name}: ${response.status}`)
+      return response.json()
+    })
+    pending.catch(() => cache.delete(name))
+    cache.set(name, pending)
+  }
+  return pending as Promise<T>
+}
+
+export function tokenize(text: string): string[] {
+  return text
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter((token) => token.length > 1 && !STOPWORDS.has(token))
+}
+
+function lowerBound(values: string[], target: string) {
+  let low = 0
+  let high = values.length
+  while (low < high) {
+    const mid = (low + high) >> 1
+    if (values[mid] < target) low = mid + 1
+    else high = mid
+  }
+  return low
+}
+
+// Shards whose [first term, next shard's first term) range can hold a term starting with prefix
+function shardsFor(manifest: SearchManifest, prefix: string) {
+  const firsts = manifest.terms.map(([first]) => first)
+  const start = Math.max(lowerBound(firsts, prefix + '\u0000') - 1, 0)
+  const end = Math.max(lowerBound(firsts, prefix + '\uffff'), start + 1)
+  return manifest.terms.slice(start, end).map(([, name]) => name)
+}
+
+// doc id -> best weight over every term matching token (exactly, or as a prefix)
+async function lookup(manifest: SearchManifest, token: string, prefix: boolean) {
+  const scores = new Map<number, number>()
+  const shards = await Promise.all(shardsFor(manifest, token).map((name) => fetchJson<TermShard>(name)))
+  // The cap is on the whole expansion, however many shards the prefix spans
+  let matched = 0
+  for (const shard of shards) {
+    for (let i = lowerBound(shard.terms, token); i < shard.terms.length; i++) {
+      const term = shard.terms[i]
+      if (prefix ? !term.startsWith(token) : term !== token) break
+      if (++matched > MAX_PREFIX_TERMS) return scores
+      const postings = shard.postings[i]
+      let id = 0
+      for (let j = 0; j < postings.length; j += 2) {
+        id += postings[j]
+        scores.set(id, Math.max(scores.get(id) ?? 0, postings[j + 1]))
+      }
+    }
+  }
+  return scores
+}
+
+// Every token must match; the last one is treated as a prefix so results update while typing
+export async function searchBlog(query: string, limit = 10): Promise<BlogSearchResult[]> {
+  const tokens = tokenize(query)
+  if (tokens.length === 0) return []
+
+  const manifest = await fetchJson<SearchManifest>('index.json')
+  const matches = await Promise.all(tokens.map((token, i) => lookup(manifest, token, i === tokens.length - 1)))
+
+  let ranked: [number, number][] = Array.from(matches[0])
+  for (const other of matches.slice(1)) {
+    ranked = ranked.filter(([id]) => other.has(id)).map(([id, score]) => [id, score + other.get(id)!])
+  }
+  ranked.sort((a, b) => b[1] - a[1] || a[0] - b[0])
+  ranked = ranked.slice(0, limit)
+
+  const shardNames = Array.from(new Set(ranked.map(([id]) => manifest.docs[Math.floor(id / manifest.docShardSize)])))
+  const rows = new Map<string, DocRow[]>()
+  await Promise.all(shardNames.map(async (name) => rows.set(name, await fetchJson<DocRow[]>(name))))
+
+  return ranked.map(([id, score]) => {
+    const name = manifest.docs[Math.floor(id / manifest.docShardSize)]
+    const [slug, title, excerpt, category] = rows.get(name)![id % manifest.docShardSize]
+    return { slug, title, excerpt, category, score }
+  })
+}
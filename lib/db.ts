@@ -1,7 +1,17 @@
 import { drizzle } from 'drizzle-orm/neon-serverless'
-import { Pool } from '@neondatabase/serverless'
+import { Pool, neonConfig } from '@neondatabase/serverless'
 import * as schema from './schema'
 
+// A plain local Postgres (benchmarks/loadtest-compose.yml) is reached through Neon's wsproxy,
+// e.g. NEON_WS_PROXY=localhost:5433/v1, without TLS
+if (process.env.NEON_WS_PROXY) {
+  const proxy = process.env.NEON_WS_PROXY
+  neonConfig.wsProxy = () => proxy
+  neonConfig.useSecureWebSocket = false
+  neonConfig.pipelineTLS = false
+  neonConfig.pipelineConnect = false
+}
+
 // Lazy database connection
 let db: ReturnType<typeof drizzle<typeof schema>> | null = null
 
@@ -0,0 +1,57 @@
+// Picks the canned free-tier answer for a chat message. blog_pipeline/intents.py compiles
+// catalogs/chat_intents.json into data/chat-intents.json: the intents in priority order, a map of
+// exact messages and an Aho-Corasick automaton over every keyword, so one pass over the message
+// finds the best intent however many there are. Matches `python -m blog_pipeline.intents "<message>"`.
+
+import compiled from '../data/chat-intents.json'
+
+interface ResponseTemplate {
+  // Static text with null where a slot goes; slots pair each null's index with its name
+  parts: (string | null)[]
+  slots: [index: number, name: string][]
+}
+
+export interface Intent {
+  name: string
+  // Only answer when no blog passage does
+  fallback: boolean
+  response: ResponseTemplate
+}
+
+interface IntentTable {
+  version: number
+  default: number
+  intents: Intent[]
+  exact: Record<string, number>
+  goto: Record<string, number>[]
+  fail: number[]
+  best: number[]
+}
+
+const table = compiled as unknown as IntentTable
+
+// Kept in step with exact_key in blog_pipeline/intents.py
+function exactKey(message: string): string {
+  return message.trim().toLowerCase().replace(/[\s!.,?]+$/, '')
+}
+
+export function routeIntent(message: string): Intent {
+  const { goto, fail, best } = table
+  const key = exactKey(message)
+  let found = Object.prototype.hasOwnProperty.call(table.exact, key) ? table.exact[key] : -1
+  const text = message.toLowerCase()
+  let state = 0
+  for (let i = 0; i < text.length; i++) {
+    const char = text[i]
+    while (state !== 0 && goto[state][char] === undefined) state = fail[state]
+    state = goto[state][char] === undefined ? 0 : goto[state][char]
+    if (best[state] >= 0 && (found < 0 || best[state] < found)) found = best[state]
+  }
+  return table.intents[found >= 0 ? found : table.default]
+}
+
+export function renderIntent(intent: Intent, values: Record<string, string>): string {
+  const parts = intent.response.parts.slice()
+  for (const [index, name] of intent.response.slots) parts[index] = values[name]
+  return parts.join('')
+}
@@ -0,0 +1,23 @@
+// Offline load testing (benchmarks/loadgen.py). Outside production builds, and only with LOADTEST_SECRET
+// set, a request that sends the secret in X-Loadtest-Secret skips Clerk in the middleware and /api/chat
+// takes its user from X-Loadtest-User, so no Clerk keys or sessions are needed. next build inlines
+// NODE_ENV, so production bundles never contain the bypass.
+
+const LOAD_TEST_SECRET = process.env.NODE_ENV !== 'production' ? process.env.LOADTEST_SECRET || '' : ''
+
+export const LOAD_TEST_SECRET_HEADER = 'x-loadtest-secret'
+export const LOAD_TEST_USER_HEADER = 'x-loadtest-user'
+
+export function isLoadTestRequest(request: Request): boolean {
+  return LOAD_TEST_SECRET !== '' && request.headers.get(LOAD_TEST_SECRET_HEADER) === LOAD_TEST_SECRET
+}
+
+export function loadTestUserId(request: Request): string | null {
+  return isLoadTestRequest(request) ? request.headers.get(LOAD_TEST_USER_HEADER) : null
+}
+
+// New users need a unique email; Clerk would normally supply it
+export function loadTestEmail(request: Request): string | undefined {
+  const userId = loadTestUserId(request)
+  return userId ? `${userId}@loadtest.invalid` : undefined
+}
@@ -0,0 +1,80 @@
+// Ranks blog passages for the chat free tier. blog_pipeline/passages.py builds them into a SQLite FTS5
+// index and exports its posting lists to data/chat-passages.json; scores here follow FTS5's bm25()
+// with the same column weights, so results match `python -m blog_pipeline.passages "<question>"`.
+
+// Kept in step with STOPWORDS in blog_pipeline/search_index.py
+const STOPWORDS = new Set(
+  'a an and are as at be by for from how in into is it its of on or that the this to what when why with you your'.split(' ')
+)
+
+interface PassageExport {
+  version: number
+  k1: number
+  b: number
+  passages: [slug: string, title: string, heading: string, body: string, length: number][]
+  terms: Record<string, number[]>
+}
+
+export interface Passage {
+  slug: string
+  title: string
+  heading: string
+  body: string
+  // bm25() with the sign flipped: higher is better
+  score: number
+}
+
+let loaded: Promise<{ index: PassageExport; averageLength: number }> | null = null
+
+function loadIndex() {
+  if (!loaded) {
+    loaded = import('../data/chat-passages.json').then((module) => {
+      const index = module.default as unknown as PassageExport
+      const total = index.passages.reduce((sum, passage) => sum + passage[4], 0)
+      return { index, averageLength: total / Math.max(index.passages.length, 1) }
+    })
+  }
+  return loaded
+}
+
+export function queryTerms(question: string): string[] {
+  const tokens = question
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter((token) => token.length > 1 && !STOPWORDS.has(token))
+  return Array.from(new Set(tokens))
+}
+
+export async function searchPassages(question: string, limit = 3): Promise<Passage[]> {
+  const terms = queryTerms(question)
+  if (terms.length === 0) return []
+
+  const { index, averageLength } = await loadIndex()
+  const { k1, b, passages } = index
+  const count = passages.length
+  const scores = new Map<number, number>()
+
+  for (const term of terms) {
+    const postings = index.terms[term]
+    if (!postings) continue
+    const hits = postings.length / 2
+    let idf = Math.log((count - hits + 0.5) / (hits + 0.5))
+    if (idf <= 0) idf = 1e-6
+    for (let i = 0; i < postings.length; i += 2) {
+      const id = postings[i]
+      const frequency = postings[i + 1]
+      const norm = k1 * (1 - b + (b * passages[id][4]) / averageLength)
+      scores.set(id, (scores.get(id) ?? 0) + (idf * frequency * (k1 + 1)) / (frequency + norm))
+    }
+  }
+
+  return Array.from(scores)
+    .sort((x, y) => y[1] - x[1] || x[0] - y[0])
+    .slice(0, limit)
+    .map(([id, score]) => {
+      const [slug, title, heading, body] = passages[id]
+      return { slug, title, heading, body, score }
+    })
+}
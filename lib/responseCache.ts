@@ -0,0 +1,179 @@
+// Answers repeated chat questions without another Grok call. Entries live per partition (tier and
+// model) under the normalized question, so "How do I track mileage?" and "how do i track mileage"
+// share one. A question that is not an exact repeat still hits an entry whose content words overlap
+// enough: Jaccard similarity of the two word sets, with the candidates found through an index from
+// word to entries. The least recently used entry goes once
+// the cache is full, and entries expire after their TTL. Memory is per server instance.
+
+import { queryTerms } from './passageIndex'
+
+export interface CachedResponse {
+  response: string
+  modelUsed: string
+}
+
+// 'hit' is an exact repeat, 'near' a near-duplicate
+export type CacheOutcome = 'hit' | 'near' | 'miss'
+
+export interface CacheStats {
+  size: number
+  hits: number
+  nearHits: number
+  misses: number
+  stores: number
+  evictions: number
+  expirations: number
+  hitRate: number
+}
+
+interface Entry {
+  key: string
+  partition: string
+  terms: string[]
+  value: CachedResponse
+  expires: number
+}
+
+// Words that change between phrasings of the same question, on top of the passage search's stopwords
+const FILLER = new Set('can could did do does my our should we will would'.split(' '))
+
+// The passage search's terms without filler, plural "s" folded so "expenses" meets "expense"
+export function questionTerms(question: string): string[] {
+  const terms = queryTerms(question)
+    .filter((term) => !FILLER.has(term))
+    .map((term) => (term.length > 3 && term.endsWith('s') && !term.endsWith('ss') ? term.slice(0, -1) : term))
+  return Array.from(new Set(terms))
+}
+
+export function normalizeQuestion(question: string): string {
+  return question
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim()
+}
+
+function emptyCounts() {
+  return { hits: 0, nearHits: 0, misses: 0, stores: 0, evictions: 0, expirations: 0 }
+}
+
+export class ResponseCache {
+  // Insertion order is recency: the first entry is the least recently used
+  private entries = new Map<string, Entry>()
+  private index = new Map<string, Set<string>>()
+  private counts = emptyCounts()
+
+  constructor(
+    readonly maxEntries: number = 1000,
+    readonly ttlMs: number = 24 * 60 * 60 * 1000,
+    readonly minSimilarity: number = 0.8
+  ) {}
+
+  get(question: string, partition: string, now: number = Date.now()): { value: CachedResponse, outcome: CacheOutcome } | null {
+    const exact = this.live(`${partition}\n${normalizeQuestion(question)}`, now)
+    if (exact) {
+      this.counts.hits++
+      return { value: exact.value, outcome: 'hit' }
+    }
+
+    const terms = questionTerms(question)
+    const overlaps = new Map<string, number>()
+    terms.forEach((term) => {
+      const keys = this.index.get(`${partition}\n${term}`)
+      if (keys) keys.forEach((key) => overlaps.set(key, (overlaps.get(key) || 0) + 1))
+    })
+    // Expired candidates are dropped here rather than scored, so one cannot hide a live runner-up
+    let best: string | null = null
+    let bestSimilarity = this.minSimilarity
+    for (const key of Array.from(overlaps.keys())) {
+      const entry = this.entries.get(key)!
+      if (entry.expires <= now) {
+        this.remove(key, entry)
+        this.counts.expirations++
+        continue
+      }
+      const overlap = overlaps.get(key)!
+      const similarity = overlap / (terms.length + entry.terms.length - overlap)
+      if (similarity >= bestSimilarity) {
+        best = key
+        bestSimilarity = similarity
+      }
+    }
+    const near = best === null ? null : this.live(best, now)
+    if (near) {
+      this.counts.nearHits++
+      return { value: near.value, outcome: 'near' }
+    }
+
+    this.counts.misses++
+    return null
+  }
+
+  set(question: string, partition: string, value: CachedResponse, now: number = Date.now()): void {
+    const key = `${partition}\n${normalizeQuestion(question)}`
+    this.remove(key)
+    const entry = { key, partition, terms: questionTerms(question), value, expires: now + this.ttlMs }
+    this.entries.set(key, entry)
+    entry.terms.forEach((term) => {
+      const indexKey = `${partition}\n${term}`
+      const keys = this.index.get(indexKey)
+      if (keys) keys.add(key)
+      else this.index.set(indexKey, new Set([key]))
+    })
+    this.counts.stores++
+    while (this.entries.size > this.maxEntries) {
+      this.remove(this.entries.keys().next().value as string)
+      this.counts.evictions++
+    }
+  }
+
+  stats(): CacheStats {
+    const lookups = this.counts.hits + this.counts.nearHits + this.counts.misses
+    return {
+      size: this.entries.size,
+      ...this.counts,
+      hitRate: lookups ? (this.counts.hits + this.counts.nearHits) / lookups : 0
+    }
+  }
+
+  // Empties the cache and starts the counters over
+  clear(): void {
+    this.entries.clear()
+    this.index.clear()
+    this.counts = emptyCounts()
+  }
+
+  // The entry under key, moved to the most recently used end, unless it has expired
+  private live(key: string, now: number): Entry | null {
+    const entry = this.entries.get(key)
+    if (!entry) return null
+    this.entries.delete(key)
+    if (entry.expires <= now) {
+      this.remove(key, entry)
+      this.counts.expirations++
+      return null
+    }
+    this.entries.set(key, entry)
+    return entry
+  }
+
+  private remove(key: string, entry: Entry | undefined = this.entries.get(key)): void {
+    if (!entry) return
+    this.entries.delete(key)
+    entry.terms.forEach((term) => {
+      const indexKey = `${entry.partition}\n${term}`
+      const keys = this.index.get(indexKey)
+      if (keys && keys.delete(key) && keys.size === 0) this.index.delete(indexKey)
+    })
+  }
+}
+
+// One cache per server process, kept on globalThis so route modules and dev reloads share it
+const shared = globalThis as unknown as { responseCache?: ResponseCache }
+
+export const responseCache = shared.responseCache || (shared.responseCache = new ResponseCache(
+  Number(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 1000,
+  Number(process.env.RESPONSE_CACHE_TTL_MS) || 24 * 60 * 60 * 1000,
+  Number(process.env.RESPONSE_CACHE_MIN_SIMILARITY) || 0.8
+))
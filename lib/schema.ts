@@ -15,6 +15,7 @@ export const users = pgTable('users', {
   tier: varchar('tier', { length: 20 }).notNull().default('free'), // 'free', 'basic', 'elite'
   queryCount: integer('query_count').notNull().default(0), // Number of queries used this month
   queryLimit: integer('query_limit').notNull().default(5), // Monthly query limit
+  usagePeriod: date('usage_period', { mode: 'date' }), // First day of the month query_count counts; written only by /api/chat
   subscriptionStatus: varchar('subscription_status', { length: 20 }).notNull().default('active'), // 'active', 'canceled', 'past_due'
   stripeCustomerId: varchar('stripe_customer_id', { length: 255 }),
   stripeSubscriptionId: varchar('stripe_subscription_id', { length: 255 }),
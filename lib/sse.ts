@@ -0,0 +1,46 @@
+// Server-sent events over fetch bodies: used by /api/chat to read Grok's streamed completion and
+// send its own, and by the chat page to read that stream back.
+
+export function encodeEvent(event: string, data: unknown): string {
+  return `event: ${event}\ndata: ${JSON.stringify(data)}\n\n`
+}
+
+// Calls onEvent(event, data) for every event in the stream; unnamed events are 'message'.
+// Whatever onEvent throws rejects the returned promise and cancels the stream.
+export async function readEvents(
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: string, data: string) => void
+): Promise<void> {
+  const reader = body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  let event = 'message'
+  let data: string[] = []
+
+  const dispatch = (line: string) => {
+    if (line === '') {
+      if (data.length > 0) onEvent(event, data.join('\n'))
+      event = 'message'
+      data = []
+    } else if (line.startsWith('event:')) {
+      event = line.slice(6).trim()
+    } else if (line.startsWith('data:')) {
+      data.push(line.slice(line.startsWith('data: ') ? 6 : 5))
+    }
+  }
+
+  try {
+    while (true) {
+      const { done, value } = await reader.read()
+      buffer += decoder.decode(value, { stream: !done })
+      const lines = buffer.split(/\r?\n/)
+      buffer = done ? '' : lines.pop() || ''
+      lines.forEach(dispatch)
+      if (done) break
+    }
+    dispatch('')
+  } catch (error) {
+    reader.cancel().catch(() => {})
+    throw error
+  }
+}
@@ -1,6 +1,8 @@
 import { authMiddleware } from "@clerk/nextjs/server";
+import { NextFetchEvent, NextRequest, NextResponse } from "next/server";
+import { isLoadTestRequest } from "./lib/loadTest";
 
-export default authMiddleware({
+const clerk = authMiddleware({
   publicRoutes: [
     "/",
     "/about",
@@ -21,6 +23,11 @@ export default authMiddleware({
   ],
 });
 
+// Production builds export Clerk's middleware as is; elsewhere load-test requests skip it (see lib/loadTest.ts)
+export default process.env.NODE_ENV === "production"
+  ? clerk
+  : (request: NextRequest, event: NextFetchEvent) => (isLoadTestRequest(request) ? NextResponse.next() : clerk(request, event));
+
 export const config = {
   matcher: [
     "/((?!_next|favicon.ico|.*\\..*).)",
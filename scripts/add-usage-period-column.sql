@@ -0,0 +1,5 @@
+-- Add users.usage_period (see checkAndUpdateUsage in app/api/chat/route.ts) to an existing database.
+-- Run before `npm run db:push`: the backfill takes each row's month from updated_at, which is what the
+-- monthly reset used until now. Rows left NULL start over at their next message.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS usage_period DATE;
+UPDATE users SET usage_period = date_trunc('month', updated_at)::date WHERE usage_period IS NULL;
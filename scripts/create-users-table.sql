@@ -0,0 +1,26 @@
+-- Create users table if it doesn't exist (mirrors users in lib/schema.ts)
+CREATE TABLE IF NOT EXISTS users (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    clerk_id VARCHAR(255) NOT NULL UNIQUE,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    business_name VARCHAR(255),
+    business_type VARCHAR(100),
+    tier VARCHAR(20) NOT NULL DEFAULT 'free',
+    query_count INTEGER NOT NULL DEFAULT 0,
+    query_limit INTEGER NOT NULL DEFAULT 5,
+    usage_period DATE,
+    subscription_status VARCHAR(20) NOT NULL DEFAULT 'active',
+    stripe_customer_id VARCHAR(255),
+    stripe_subscription_id VARCHAR(255),
+    current_period_start TIMESTAMP,
+    current_period_end TIMESTAMP,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Create indexes for lookups by Clerk ID, email and tier
+CREATE INDEX IF NOT EXISTS idx_users_clerk_id ON users(clerk_id);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+CREATE INDEX IF NOT EXISTS idx_users_tier ON users(tier);
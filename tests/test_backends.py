@@ -0,0 +1,72 @@
+import tarfile
+
+import pytest
+
+from blog_pipeline.backends import ArchiveBackend, DiskBackend, MemoryBackend, write_if_changed
+from blog_pipeline.build import build_pages
+
+PAGE = "export const title = “Cash flow — explained”\n"
+
+
+def test_write_if_changed_is_utf8_and_skips_unchanged(tmp_path):
+    path = str(tmp_path / "page.tsx")
+    assert write_if_changed(path, PAGE)
+    assert (tmp_path / "page.tsx").read_bytes() == PAGE.encode("utf-8")
+    assert not write_if_changed(path, PAGE)
+
+
+def test_disk_backend_stages_until_commit(tmp_path):
+    backend = DiskBackend(str(tmp_path))
+    backend.prepare("a/page.tsx")
+    assert backend.stage("a/page.tsx", PAGE)
+    assert not backend.exists("a/page.tsx")
+    backend.commit()
+    assert (tmp_path / "a" / "page.tsx").read_text(encoding="utf-8") == PAGE
+    assert not backend.stage("a/page.tsx", PAGE)
+
+
+def test_memory_backend_abort_drops_staged():
+    backend = MemoryBackend()
+    backend.stage("a/page.tsx", PAGE)
+    backend.abort()
+    backend.commit()
+    assert backend.files == {}
+
+
+def test_archive_backend_writes_members_under_prefix(tmp_path):
+    import zipfile
+
+    path = str(tmp_path / "pages.zip")
+    with ArchiveBackend(path) as backend:
+        backend.stage("a/page.tsx", PAGE)
+        backend.commit()
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("app/blog/a/page.tsx").decode("utf-8") == PAGE
+
+
+def test_tar_archive_is_reproducible_and_abort_removes_it(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    paths = [str(tmp_path / "one.tar.gz"), str(tmp_path / "two.tar.gz")]
+    for path in paths:
+        with ArchiveBackend(path) as backend:
+            backend.stage("a/page.tsx", PAGE)
+    assert open(paths[0], "rb").read() == open(paths[1], "rb").read()
+    with tarfile.open(paths[0]) as archive:
+        assert archive.getnames() == ["app/blog/a/page.tsx"]
+
+    backend = ArchiveBackend(str(tmp_path / "failed.tar"))
+    backend.stage("a/page.tsx", PAGE)
+    backend.abort()
+    assert not (tmp_path / "failed.tar").exists()
+
+
+@pytest.mark.parametrize("make_backend", [lambda tmp_path: DiskBackend(str(tmp_path)), lambda tmp_path: MemoryBackend()])
+def test_pages_read_back_and_manifest_persist(tmp_path, make_backend):
+    backend = make_backend(tmp_path)
+    records = [{"slug": "b", "body": PAGE}, {"slug": "a", "body": "other"}]
+    build_pages("test", records, lambda record: record["body"], "v1", backend=backend, log=lambda *_: None)
+    assert backend.pages() == ["a", "b"]
+    assert backend.read("b/page.tsx") == PAGE
+    assert backend.read("c/page.tsx") is None
+    report = build_pages("test", records, lambda record: record["body"], "v1", backend=backend, log=lambda *_: None)
+    assert report.skipped == 2
@@ -0,0 +1,46 @@
+import json
+
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.blog_index import CARD_FIELDS, index_entries, sort_posts, write_blog_index
+from blog_pipeline.build import build_pages
+
+
+def card(slug, date, featured=False, icon="BookOpen"):
+    return {"slug": slug, "title": slug.title(), "excerpt": "", "date": date, "readTime": "5 min read",
+            "icon": icon, "category": "Guides", "featured": featured, "keywords": ["not", "a", "card", "field"]}
+
+
+def read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_posts_are_newest_first_then_by_slug():
+    posts = sort_posts([card("b", "2024-01-01"), card("c", "2024-02-01"), card("a", "2024-01-01")])
+    assert [post["slug"] for post in posts] == ["c", "a", "b"]
+
+
+def test_index_is_paginated_into_shards(tmp_path):
+    entries = [card(f"post-{i:02}", f"2024-01-{i + 1:02}", featured=i == 3, icon="Calculator" if i % 2 else "BookOpen")
+               for i in range(5)]
+    assert write_blog_index(entries, out_dir=str(tmp_path), page_size=2, log=lambda *_: None) == 3
+    assert read(tmp_path / "meta.json") == {"pageSize": 2, "totalPosts": 5, "totalPages": 3}
+    assert [post["slug"] for post in read(tmp_path / "page-1.json")] == ["post-04", "post-03"]
+    assert [post["slug"] for post in read(tmp_path / "page-3.json")] == ["post-00"]
+    assert set(read(tmp_path / "page-1.json")[0]) == set(CARD_FIELDS)
+    assert [post["slug"] for post in read(tmp_path / "featured.json")] == ["post-03"]
+    assert "{ BookOpen, Calculator }" in (tmp_path / "icons.ts").read_text(encoding="utf-8")
+
+    removed = []
+    assert write_blog_index(entries[:2], out_dir=str(tmp_path), page_size=2, log=removed.append) == 1
+    assert sorted(path.name for path in tmp_path.glob("page-*.json")) == ["page-1.json"]
+    assert any(message.startswith("Removed:") for message in removed)
+
+
+def test_generated_cards_come_from_the_manifest(tmp_path):
+    handwritten = tmp_path / "handwritten.jsonl"
+    handwritten.write_text(json.dumps(card("written", "2023-05-01")) + "\n", encoding="utf-8")
+    backend = MemoryBackend()
+    build_pages("test", [{"slug": "generated"}], lambda record: "page", "v1", backend=backend,
+                index_entry=lambda record: card(record["slug"], "2024-01-01"), log=lambda *_: None)
+    posts = sort_posts(index_entries(backend, handwritten=str(handwritten)))
+    assert [post["slug"] for post in posts] == ["generated", "written"]
@@ -0,0 +1,60 @@
+import os
+
+from blog_pipeline.backends import DiskBackend
+from blog_pipeline.build import build_pages
+from blog_pipeline.manifest import record_hash
+
+
+def build(out_dir, records, version="v1", generator="test", **options):
+    return build_pages(generator, records, lambda record: record["body"], version, out_dir=str(out_dir),
+                       log=lambda *_: None, **options)
+
+
+def test_unchanged_records_are_skipped(tmp_path):
+    records = [{"slug": "a", "body": "one"}, {"slug": "b", "body": "two"}]
+    assert build(tmp_path, records).rebuilt == ["a", "b"]
+    report = build(tmp_path, records)
+    assert report.rebuilt == [] and report.skipped == 2
+
+
+def test_changed_record_or_template_rebuilds(tmp_path):
+    build(tmp_path, [{"slug": "a", "body": "one"}, {"slug": "b", "body": "two"}])
+    assert build(tmp_path, [{"slug": "a", "body": "one"}, {"slug": "b", "body": "2"}]).rebuilt == ["b"]
+    assert (tmp_path / "b" / "page.tsx").read_text(encoding="utf-8") == "2"
+    assert build(tmp_path, [{"slug": "a", "body": "one"}, {"slug": "b", "body": "2"}], version="v2").rebuilt == ["a", "b"]
+
+
+def test_missing_page_and_force_rebuild(tmp_path):
+    records = [{"slug": "a", "body": "one"}]
+    build(tmp_path, records)
+    os.remove(tmp_path / "a" / "page.tsx")
+    assert build(tmp_path, records).rebuilt == ["a"]
+    assert build(tmp_path, records, force=True).rebuilt == ["a"]
+
+
+def test_unchanged_content_keeps_mtime(tmp_path):
+    build(tmp_path, [{"slug": "a", "body": "one"}])
+    page = tmp_path / "a" / "page.tsx"
+    os.utime(page, (0, 0))
+    build(tmp_path, [{"slug": "a", "body": "one"}], force=True)
+    assert page.stat().st_mtime == 0
+
+
+def test_orphans_are_reported_per_generator(tmp_path):
+    build(tmp_path, [{"slug": "a", "body": "one"}, {"slug": "b", "body": "two"}])
+    build(tmp_path, [{"slug": "c", "body": "three"}], generator="other")
+    report = build(tmp_path, [{"slug": "a", "body": "one"}])
+    assert report.orphaned == ["b"]
+    assert (tmp_path / "b" / "page.tsx").exists()
+
+    os.remove(tmp_path / "b" / "page.tsx")
+    assert build(tmp_path, [{"slug": "a", "body": "one"}]).orphaned == []
+    assert sorted(DiskBackend(str(tmp_path)).manifest().pages) == ["a", "c"]
+
+
+def test_manifest_records_hash_and_index_card(tmp_path):
+    record = {"slug": "a", "body": "one"}
+    build(tmp_path, [record], index_entry=lambda record: {"slug": record["slug"]})
+    entry = DiskBackend(str(tmp_path)).manifest().pages["a"]
+    assert entry == {"generator": "test", "record": record_hash(record), "template": "v1", "index": {"slug": "a"}}
+    assert record_hash({"body": "one", "slug": "a"}) == entry["record"]
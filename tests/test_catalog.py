@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from blog_pipeline import financial
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.build import build_pages
+from blog_pipeline.catalog import COMPREHENSIVE_CATALOG, FINANCIAL_CATALOG, DuplicateSlugError, iter_catalog
+
+
+def write_catalog(path, slugs):
+    path.write_text("".join(json.dumps({"slug": slug, "title": slug}) + "\n" for slug in slugs))
+    return str(path)
+
+
+def test_jsonl_catalog_streams_and_reports_bad_lines(tmp_path):
+    path = tmp_path / "topics.jsonl"
+    path.write_text('{"slug": "a"}\n\n{"slug": "b"}\n{"slug": \n', encoding="utf-8")
+    records = iter_catalog(str(path))
+    assert next(records) == {"slug": "a"}
+    assert next(records) == {"slug": "b"}
+    with pytest.raises(ValueError, match=r"topics.jsonl:4: "):
+        next(records)
+
+
+def test_unknown_catalog_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported catalog format"):
+        iter_catalog(str(tmp_path / "topics.yaml"))
+
+
+def test_checked_in_catalogs_load():
+    assert len(list(iter_catalog(FINANCIAL_CATALOG))) == 28
+    assert all({"slug", "title", "description", "keywords"} <= set(topic) for topic in iter_catalog(COMPREHENSIVE_CATALOG))
+
+
+def test_iter_catalog_rejects_duplicate_slugs(tmp_path):
+    path = write_catalog(tmp_path / "topics.jsonl", ["a", "b", "a"])
+    with pytest.raises(DuplicateSlugError, match="duplicate slug 'a'"):
+        list(iter_catalog(path))
+
+
+def test_build_pages_writes_nothing_on_duplicate_slug():
+    backend = MemoryBackend()
+    records = [{"slug": "a"}, {"slug": "b"}, {"slug": "a"}]
+    with pytest.raises(DuplicateSlugError):
+        build_pages("test", records, lambda record: record["slug"], "v1", backend=backend, log=lambda *_: None)
+    assert backend.files == {}
+
+
+def test_csv_catalog_is_typed_like_jsonl(tmp_path):
+    path = tmp_path / "topics.csv"
+    path.write_text(
+        "slug,title,description,keywords,category,excerpt,featured\n"
+        "equity,Equity,What equity is.,owner equity|retained earnings,Financial Fundamentals,,false\n"
+        "revenue,Revenue,Growing revenue.,revenue growth,Financial Fundamentals,Grow it.,TRUE\n",
+        encoding="utf-8")
+    equity, revenue = iter_catalog(str(path))
+    assert "excerpt" not in equity
+    assert equity["featured"] is False and revenue["featured"] is True
+    assert equity["keywords"] == ["owner equity", "retained earnings"]
+
+    entry = financial.index_entry(equity)
+    assert entry["excerpt"] == "What equity is."
+    assert entry["featured"] is False
+    assert financial.index_entry(revenue)["excerpt"] == "Grow it."
+
+
+def test_csv_catalog_rejects_unknown_flag(tmp_path):
+    path = tmp_path / "topics.csv"
+    path.write_text("slug,title,featured\nequity,Equity,maybe\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"topics.csv:2: featured must be true or false"):
+        list(iter_catalog(str(path)))
+
+
+def test_build_pages_discards_staged_pages_on_render_error(tmp_path):
+    def render(record):
+        return record["body"]
+
+    records = [{"slug": "a", "body": "first"}, {"slug": "b"}]
+    with pytest.raises(KeyError):
+        build_pages("test", records, render, "v1", out_dir=str(tmp_path), log=lambda *_: None)
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == []
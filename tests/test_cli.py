@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from blog_pipeline import comprehensive, financial
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.cli import run
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports every module with an audit hook that records file access other than loading Python code
+IMPORT_CHECK = """
+import sys
+touched = []
+
+def hook(event, args):
+    if event == "open" and args[0] and not str(args[0]).endswith((".py", ".pyc")):
+        touched.append(str(args[0]))
+    elif event in ("os.mkdir", "os.remove", "os.rename", "os.replace", "sqlite3.connect"):
+        touched.append(f"{event} {args[0]}")
+
+sys.addaudithook(hook)
+import blog_pipeline, generate_financial_blogs, generate_comprehensive_blogs
+from blog_pipeline import (backends, blog_index, build, catalog, cli, components, comprehensive, duplicates, financial,
+                           fragments, icons, intents, manifest, matcher, parallel, passages, planner, profiling,
+                           related, search_index, sitemap, template, tsx, validate)
+print("\\n".join(path for path in touched if not path.startswith(("/proc", "/dev", "/sys")) and "site-packages" not in path
+                 and not path.startswith(sys.base_prefix)))
+"""
+
+
+def test_importing_reads_and_writes_nothing():
+    out = subprocess.run([sys.executable, "-c", IMPORT_CHECK], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def scratch_args(tmp_path):
+    return ["--out", str(tmp_path / "blog"), "--components", str(tmp_path / "components"),
+            "--index", str(tmp_path / "index"), "--search", str(tmp_path / "search"),
+            "--passages", str(tmp_path / "data" / "passages.json"), "--public", str(tmp_path / "public")]
+
+
+def test_run_keeps_every_output_in_the_given_directories(tmp_path, capsys):
+    report = run(financial, scratch_args(tmp_path), backend=MemoryBackend())
+    assert len(report.rebuilt) == 28
+    assert not (tmp_path / "blog").exists()
+    written = {path.relative_to(tmp_path).parts[0] for path in tmp_path.rglob("*") if path.is_file()}
+    assert written == {"components", "index", "search", "data", "public"}
+    assert "Fragment cache" not in capsys.readouterr().out
+
+
+def test_run_on_disk_then_skips_unchanged_pages(tmp_path, capsys):
+    run(comprehensive, scratch_args(tmp_path))
+    assert "Fragment cache:" in capsys.readouterr().out
+    report = run(comprehensive, scratch_args(tmp_path))
+    assert report.rebuilt == [] and report.skipped == 19
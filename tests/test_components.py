@@ -0,0 +1,36 @@
+import os
+import re
+
+import pytest
+
+from blog_pipeline import comprehensive, financial
+from blog_pipeline.catalog import iter_catalog
+from blog_pipeline.components import COMPONENTS_DIR, emit_components
+
+IMPORT = re.compile(r"from '(?:@/components/blog|\.)/(\w+)'")
+
+
+@pytest.mark.parametrize("generator", [financial, comprehensive])
+def test_emitted_components_match_the_checked_in_ones(tmp_path, generator):
+    created = []
+    emit_components(generator.COMPONENTS, generator.component_values(), out_dir=str(tmp_path), log=created.append)
+    assert len(created) == len(generator.COMPONENTS)
+    for name in generator.COMPONENTS:
+        with open(os.path.join(COMPONENTS_DIR, name), encoding="utf-8") as f:
+            assert (tmp_path / name).read_text(encoding="utf-8") == f.read()
+
+    created = []
+    emit_components(generator.COMPONENTS, generator.component_values(), out_dir=str(tmp_path), log=created.append)
+    assert created == []
+
+
+@pytest.mark.parametrize("generator", [financial, comprehensive])
+def test_pages_only_import_emitted_components(generator):
+    emitted = {os.path.splitext(name)[0] for name in generator.COMPONENTS}
+    topic = dict(next(iter_catalog(generator.CATALOG)), related=[])
+    page = generator.render_page(topic)
+    imported = set(IMPORT.findall(page))
+    assert imported and imported <= emitted
+    for name in generator.COMPONENTS:
+        with open(os.path.join(COMPONENTS_DIR, name), encoding="utf-8") as f:
+            assert set(IMPORT.findall(f.read())) <= emitted
@@ -0,0 +1,39 @@
+import os
+
+from blog_pipeline.build import BLOG_DIR
+from blog_pipeline.components import COMPONENTS_DIR
+from blog_pipeline.duplicates import (SIGNATURE_SIZE, THRESHOLD, ComponentText, find_clusters, page_text, shingles,
+                                      signature, similarity)
+
+
+def test_chained_pages_do_not_merge():
+    # b is 0.84 similar to both a and c, but a and c only 0.69 to each other
+    a = list(range(SIGNATURE_SIZE))
+    b = [-i if i < 20 else i for i in a]
+    c = [-i if 20 <= i < 40 else i for i in b]
+    clusters = find_clusters({"a": a, "b": b, "c": c})
+    assert len(clusters) == 1
+    members, low = clusters[0]
+    assert members in (["a", "b"], ["b", "c"])
+    assert low >= 0.8
+
+
+def generated_text(slug, components):
+    with open(os.path.join(BLOG_DIR, slug, "page.tsx"), encoding="utf-8") as f:
+        return page_text(f.read(), components)
+
+
+def test_generated_pages_share_their_component_text():
+    components = ComponentText(COMPONENTS_DIR)
+    first = generated_text("accounts-payable-best-practices-managing-what-you-owe", components)
+    second = generated_text("accounts-receivable-streamline-collections-cash-flow", components)
+    shared = components["FinancialConceptArticle"]
+    assert shared and shared in first and shared in second
+    assert similarity(signature(shingles(first)), signature(shingles(second))) >= THRESHOLD
+
+
+def test_oversized_buckets_are_skipped():
+    signatures = {f"page-{i}": list(range(SIGNATURE_SIZE)) for i in range(5)}
+    messages = []
+    assert find_clusters(signatures, max_bucket=4, log=messages.append) == []
+    assert messages and "more than 4 pages" in messages[0]
@@ -0,0 +1,56 @@
+import pytest
+
+from blog_pipeline import comprehensive
+from blog_pipeline.catalog import iter_catalog
+from blog_pipeline.fragments import FragmentCache
+
+
+def changed(value):
+    if callable(value):
+        def helper(*args, **kwargs):
+            return "changed"
+        return helper
+    return dict(value, read_time="99") if isinstance(value, dict) else value + "changed"
+
+
+@pytest.mark.parametrize("generator, name", [
+    (comprehensive, "category_fields"),
+    (comprehensive, "ts_fields"),
+    (comprehensive, "ts_block"),
+])
+def test_changed_helper_invalidates_saved_fragments(tmp_path, monkeypatch, generator, name):
+    path = str(tmp_path / "fragments.json")
+    cache = FragmentCache()
+    cache.load(path, generator.template_version())
+    cache.get(("family", "key"), lambda: "fragment")
+    cache.save()
+
+    reloaded = FragmentCache()
+    reloaded.load(path, generator.template_version())
+    assert reloaded.get(("family", "key"), lambda: "fresh") == "fragment"
+
+    monkeypatch.setattr(generator, name, changed(getattr(generator, name)))
+    reloaded = FragmentCache()
+    reloaded.load(path, generator.template_version())
+    assert reloaded.get(("family", "key"), lambda: "fresh") == "fresh"
+
+
+def test_least_recently_used_fragment_is_evicted():
+    cache = FragmentCache(maxsize=2)
+    cache.get(("category", "a"), lambda: "A")
+    cache.get(("category", "b"), lambda: "B")
+    assert cache.get(("category", "a"), lambda: "fresh") == "A"
+    cache.get(("category", "c"), lambda: "C")
+    assert cache.get(("category", "b"), lambda: "fresh") == "fresh"
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 4, 2)
+    assert cache.hit_rate() == 0.2
+
+
+def test_comprehensive_pages_reuse_their_category_fragment(monkeypatch):
+    monkeypatch.setattr(comprehensive, "FRAGMENTS", FragmentCache())
+    topics = list(iter_catalog(comprehensive.CATALOG))
+    for topic in topics:
+        comprehensive.render_page(dict(topic, related=[]))
+    categories = {topic["category"] for topic in topics}
+    assert comprehensive.FRAGMENTS.misses == len(categories)
+    assert comprehensive.FRAGMENTS.hits == len(topics) - len(categories) > 0
@@ -0,0 +1,48 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmarks.grok_stub import StubConfig, latency, start_in_thread
+
+
+def post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers.get("Content-Type"), response.read().decode("utf-8")
+
+
+def test_streams_server_sent_events_ending_in_done():
+    config = StubConfig(tokens=5, first_token_ms=0, token_ms=0, seed=1)
+    content_type, body = post(start_in_thread(config), {"model": "grok-3", "stream": True})
+    assert content_type == "text/event-stream"
+    events = [line[len("data: "):] for line in body.split("\n\n") if line]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    assert len(chunks) == 5 and chunks[0]["model"] == "grok-3"
+    assert "".join(chunk["choices"][0]["delta"]["content"] for chunk in chunks) == "".join(config.words())
+
+
+def test_answers_one_completion_without_stream():
+    config = StubConfig(tokens=3, first_token_ms=0, token_ms=0)
+    _, body = post(start_in_thread(config), {"messages": []})
+    assert json.loads(body)["choices"][0]["message"]["content"] == "".join(config.words())
+    assert config.outcomes == {"ok": 1}
+
+
+def test_injected_errors_use_the_given_statuses():
+    config = StubConfig(tokens=3, first_token_ms=0, token_ms=0, error_rate=1.0, error_statuses=[503])
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(start_in_thread(config), {"stream": True})
+    assert error.value.code == 503
+
+
+def test_latency_specs():
+    assert latency("250")() == 250.0
+    assert 10 <= latency("uniform:10:20")() <= 20
+    assert latency("normal:0:0")() == 0.0
+    for spec in ("uniform:10", "lognormal:0:1", "gamma:1:2", "fast"):
+        with pytest.raises(ValueError, match="not a latency distribution"):
+            latency(spec)
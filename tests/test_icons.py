@@ -0,0 +1,43 @@
+from blog_pipeline import comprehensive, financial
+from blog_pipeline.catalog import iter_catalog
+from blog_pipeline.icons import icon_report, icon_usage, prune_icon_imports, source_files
+from blog_pipeline.validate import validate_page
+
+PAGE = """import { Clock, Calendar, Clock, Target as Goal } from 'lucide-react'
+import {
+  ArrowLeft,
+  BookOpen,
+} from 'lucide-react'
+import { Unused } from 'lucide-react'
+
+export default function Page() {
+  return <div><Clock /><Goal /><BookOpen /></div>
+}
+"""
+
+
+def test_usage_counts_aliases_and_duplicates():
+    imported, used, icons = icon_usage(PAGE)
+    assert imported == ["Clock", "Calendar", "Clock", "Goal", "ArrowLeft", "BookOpen", "Unused"]
+    assert used == {"Clock", "Goal", "BookOpen"}
+    assert icons["Goal"] == "Target"
+
+
+def test_prune_keeps_only_used_icons():
+    pruned = prune_icon_imports(PAGE)
+    assert pruned.startswith("import { Clock, Target as Goal } from 'lucide-react'\n"
+                             "import {\n  BookOpen\n} from 'lucide-react'\n\nexport default")
+    assert prune_icon_imports(pruned) == pruned
+    assert validate_page(pruned) == []
+
+
+def test_generated_pages_import_exactly_what_they_render():
+    # A financial page passes its one icon to the shared component; comprehensive pages render none of their own
+    for generator, expected in ((financial, ["ArticleIcon"]), (comprehensive, [])):
+        for topic in iter_catalog(generator.CATALOG):
+            imported, used, _ = icon_usage(generator.render_page(dict(topic, related=[])))
+            assert imported == expected and used == set(expected)
+
+
+def test_tree_has_no_unused_icon_imports():
+    assert icon_report(source_files())["unused"] == 0
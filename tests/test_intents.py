@@ -0,0 +1,50 @@
+import json
+import random
+
+import pytest
+
+from blog_pipeline.intents import (TABLE_PATH, IntentCatalogError, compile_intents, exact_key, is_default, load_intents,
+                                   route, write_table)
+
+
+def linear_route(intents, message):
+    """The first intent by priority whose exact message or keyword matches: the old includes() chain"""
+    lowered = message.lower()
+    for index, intent in enumerate(intents):
+        if exact_key(message) in {exact_key(text) for text in intent.get("exact", ())}:
+            return index
+        if any(keyword.lower() in lowered for keyword in intent.get("keywords", ())):
+            return index
+    return next(index for index, intent in enumerate(intents) if is_default(intent))
+
+
+def test_table_routes_like_the_linear_chain():
+    intents = load_intents()
+    table = compile_intents(intents)
+    keywords = [keyword for intent in intents for keyword in intent.get("keywords", ())]
+    exact = [message for intent in intents for message in intent.get("exact", ())]
+    rng = random.Random(3)
+    messages = [f"How do I {keyword} for {other}?" for keyword, other in zip(keywords, reversed(keywords))]
+    messages += [f" {message.upper()}!! " for message in exact] + ["", "tell me a joke"]
+    messages += [" ".join(rng.sample(keywords, 3)) for _ in range(200)]
+    for message in messages:
+        assert route(table, message) == linear_route(intents, message), message
+
+
+def test_checked_in_table_is_up_to_date(tmp_path):
+    path = str(tmp_path / "chat-intents.json")
+    write_table(compile_intents(load_intents()), path)
+    with open(path, encoding="utf-8") as compiled, open(TABLE_PATH, encoding="utf-8") as checked_in:
+        assert json.load(compiled) == json.load(checked_in)
+
+
+@pytest.mark.parametrize("intents, error", [
+    ([{"name": "a", "priority": 1, "keywords": ["x"]}, {"name": "a", "priority": 2}], "unique"),
+    ([{"name": "a", "priority": "high"}], "integer priority"),
+    ([{"name": "a", "priority": 1}, {"name": "b", "priority": 2, "keywords": [" "]}], "exactly one intent"),
+])
+def test_catalog_mistakes_are_rejected(tmp_path, intents, error):
+    path = tmp_path / "intents.json"
+    path.write_text(json.dumps({"intents": intents}), encoding="utf-8")
+    with pytest.raises(IntentCatalogError, match=error):
+        load_intents(str(path))
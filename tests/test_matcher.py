@@ -0,0 +1,40 @@
+import random
+
+from blog_pipeline import financial
+from blog_pipeline.catalog import FINANCIAL_CATALOG, iter_catalog
+from blog_pipeline.matcher import SlugMatcher
+
+
+def brute_force(keys, text):
+    """Longest key occurring in text, leftmost on ties: what the matcher must agree with"""
+    found = [(-len(key), text.find(key), key) for key in keys if key in text]
+    return min(found)[2] if found else None
+
+
+def test_longest_then_leftmost_key_wins():
+    matcher = SlugMatcher(["cash", "cash-flow", "flow", "budget", "bud"])
+    assert matcher.match("cash-flow-forecasting") == "cash-flow"
+    assert matcher.match("budget-vs-cash") == "budget"
+    assert matcher.match("flow-and-cash") == "flow"
+    assert matcher.match("payroll") is None
+    assert len(matcher) == 5
+
+
+def test_keys_inside_other_keys_are_found_through_failure_links():
+    matcher = SlugMatcher(["abcd", "bc", "bcx"])
+    assert matcher.match("abcx") == "bcx"
+    assert matcher.match("zabcz") == "bc"
+
+
+def test_matches_brute_force_on_random_slugs():
+    rng = random.Random(7)
+    keys = ["".join(rng.choice("ab-") for _ in range(rng.randint(1, 5))) for _ in range(40)]
+    matcher = SlugMatcher(keys)
+    for _ in range(500):
+        text = "".join(rng.choice("ab-c") for _ in range(rng.randint(0, 20)))
+        assert matcher.match(text) == brute_force(keys, text)
+
+
+def test_content_map_lookup_for_every_catalog_slug():
+    for topic in iter_catalog(FINANCIAL_CATALOG):
+        assert financial.content_matcher().match(topic["slug"]) == brute_force(financial.CONTENT_MAP, topic["slug"])
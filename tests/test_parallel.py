@@ -0,0 +1,30 @@
+from itertools import islice
+
+from blog_pipeline import financial
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.build import build_pages
+from blog_pipeline.catalog import FINANCIAL_CATALOG, iter_catalog
+from blog_pipeline.parallel import chunked, render_all
+
+
+def test_chunked_keeps_order_and_remainder():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+
+def test_pool_yields_in_catalog_order():
+    records = list(islice(iter_catalog(FINANCIAL_CATALOG), 12))
+    serial = list(render_all(financial.render_page, records))
+    pooled = list(render_all(financial.render_page, iter(records), workers=2, chunk_size=5))
+    assert [record["slug"] for record, _ in pooled] == [record["slug"] for record in records]
+    assert pooled == serial
+
+
+def test_parallel_build_writes_the_same_pages():
+    records = list(iter_catalog(FINANCIAL_CATALOG))
+    serial, pooled = MemoryBackend(), MemoryBackend()
+    build_pages("financial", records, financial.render_page, "v1", backend=serial, log=lambda *_: None)
+    report = build_pages("financial", records, financial.render_page, "v1", backend=pooled, workers=2, chunk_size=4,
+                         validate=True, log=lambda *_: None)
+    assert report.rebuilt == [record["slug"] for record in records]
+    assert pooled.files == serial.files
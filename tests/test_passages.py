@@ -0,0 +1,42 @@
+import json
+import os
+
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.build import BLOG_DIR
+from blog_pipeline.passages import PassageIndex, page_passages, update_passages
+
+
+def read_page(slug):
+    with open(os.path.join(BLOG_DIR, slug, "page.tsx"), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_hand_written_page_skips_header_chrome():
+    title, passages = page_passages(read_page("5-bookkeeping-mistakes-small-business-owners"))
+    assert title.startswith("5 Bookkeeping Mistakes")
+    bodies = " ".join(body for _, body in passages)
+    assert "Back to Blog" not in bodies
+    assert "min read" not in bodies
+    heading, body = passages[0]
+    assert heading.startswith("5 Bookkeeping Mistakes Small Business Owners Make")
+    assert body.startswith("These common bookkeeping mistakes are costing small business owners")
+
+
+def test_index_is_incremental_and_searchable(tmp_path):
+    backend = MemoryBackend()
+    for slug in ("5-bookkeeping-mistakes-small-business-owners", "accounts-payable-best-practices-managing-what-you-owe"):
+        backend.write(f"{slug}/page.tsx", read_page(slug))
+    export = tmp_path / "passages.json"
+    assert update_passages(backend, str(export), log=lambda *_: None) == (2, 0)
+    assert update_passages(backend, str(export), log=lambda *_: None) == (0, 0)
+
+    del backend.files["5-bookkeeping-mistakes-small-business-owners/page.tsx"]
+    assert update_passages(backend, str(export), log=lambda *_: None) == (0, 1)
+    with PassageIndex(str(tmp_path / "passages.sqlite")) as index:
+        slug, title, _, _, _ = index.search("vendor payment terms")[0]
+        assert slug == "accounts-payable-best-practices-managing-what-you-owe"
+        assert index.search("the of and") == []
+
+    data = json.loads(export.read_text(encoding="utf-8"))
+    assert {passage[0] for passage in data["passages"]} == {slug}
+    assert "vendor" in data["terms"]
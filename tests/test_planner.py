@@ -0,0 +1,37 @@
+import json
+
+from blog_pipeline.build import build_pages
+from blog_pipeline.planner import plan_directories
+
+
+def test_plan_creates_missing_and_reports_leftovers(tmp_path):
+    handwritten = tmp_path / "handwritten.jsonl"
+    handwritten.write_text(json.dumps({"slug": "written"}) + "\n", encoding="utf-8")
+    blog = tmp_path / "blog"
+    build_pages("other", [{"slug": "generated"}], lambda record: "page", "v1", out_dir=str(blog), log=lambda *_: None)
+    for name in ("kept", "empty", "stray", "written", "[slug]", "page"):
+        (blog / name).mkdir()
+    for name in ("kept", "stray", "written", "[slug]"):
+        (blog / name / "page.tsx").write_text("page", encoding="utf-8")
+    (blog / "empty" / "nested").mkdir()
+
+    plan = plan_directories(str(blog), ["kept", "new-b", "new-a"], handwritten=str(handwritten))
+    assert plan.missing == ["new-a", "new-b"]
+    assert plan.empty == ["empty"]
+    assert plan.orphaned == ["stray"]
+    assert str(plan).startswith("2 directories created, 1 empty, 1 orphaned")
+
+    messages = []
+    plan.execute(log=messages.append)
+    assert (blog / "new-a").is_dir() and (blog / "new-b").is_dir()
+    assert (blog / "stray" / "page.tsx").exists() and (blog / "empty").is_dir()
+    assert messages == [f"Created 2 directories under {blog}"]
+    assert plan_directories(str(blog), ["kept", "new-b", "new-a"], handwritten=str(handwritten)).missing == []
+
+
+def test_plan_for_a_new_output_directory(tmp_path):
+    handwritten = tmp_path / "handwritten.jsonl"
+    handwritten.write_text("", encoding="utf-8")
+    plan = plan_directories(str(tmp_path / "blog"), ["a"], handwritten=str(handwritten))
+    plan.execute(log=lambda *_: None)
+    assert (tmp_path / "blog" / "a").is_dir()
@@ -0,0 +1,25 @@
+import pytest
+
+from blog_pipeline.profiling import Profiler, percentile
+
+
+@pytest.mark.parametrize("values, fraction, expected", [
+    ([1, 2], 0.5, 1),
+    ([1, 2, 3, 4], 0.5, 2),
+    (list(range(1, 101)), 0.95, 95),
+    (list(range(1, 21)), 0.95, 19),
+    ([7], 0.95, 7),
+    ([], 0.5, 0.0),
+])
+def test_percentile_is_nearest_rank(values, fraction, expected):
+    assert percentile(values, fraction) == expected
+
+
+def test_summary_orders_stages_and_counts_samples():
+    profiler = Profiler()
+    for nanoseconds in (1_000_000, 3_000_000):
+        profiler.add("write", nanoseconds)
+    profiler.add("render", 2_000_000)
+    summary = profiler.summary()
+    assert list(summary) == ["render", "write"]
+    assert summary["write"] == {"count": 2, "total_s": 0.004, "p50_ms": 1.0, "p95_ms": 3.0, "max_ms": 3.0}
@@ -0,0 +1,53 @@
+from collections import Counter
+
+import pytest
+
+from blog_pipeline import comprehensive, financial
+from blog_pipeline.catalog import iter_catalog
+from blog_pipeline.related import cosine, related_posts, tfidf_vectors, topic_text
+from blog_pipeline.search_index import tokenize
+
+
+def catalog_entries(generator):
+    return [generator.index_entry(topic) for topic in iter_catalog(generator.CATALOG)]
+
+
+def exact_related(entries, k=4):
+    """Top k by cosine over every pair, ties by slug: what the inverted index must reproduce"""
+    vectors = tfidf_vectors([Counter(tokenize(topic_text(entry))) for entry in entries])
+    related = {}
+    for row, entry in enumerate(entries):
+        scores = [(-cosine(vectors[row], vectors[other]), entries[other]["slug"])
+                  for other in range(len(entries)) if other != row]
+        related[entry["slug"]] = [slug for _, slug in sorted(scores)[:k]]
+    return related
+
+
+@pytest.mark.parametrize("generator", [financial, comprehensive])
+def test_ranking_matches_brute_force_cosine(generator):
+    entries = catalog_entries(generator)
+    related = related_posts(entries, log=lambda *_: None)
+    exact = exact_related(entries)
+    for slug, neighbours in related.items():
+        assert [neighbour for neighbour, _ in neighbours] == exact[slug]
+        assert slug not in exact[slug]
+
+
+def test_cached_lists_follow_an_edited_topic(tmp_path):
+    cache_file = str(tmp_path / "related.json")
+    entries = catalog_entries(comprehensive)
+    related_posts(entries, cache_file=cache_file, log=lambda *_: None)
+
+    edited = [dict(entry) for entry in entries]
+    edited[0]["title"] = edited[-1]["title"]
+    edited[0]["keywords"] = edited[-1]["keywords"]
+    messages = []
+    cached = related_posts(edited, cache_file=cache_file, log=messages.append)
+    assert messages and not messages[0].startswith(f"Related articles: {len(entries)} of")
+    # Unchanged topics keep scores from the old idf (see blog_pipeline.related), so only the edited one is compared
+    assert cached[edited[0]["slug"]] == related_posts(edited, force=True, log=lambda *_: None)[edited[0]["slug"]]
+    assert cached[edited[-1]["slug"]][0][0] == edited[0]["slug"]
+
+    messages = []
+    assert related_posts(edited, cache_file=cache_file, log=messages.append) == cached
+    assert messages == []
@@ -0,0 +1,61 @@
+import json
+import os
+import re
+
+from blog_pipeline.search_index import (INDEX_NAME, STOPWORDS, build_postings, build_search_files, shards_for_prefix,
+                                        tokenize, write_search_index)
+
+POSTS = [
+    {"slug": "cash-flow", "title": "Cash flow basics", "excerpt": "Why cash matters", "keywords": ["cashflow"],
+     "headings": ["Forecasting"], "category": "Guides"},
+    {"slug": "payroll", "title": "Payroll for your first employee", "excerpt": "Cash for wages",
+     "keywords": ["payroll taxes"], "headings": ["Withholding"], "category": "Guides"},
+]
+
+
+def lookup(files, prefix):
+    """Doc ids of terms starting with prefix, read the way lib/blogSearch.ts reads the shards"""
+    term_index = json.loads(files[INDEX_NAME])["terms"]
+    ids = set()
+    for position in shards_for_prefix(term_index, prefix):
+        shard = json.loads(files[term_index[position][1]])
+        for term, postings in zip(shard["terms"], shard["postings"]):
+            if term.startswith(prefix):
+                doc_id = 0
+                for delta in postings[::2]:
+                    doc_id += delta
+                    ids.add(doc_id)
+    return ids
+
+
+def test_tokenize_matches_the_browser():
+    with open(os.path.join(os.path.dirname(__file__), os.pardir, "lib", "blogSearch.ts"), encoding="utf-8") as f:
+        browser = re.search(r"const STOPWORDS = new Set\(\s*'([^']*)'", f.read()).group(1)
+    assert set(browser.split(" ")) == STOPWORDS
+    assert tokenize("How to track Cash-Flow in 2024?") == ["track", "cash", "flow", "2024"]
+
+
+def test_term_weight_is_the_best_field():
+    postings = build_postings(POSTS)
+    assert postings["cash"] == [(0, 6), (1, 2)]
+    assert postings["payroll"] == [(1, 6)]
+    assert postings["guides"] == [(0, 1), (1, 1)]
+
+
+def test_prefix_lookup_reads_the_right_shards():
+    posts = [dict(POSTS[i % 2], slug=f"post-{i}", title=f"{POSTS[i % 2]['title']} term{i:03}") for i in range(300)]
+    files = build_search_files(posts, shard_bytes=400, doc_shard_size=64)
+    index = json.loads(files[INDEX_NAME])
+    assert len(index["terms"]) > 5 and len(index["docs"]) == 5
+    postings = build_postings(posts)
+    for prefix in ("ca", "term", "term01", "term299", "pay", "zzz", "a"):
+        expected = {doc_id for term, pairs in postings.items() if term.startswith(prefix) for doc_id, _ in pairs}
+        assert lookup(files, prefix) == expected
+
+
+def test_shards_are_content_addressed_and_stale_ones_removed(tmp_path):
+    first = write_search_index(POSTS, out_dir=str(tmp_path), log=lambda *_: None)
+    assert write_search_index(POSTS, out_dir=str(tmp_path), log=lambda *_: None) == first
+    second = write_search_index(POSTS[:1], out_dir=str(tmp_path), log=lambda *_: None)
+    assert sorted(os.listdir(tmp_path)) == sorted(second)
+    assert set(first) & set(second) == {INDEX_NAME}
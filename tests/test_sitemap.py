@@ -0,0 +1,76 @@
+import gzip
+import os
+
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.sitemap import (PUBLIC_DIR, SITE_URL, STATIC_ROUTES, LastmodHistory, shard_urls, sitemap_urls,
+                                   write_sitemaps)
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def lastmods(app_dir, history_path, today):
+    history = LastmodHistory(str(history_path), today=today)
+    entries = [{"slug": "generated"}, {"slug": "handwritten"}]
+    dates = {loc.rsplit("/", 1)[-1]: lastmod for loc, lastmod, _, _ in sitemap_urls(entries, history, app_dir=app_dir)}
+    history.save()
+    return dates
+
+
+def test_lastmod_follows_imported_components(tmp_path):
+    app_dir = str(tmp_path / "app")
+    history_path = tmp_path / "history.json"
+    write(tmp_path / "app" / "blog" / "generated" / "page.tsx",
+          "import Article from '@/components/blog/Article'\nexport default function Page() { return <Article /> }\n")
+    write(tmp_path / "app" / "blog" / "handwritten" / "page.tsx", "export default function Page() { return <p /> }\n")
+    write(tmp_path / "components" / "blog" / "Article.tsx", "import Header from './Header'\n")
+    write(tmp_path / "components" / "blog" / "Header.tsx", "export default function Header() { return <h1 /> }\n")
+
+    assert lastmods(app_dir, history_path, "2026-01-01")["generated"] == "2026-01-01"
+    write(tmp_path / "components" / "blog" / "Header.tsx", "export default function Header() { return <h2 /> }\n")
+    dates = lastmods(app_dir, history_path, "2026-02-01")
+    assert dates["generated"] == "2026-02-01"
+    assert dates["handwritten"] == "2026-01-01"
+
+
+def test_static_routes_are_not_disallowed_by_robots_txt():
+    with open(os.path.join(PUBLIC_DIR, "robots.txt"), encoding="utf-8") as f:
+        disallowed = [line.split(":", 1)[1].strip() for line in f if line.startswith("Disallow:")]
+    for url_path, _, _ in STATIC_ROUTES:
+        assert not any(url_path.rstrip("/") + "/" == prefix or url_path.startswith(prefix) for prefix in disallowed)
+
+
+def test_sitemap_is_sharded_with_gzipped_twins(tmp_path):
+    public_dir = tmp_path / "public"
+    backend = MemoryBackend()
+    entries = [{"slug": f"post-{i}"} for i in range(12)]
+    for entry in entries:
+        backend.write(f"{entry['slug']}/page.tsx", entry["slug"])
+    options = dict(public_dir=str(public_dir), backend=backend, history_path=str(tmp_path / "history.json"),
+                   log=lambda *_: None)
+    shards = write_sitemaps(entries, max_urls=5, **options)
+    assert shards == -(-(len(STATIC_ROUTES) + len(entries)) // 5)
+
+    index = (public_dir / "sitemap.xml").read_text(encoding="utf-8")
+    assert index.count("<sitemap>") == shards
+    assert f"<loc>{SITE_URL}/sitemaps/sitemap-{shards}.xml.gz</loc>" in index
+    for path in (public_dir / "sitemaps").glob("*.xml"):
+        assert path.read_text(encoding="utf-8").count("<url>") <= 5
+        assert gzip.decompress((public_dir / "sitemaps" / f"{path.name}.gz").read_bytes()) == path.read_bytes()
+
+    gz = (public_dir / "sitemap.xml.gz").read_bytes()
+    assert write_sitemaps(entries, max_urls=50000, **options) == 1
+    assert sorted(path.name for path in (public_dir / "sitemaps").iterdir()) == ["sitemap-1.xml", "sitemap-1.xml.gz"]
+    write_sitemaps(entries, max_urls=5, **options)
+    assert (public_dir / "sitemap.xml.gz").read_bytes() == gz
+
+
+def test_shards_respect_the_byte_limit():
+    urls = [(f"{SITE_URL}/blog/post-{i}", "2024-01-01", "monthly", "0.6") for i in range(10)]
+    bodies = list(shard_urls(urls, max_bytes=600))
+    assert len(bodies) > 1
+    assert all(len(body.encode("utf-8")) <= 600 for body, _ in bodies)
+    assert sum(body.count("<url>") for body, _ in bodies) == 10
+    assert all(latest == "2024-01-01" for _, latest in bodies)
@@ -0,0 +1,24 @@
+import pytest
+
+from benchmarks.suite import regressions, run_case
+
+
+@pytest.mark.parametrize("backend", ["disk", "memory"])
+def test_case_runs_every_command_line_stage_in_its_scratch_dir(tmp_path, backend):
+    metrics = run_case("comprehensive", 6, str(tmp_path), backend)
+    assert metrics["pages"] == 6
+    assert {"components", "related", "render", "index", "search", "sitemap", "passages"} <= set(metrics["stages_s"])
+    assert metrics["output_bytes"] > 0
+    for written in ("components", "blog-index/meta.json", "search/index.json", "public/sitemap.xml",
+                    "data/chat-passages.json"):
+        assert (tmp_path / written).exists()
+    assert (tmp_path / "blog").exists() == (backend == "disk")
+
+
+def test_regressions_respect_direction_and_threshold():
+    baseline = {"financial:100": {"pages_per_sec": 1000, "peak_rss_mb": 50, "output_bytes": 100}}
+    faster = {"financial:100": {"pages_per_sec": 1200, "peak_rss_mb": 54, "output_bytes": 100}}
+    assert list(regressions(faster, baseline, 0.10)) == []
+    slower = {"financial:100": {"pages_per_sec": 800, "peak_rss_mb": 60, "output_bytes": 100},
+              "financial:200": {"pages_per_sec": 1, "peak_rss_mb": 1, "output_bytes": 1}}
+    assert [line.split(":")[1] for line in regressions(slower, baseline, 0.10)] == ["100 pages_per_sec", "100 peak_rss_mb"]
@@ -0,0 +1,38 @@
+import json
+
+from blog_pipeline.template import compile_template, load_template
+from blog_pipeline.tsx import ts_block, ts_fields, ts_literal
+
+
+def test_compile_splits_static_parts_and_slots():
+    template = compile_template("<h1>{{ title }}</h1>{{body}}!")
+    assert template.parts == ["<h1>", None, "</h1>", None, "!"]
+    assert template.slots == [(1, "title"), (3, "body")]
+    assert template.names == {"title", "body"}
+    assert template.render({"title": "Cash", "body": "<p />"}) == "<h1>Cash</h1><p />!"
+
+
+def test_repeated_slot_and_literal_braces():
+    template = compile_template("{{ a }}-{{ a }} { b } {{ 1x }}")
+    assert template.render({"a": "x"}) == "x-x { b } {{ 1x }}"
+
+
+def test_load_reuses_disk_cache_until_source_changes(tmp_path):
+    template_dir, cache_dir = tmp_path / "templates", tmp_path / "cache"
+    template_dir.mkdir()
+    (template_dir / "page.tmpl").write_text("Hello {{ name }}", encoding="utf-8")
+    first = load_template("page.tmpl", str(template_dir), str(cache_dir))
+    cached, = cache_dir.iterdir()
+    assert json.loads(cached.read_text(encoding="utf-8"))["parts"] == ["Hello ", None]
+
+    (template_dir / "page.tmpl").write_text("Bye {{ name }}", encoding="utf-8")
+    second = load_template("page.tmpl", str(template_dir), str(cache_dir))
+    assert second.version != first.version
+    assert second.render({"name": "Ann"}) == "Bye Ann"
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_ts_helpers_escape_values():
+    assert ts_literal('Say "hi"\\') == '"Say \\"hi\\"\\\\"'
+    assert ts_literal("Café") == '"Café"'
+    assert ts_block(ts_fields({"a": 1}), ts_fields({"b": ["x"]})) == '{\n  a: 1,\n  b: ["x"],\n}'
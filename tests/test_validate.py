@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from blog_pipeline.backends import MemoryBackend
+from blog_pipeline.build import BLOG_DIR, build_pages
+from blog_pipeline.validate import PageValidationError, validate_page
+
+PAGE = """import { Metadata } from 'next'
+import { Clock } from 'lucide-react'
+
+export const metadata: Metadata = { title: 'Cash flow' }
+
+export default function CashFlowPage() {
+  return (
+    <article className="prose">
+      <h1>Cash flow</h1>
+      <p>Don't guess: {items.map((item) => <span key={item}>{item}</span>)}</p>
+      <Clock className="h-4 w-4" />
+    </article>
+  )
+}
+"""
+
+
+def test_valid_page_passes():
+    assert validate_page(PAGE) == []
+
+
+@pytest.mark.parametrize("old, new, error", [
+    ("title: 'Cash flow'", "title: 'Owner's draw'", "string"),
+    ("<h1>Cash flow</h1>", "<h1>Cash flow</h2>", "h1"),
+    ("{ title: 'Cash flow' }", "{ title: 'Cash flow' ", "unclosed"),
+    ("CashFlowPage", "5CashFlowPage", "not a valid identifier"),
+    ("CashFlowPage", "cashFlowPage", "uppercase"),
+    ("import { Clock }", "import { Clock, Clock }", "imported more than once"),
+    ("import { Clock }", "import { Clock, Calendar }", "Calendar is imported but never used"),
+    ('<Clock className="h-4 w-4" />', '<Clock className="h-4 w-4" /><Target />', "<Target> is rendered but never"),
+    ("export default function CashFlowPage()", "function CashFlowPage()", "no `export default function`"),
+])
+def test_broken_page_is_rejected(old, new, error):
+    assert old in PAGE
+    errors = validate_page(PAGE.replace(old, new))
+    assert any(error in message for message in errors), errors
+
+
+def test_every_checked_in_page_passes():
+    for slug in sorted(os.listdir(BLOG_DIR)):
+        path = os.path.join(BLOG_DIR, slug, "page.tsx")
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                assert validate_page(f.read()) == [], slug
+
+
+def test_build_writes_nothing_when_a_page_fails():
+    backend = MemoryBackend()
+    records = [{"slug": "good", "body": PAGE}, {"slug": "bad", "body": PAGE.replace("CashFlowPage", "5Page")}]
+    with pytest.raises(PageValidationError, match=r"1 page\(s\) failed validation:\n  bad: component name"):
+        build_pages("test", records, lambda record: record["body"], "v1", backend=backend, validate=True,
+                    log=lambda *_: None)
+    assert backend.files == {}